@@ -10,13 +10,18 @@ __version__ = "0.1.0"
 __author__ = "Drive Pilot Team"
 
 from .core.simulator import CarPortSimulator
+from .core.clock import Clock, RealTimeClock, VirtualClock
 from .core.events import Event, EventBus
-from .core.models import VehicleState, SensorData
+from .core.models import VehicleState, VehicleSnapshot, SensorData
 
 __all__ = [
     "CarPortSimulator",
+    "Clock",
+    "RealTimeClock",
+    "VirtualClock",
     "Event",
     "EventBus",
     "VehicleState",
+    "VehicleSnapshot",
     "SensorData",
 ]
@@ -2,15 +2,38 @@
 Core simulator initialization file.
 """
 
-from .simulator import CarPortSimulator
-from .events import Event, EventBus
-from .models import VehicleState, SensorData, DriverState, ObstacleData, AlertData
+from .simulator import CarPortSimulator, SimulatorSnapshot
+from .async_simulator import AsyncCarPortSimulator
+from .clock import Clock, RealTimeClock, VirtualClock
+from .discrete_event import DiscreteEventEngine
+from .host import SimulationHost
+from .sweep import ScenarioSweep, SweepResult
+from .events import Event, EventBus, EventStream
+from .alerts import AlertLog
+from .codec import EventCodec
+from .commands import Command, CommandQueue
+from .models import VehicleState, VehicleSnapshot, SensorData, DriverState, ObstacleData, AlertData
 
 __all__ = [
     "CarPortSimulator",
+    "AsyncCarPortSimulator",
+    "SimulatorSnapshot",
+    "Clock",
+    "RealTimeClock",
+    "VirtualClock",
+    "DiscreteEventEngine",
+    "SimulationHost",
+    "ScenarioSweep",
+    "SweepResult",
     "Event",
     "EventBus",
+    "EventStream",
+    "AlertLog",
+    "EventCodec",
+    "Command",
+    "CommandQueue",
     "VehicleState",
+    "VehicleSnapshot",
     "SensorData",
     "DriverState",
     "ObstacleData",
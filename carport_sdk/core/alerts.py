@@ -0,0 +1,146 @@
+"""
+Sequence-numbered alert log with incremental reads.
+"""
+
+from threading import Condition
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .models import AlertData
+
+AlertPredicate = Callable[[AlertData], bool]
+
+
+class AlertLog:
+    """
+    Append-only log of alerts, each numbered with a sequence number.
+
+    Readers keep a cursor, the sequence number of the last alert they have
+    seen (0 for none), and ``alerts_since(cursor)`` returns only the alerts
+    after it. Sequence numbers keep increasing when alerts are cleared or a
+    snapshot is restored, so cursors stay valid.
+    """
+
+    def __init__(self):
+        self._cond = Condition()
+        self._alerts: List[AlertData] = []
+        self._base = 0  # sequence number just before the first retained alert
+        self._waiters = 0
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest alert (0 if none was ever added)."""
+        return self._base + len(self._alerts)
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def append(self, alert: AlertData) -> int:
+        """Add an alert and return its sequence number."""
+        with self._cond:
+            self._alerts.append(alert)
+            if self._waiters:
+                self._cond.notify_all()
+            return self._base + len(self._alerts)
+
+    def alerts_since(self, cursor: int = 0) -> Tuple[List[AlertData], int]:
+        """
+        Get the alerts added after a cursor.
+
+        Alerts cleared before they were read are skipped.
+
+        Args:
+            cursor: Sequence number of the last alert already seen
+
+        Returns:
+            (alerts, cursor): New alerts in order, and the cursor to pass next
+        """
+        with self._cond:
+            start = max(0, cursor - self._base)
+            return self._alerts[start:], self._base + len(self._alerts)
+
+    def get_all(self, clear: bool = False) -> List[AlertData]:
+        """Get every retained alert, optionally clearing them in the same step."""
+        with self._cond:
+            alerts = self._alerts
+            if clear:
+                self._base += len(alerts)
+                self._alerts = []
+                return alerts
+            return alerts.copy()
+
+    def clear(self):
+        """Drop every retained alert; sequence numbers continue from the last one."""
+        self.get_all(clear=True)
+
+    def wait_for_alert(
+        self,
+        predicate: Optional[AlertPredicate] = None,
+        timeout: Optional[float] = None,
+        cursor: int = 0,
+    ) -> Optional[AlertData]:
+        """
+        Block until an alert after ``cursor`` matches a predicate.
+
+        Alerts already in the log count, so an alert raised just before the
+        call is not missed.
+
+        Args:
+            predicate: Condition the alert must meet (default: any alert)
+            timeout: Maximum wait in wall-clock seconds (None waits indefinitely)
+            cursor: Only consider alerts after this sequence number
+
+        Returns:
+            The first matching alert, or None on timeout
+        """
+        found: List[AlertData] = []
+
+        def match() -> bool:
+            nonlocal cursor
+            start = max(0, cursor - self._base)
+            for alert in self._alerts[start:]:
+                if predicate is None or predicate(alert):
+                    found.append(alert)
+                    return True
+            cursor = self._base + len(self._alerts)
+            return False
+
+        with self._cond:
+            self._waiters += 1
+            try:
+                self._cond.wait_for(match, timeout)
+            finally:
+                self._waiters -= 1
+        return found[0] if found else None
+
+    def follow(self, cursor: int = 0, timeout: Optional[float] = None) -> Iterator[AlertData]:
+        """
+        Iterate over alerts as they are added, blocking between them.
+
+        Args:
+            cursor: Start after this sequence number (0 includes retained alerts)
+            timeout: Stop once no alert arrived for this many wall-clock
+                seconds (None follows forever)
+        """
+        while True:
+            with self._cond:
+                self._waiters += 1
+                try:
+                    arrived = self._cond.wait_for(lambda: self.last_seq > cursor, timeout)
+                finally:
+                    self._waiters -= 1
+            if not arrived:
+                return
+            alerts, cursor = self.alerts_since(cursor)
+            yield from alerts
+
+    def restore(self, alerts: Sequence[AlertData]):
+        """
+        Replace the retained alerts, e.g. when restoring a snapshot.
+
+        The restored alerts are numbered just before any alert added
+        afterwards, so existing cursors are not moved backwards.
+        """
+        with self._cond:
+            last_seq = max(self.last_seq, len(alerts))
+            self._alerts = list(alerts)
+            self._base = last_seq - len(alerts)
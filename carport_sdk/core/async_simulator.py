@@ -0,0 +1,97 @@
+"""
+asyncio-native variant of the CarPort simulator.
+"""
+
+import asyncio
+from typing import Optional
+
+from .events import Event
+from .simulator import CarPortSimulator
+
+
+class AsyncCarPortSimulator(CarPortSimulator):
+    """
+    CarPort simulator whose tick loop is a coroutine.
+
+    Runs on the caller's event loop instead of a dedicated thread, so many
+    simulators can share one loop. Combine with ``EventBus.stream()`` to
+    receive alerts without polling.
+
+    Usage:
+        simulator = AsyncCarPortSimulator()
+        await simulator.start()
+        async with simulator.event_bus.stream("alert") as alerts:
+            async for event in alerts:
+                ...
+        await simulator.stop()
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._simulation_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the simulation loop as a task on the running event loop."""
+        if self._running:
+            return
+
+        self._running = True
+        self._stop_event.clear()
+        self._simulation_task = asyncio.get_running_loop().create_task(
+            self._async_simulation_loop()
+        )
+
+        # Publish simulation start event
+        self.event_bus.publish(Event("simulation_started", source="CarPortSimulator"))
+
+    async def stop(self):
+        """Stop the simulation loop and wait for it to finish."""
+        if not self._running:
+            return
+
+        self._running = False
+        self._stop_event.set()
+
+        if self._simulation_task:
+            self._simulation_task.cancel()
+            try:
+                await self._simulation_task
+            except asyncio.CancelledError:
+                pass
+            self._simulation_task = None
+
+        # Publish simulation stop event
+        self.event_bus.publish(Event("simulation_stopped", source="CarPortSimulator"))
+
+    async def run_for(self, sim_seconds: float):
+        """
+        Advance the simulation by a span of simulated time.
+
+        Yields to the event loop after every tick so other coroutines, such as
+        stream consumers, keep running.
+        """
+        if self._running:
+            raise RuntimeError("Cannot step a simulation that is running its own loop")
+
+        tick_period = self.tick_period
+        for _ in range(int(round(sim_seconds / tick_period))):
+            await self._sleep(tick_period)
+            self._update_simulation()
+
+    async def _async_simulation_loop(self):
+        """Main simulation loop running as a coroutine."""
+        self._scheduler.reset()
+
+        while self._running:
+            # Wait for the next absolute tick deadline
+            await self._sleep(self._scheduler.time_until_next())
+
+            self._run_due_ticks()
+
+    async def _sleep(self, seconds: float):
+        """Wait on the simulation clock without blocking the event loop."""
+        if self.clock.is_virtual:
+            self.clock.sleep(seconds)
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(seconds)
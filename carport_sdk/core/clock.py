@@ -0,0 +1,93 @@
+"""
+Simulation clocks for the CarPort SDK.
+
+All simulation components read time through a clock instead of calling
+``time.time()`` directly, so a scenario can run either against the wall clock
+or against a virtual clock that advances as fast as the CPU allows.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from threading import Event as ThreadEvent
+from typing import Optional
+
+
+class Clock(ABC):
+    """Base clock interface used by all simulation components."""
+
+    @abstractmethod
+    def now(self) -> float:
+        """Return the current simulation time in seconds."""
+
+    @abstractmethod
+    def sleep(self, seconds: float, interrupt: Optional[ThreadEvent] = None):
+        """
+        Wait for the given amount of simulation time.
+
+        Args:
+            seconds: Duration to wait in seconds
+            interrupt: Optional thread event that ends the wait early when set
+        """
+
+    @property
+    def is_virtual(self) -> bool:
+        """Whether this clock runs independently of wall-clock time."""
+        return False
+
+
+class RealTimeClock(Clock):
+    """Clock backed by the system wall clock."""
+
+    def now(self) -> float:
+        """Return the current wall-clock time in seconds."""
+        return time.time()
+
+    def sleep(self, seconds: float, interrupt: Optional[ThreadEvent] = None):
+        """Block the calling thread for the given duration."""
+        if seconds <= 0:
+            return
+        if interrupt is not None:
+            interrupt.wait(seconds)
+        else:
+            time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    Manually advanced clock for faster-than-real-time simulation.
+
+    Sleeping on a virtual clock advances simulated time immediately,
+    so scenarios spanning minutes of simulated time finish in milliseconds.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self._now = float(start)
+
+    def now(self) -> float:
+        """Return the current simulated time in seconds."""
+        return self._now
+
+    def sleep(self, seconds: float, interrupt: Optional[ThreadEvent] = None):
+        """Advance simulated time instead of blocking."""
+        if seconds > 0:
+            self._now += seconds
+
+    def advance(self, seconds: float):
+        """Advance simulated time by the given duration."""
+        if seconds < 0:
+            raise ValueError("Cannot advance a clock backwards")
+        self._now += seconds
+
+    def advance_to(self, timestamp: float):
+        """Advance simulated time to an absolute timestamp."""
+        if timestamp < self._now:
+            raise ValueError("Cannot advance a clock backwards")
+        self._now = float(timestamp)
+
+    def reset(self, timestamp: float):
+        """Set simulated time to any value, e.g. when restoring a snapshot."""
+        self._now = float(timestamp)
+
+    @property
+    def is_virtual(self) -> bool:
+        return True
@@ -0,0 +1,515 @@
+"""
+Compact binary codec for events and the core data models.
+
+Values are written as a one-byte tag followed by a fixed ``struct`` layout.
+AlertData, ObstacleData, DriverState, VehicleState, VehicleSnapshot and
+SensorData have dedicated layouts; other payloads are encoded structurally
+(None, bool, int, float, str, bytes, list, tuple, dict). Any other value is
+rejected with a TypeError unless the codec is created with
+``allow_pickle=True``; decoding pickled values runs arbitrary code, so only
+enable it for trusted streams.
+
+Repeated identifiers (event types, sources, alert types, severities,
+components, object types, gaze directions and dict keys) are written through
+a string table: the first occurrence carries the string, later ones only its
+2-byte code. Tables are built incrementally, so a stream must be decoded in
+the order it was encoded, by one codec per stream. Timestamps are written as
+Unix epoch nanoseconds, so decoded events can be compared across processes.
+"""
+
+import pickle
+import struct
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .events import Event
+from .models import (
+    AlertData,
+    DriverState,
+    ObstacleData,
+    SensorData,
+    VehicleSnapshot,
+    VehicleState,
+    epoch_to_monotonic_ns,
+    monotonic_to_epoch_ns,
+)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Value tags
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _SYMBOL, _BYTES = range(8)
+_LIST, _TUPLE, _DICT, _PICKLE = range(8, 12)
+_ALERT, _OBSTACLE, _DRIVER, _VEHICLE_STATE, _VEHICLE_SNAPSHOT, _SENSOR = range(16, 22)
+
+# String table codes with a special meaning
+_NONE_CODE = 0xFFFF
+_INLINE_CODE = 0xFFFE  # table full, string follows inline
+MAX_STRINGS = 0xFFFE
+
+# Timestamp written for a missing timestamp_ns
+_NO_TIME = -(2**63)
+
+_TAG = struct.Struct("<B")
+_LEN = struct.Struct("<I")
+_CODE = struct.Struct("<H")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_TAGGED_INT = struct.Struct("<Bq")
+_TAGGED_FLOAT = struct.Struct("<Bd")
+_TAGGED_LEN = struct.Struct("<BI")
+
+_OBSTACLE_FIELDS = struct.Struct("<ddddq")  # distance, bearing, velocity, confidence, time
+_DRIVER_FIELDS = struct.Struct("<d?dq")  # attention, eyes_closed, time_away, time
+_VEHICLE_STATE_FIELDS = struct.Struct("<dddd?q")  # speed, lat, lon, heading, stationary, time
+_VEHICLE_SNAPSHOT_FIELDS = struct.Struct("<dddd?dq")  # ... stationary, sim_time, time
+
+
+def _to_wire_time(timestamp_ns: Optional[int]) -> int:
+    return _NO_TIME if timestamp_ns is None else monotonic_to_epoch_ns(timestamp_ns)
+
+
+def _from_wire_time(epoch_ns: int) -> Optional[int]:
+    return None if epoch_ns == _NO_TIME else epoch_to_monotonic_ns(epoch_ns)
+
+
+class EventCodec:
+    """
+    Encodes events and model payloads into compact binary records.
+
+    Encoding and decoding keep separate string tables, so one codec can
+    write a stream and another (or the same one) can read it back, as long as
+    records are decoded in the order they were encoded.
+
+    Usage:
+        codec = EventCodec()
+        buffer = codec.encode_events(bus.get_event_history())
+
+        events, _ = EventCodec().decode_events(buffer)
+
+    Args:
+        allow_pickle: Encode unsupported values with pickle, and decode
+            pickled values (only for streams from a trusted source)
+    """
+
+    def __init__(self, allow_pickle: bool = False):
+        self.allow_pickle = allow_pickle
+        self._codes: Dict[str, int] = {}
+        self._strings: List[str] = []
+        self._encoders: Dict[type, Callable[[bytearray, Any], None]] = {
+            type(None): self._put_none,
+            bool: self._put_bool,
+            int: self._put_int,
+            float: self._put_float,
+            str: self._put_str,
+            bytes: self._put_bytes,
+            list: self._put_list,
+            tuple: self._put_tuple,
+            dict: self._put_dict,
+            AlertData: self._put_alert,
+            ObstacleData: self._put_obstacle,
+            DriverState: self._put_driver,
+            VehicleState: self._put_vehicle_state,
+            VehicleSnapshot: self._put_vehicle_snapshot,
+            SensorData: self._put_sensor,
+        }
+        self._decoders: Dict[int, Callable[[memoryview, int], Tuple[Any, int]]] = {
+            _NONE: lambda buf, pos: (None, pos),
+            _FALSE: lambda buf, pos: (False, pos),
+            _TRUE: lambda buf, pos: (True, pos),
+            _INT: self._get_int,
+            _FLOAT: self._get_float,
+            _STR: self._get_str,
+            _SYMBOL: self._get_symbol,
+            _BYTES: self._get_bytes,
+            _LIST: self._get_list,
+            _TUPLE: self._get_tuple,
+            _DICT: self._get_dict,
+            _PICKLE: self._get_pickle,
+            _ALERT: self._get_alert,
+            _OBSTACLE: self._get_obstacle,
+            _DRIVER: self._get_driver,
+            _VEHICLE_STATE: self._get_vehicle_state,
+            _VEHICLE_SNAPSHOT: self._get_vehicle_snapshot,
+            _SENSOR: self._get_sensor,
+        }
+
+    def reset(self):
+        """Forget both string tables, e.g. before starting a new stream."""
+        self._codes = {}
+        self._strings = []
+
+    def encode(self, value: Any, out: Optional[bytearray] = None) -> bytearray:
+        """
+        Encode a single value.
+
+        Args:
+            value: Model or plain value to encode
+            out: Buffer to append to (default: a new bytearray)
+
+        Returns:
+            The buffer the value was appended to
+        """
+        return self._encode(self._put_value, value, out)
+
+    def decode(self, data: Buffer, offset: int = 0) -> Tuple[Any, int]:
+        """
+        Decode a value written by ``encode()``.
+
+        Returns:
+            (value, offset): The value and the offset just past it
+        """
+        return self._get_value(memoryview(data), offset)
+
+    def encode_event(self, event: Event, out: Optional[bytearray] = None) -> bytearray:
+        """Encode an event, appending it to ``out`` if given."""
+        return self._encode(self._put_event, event, out)
+
+    def decode_event(self, data: Buffer, offset: int = 0) -> Tuple[Event, int]:
+        """
+        Decode an event written by ``encode_event()``.
+
+        Returns:
+            (event, offset): The event and the offset just past it
+        """
+        return self._get_event(memoryview(data), offset)
+
+    def encode_events(self, events: Iterable[Event], out: Optional[bytearray] = None) -> bytearray:
+        """Encode a batch of events as a count followed by the events."""
+        events = events if isinstance(events, (list, tuple)) else list(events)
+        return self._encode(self._put_events, events, out)
+
+    def decode_events(self, data: Buffer, offset: int = 0) -> Tuple[List[Event], int]:
+        """
+        Decode a batch written by ``encode_events()``.
+
+        Returns:
+            (events, offset): The events and the offset just past the batch
+        """
+        buf = memoryview(data)
+        (count,) = _LEN.unpack_from(buf, offset)
+        offset += _LEN.size
+        events = []
+        get_event = self._get_event
+        for _ in range(count):
+            event, offset = get_event(buf, offset)
+            events.append(event)
+        return events, offset
+
+    def _encode(self, put: Callable[[bytearray, Any], None], value: Any, out: Optional[bytearray]):
+        """Run an encoder, undoing partial output and table entries if it fails."""
+        if out is None:
+            out = bytearray()
+        start = len(out)
+        known = len(self._codes)
+        try:
+            put(out, value)
+        except Exception:
+            del out[start:]
+            if len(self._codes) > known:
+                self._codes = dict(list(self._codes.items())[:known])
+            raise
+        return out
+
+    # Encoding
+
+    def _put_events(self, out: bytearray, events: List[Event]):
+        out += _LEN.pack(len(events))
+        put_event = self._put_event
+        for event in events:
+            put_event(out, event)
+
+    def _put_event(self, out: bytearray, event: Event):
+        self._put_symbol(out, event.event_type)
+        self._put_symbol(out, event.source)
+        out += _INT64.pack(_to_wire_time(event.timestamp_ns))
+        self._put_value(out, event.data)
+
+    def _put_value(self, out: bytearray, value: Any):
+        encoder = self._encoders.get(type(value))
+        if encoder is not None:
+            encoder(out, value)
+        elif isinstance(value, bool):
+            self._put_bool(out, value)
+        elif isinstance(value, int):
+            self._put_int(out, int(value))
+        elif isinstance(value, float):
+            self._put_float(out, float(value))
+        else:
+            self._put_pickle(out, value)
+
+    def _put_symbol(self, out: bytearray, value: Optional[str]):
+        """Write a string through the string table."""
+        if value is None:
+            out += _CODE.pack(_NONE_CODE)
+            return
+        code = self._codes.get(value)
+        if code is not None:
+            out += _CODE.pack(code)
+            return
+        if type(value) is not str:
+            raise TypeError(f"Expected a string, got {type(value).__name__}")
+        if len(self._codes) < MAX_STRINGS:
+            code = self._codes[value] = len(self._codes)
+            out += _CODE.pack(code)
+        else:
+            out += _CODE.pack(_INLINE_CODE)
+        encoded = value.encode("utf-8")
+        out += _LEN.pack(len(encoded))
+        out += encoded
+
+    def _put_none(self, out: bytearray, value: None):
+        out.append(_NONE)
+
+    def _put_bool(self, out: bytearray, value: bool):
+        out.append(_TRUE if value else _FALSE)
+
+    def _put_int(self, out: bytearray, value: int):
+        try:
+            out += _TAGGED_INT.pack(_INT, value)
+        except struct.error:
+            self._put_pickle(out, value)
+
+    def _put_float(self, out: bytearray, value: float):
+        out += _TAGGED_FLOAT.pack(_FLOAT, value)
+
+    def _put_str(self, out: bytearray, value: str):
+        encoded = value.encode("utf-8")
+        out += _TAGGED_LEN.pack(_STR, len(encoded))
+        out += encoded
+
+    def _put_bytes(self, out: bytearray, value: bytes):
+        out += _TAGGED_LEN.pack(_BYTES, len(value))
+        out += value
+
+    def _put_list(self, out: bytearray, value: list, tag: int = _LIST):
+        out += _TAGGED_LEN.pack(tag, len(value))
+        put_value = self._put_value
+        for item in value:
+            put_value(out, item)
+
+    def _put_tuple(self, out: bytearray, value: tuple):
+        self._put_list(out, value, _TUPLE)
+
+    def _put_dict(self, out: bytearray, value: dict):
+        out += _TAGGED_LEN.pack(_DICT, len(value))
+        put_value = self._put_value
+        for key, item in value.items():
+            if type(key) is str:
+                # Keys repeat from event to event, so they go through the table
+                out.append(_SYMBOL)
+                self._put_symbol(out, key)
+            else:
+                put_value(out, key)
+            put_value(out, item)
+
+    def _put_pickle(self, out: bytearray, value: Any):
+        if not self.allow_pickle:
+            raise TypeError(
+                f"Cannot encode {type(value).__name__} values without allow_pickle=True"
+            )
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        out += _TAGGED_LEN.pack(_PICKLE, len(payload))
+        out += payload
+
+    def _put_alert(self, out: bytearray, alert: AlertData):
+        out.append(_ALERT)
+        self._put_symbol(out, alert.alert_type)
+        self._put_symbol(out, alert.severity)
+        self._put_symbol(out, alert.source_component)
+        encoded = (alert.message or "").encode("utf-8")
+        out += _LEN.pack(len(encoded))
+        out += encoded
+        out += _INT64.pack(_to_wire_time(alert.timestamp_ns))
+
+    def _put_obstacle(self, out: bytearray, obstacle: ObstacleData):
+        out.append(_OBSTACLE)
+        self._put_symbol(out, obstacle.object_type)
+        out += _OBSTACLE_FIELDS.pack(
+            obstacle.distance,
+            obstacle.bearing,
+            obstacle.velocity,
+            obstacle.confidence,
+            _to_wire_time(obstacle.timestamp_ns),
+        )
+
+    def _put_driver(self, out: bytearray, driver: DriverState):
+        out.append(_DRIVER)
+        self._put_symbol(out, driver.gaze_direction)
+        out += _DRIVER_FIELDS.pack(
+            driver.attention_level,
+            driver.eyes_closed,
+            driver.time_looking_away,
+            _to_wire_time(driver.timestamp_ns),
+        )
+
+    def _put_vehicle_state(self, out: bytearray, state: VehicleState):
+        position = state.position
+        out.append(_VEHICLE_STATE)
+        out += _VEHICLE_STATE_FIELDS.pack(
+            state.speed,
+            position["lat"],
+            position["lon"],
+            state.heading,
+            state.is_stationary,
+            _to_wire_time(state.timestamp_ns),
+        )
+
+    def _put_vehicle_snapshot(self, out: bytearray, snapshot: VehicleSnapshot):
+        out.append(_VEHICLE_SNAPSHOT)
+        out += _VEHICLE_SNAPSHOT_FIELDS.pack(
+            snapshot.speed,
+            snapshot.lat,
+            snapshot.lon,
+            snapshot.heading,
+            snapshot.is_stationary,
+            snapshot.sim_time,
+            _to_wire_time(snapshot.timestamp_ns),
+        )
+
+    def _put_sensor(self, out: bytearray, sensor: SensorData):
+        out.append(_SENSOR)
+        self._put_symbol(out, sensor.sensor_type)
+        out += _INT64.pack(_to_wire_time(sensor.timestamp_ns))
+        self._put_value(out, sensor.data)
+
+    # Decoding
+
+    def _get_event(self, buf: memoryview, pos: int) -> Tuple[Event, int]:
+        event_type, pos = self._get_symbol(buf, pos)
+        source, pos = self._get_symbol(buf, pos)
+        (epoch_ns,) = _INT64.unpack_from(buf, pos)
+        data, pos = self._get_value(buf, pos + _INT64.size)
+        return Event(event_type, data, source=source, timestamp_ns=_from_wire_time(epoch_ns)), pos
+
+    def _get_value(self, buf: memoryview, pos: int) -> Tuple[Any, int]:
+        tag = buf[pos]
+        decoder = self._decoders.get(tag)
+        if decoder is None:
+            raise ValueError(f"Unknown value tag {tag} at offset {pos}")
+        return decoder(buf, pos + 1)
+
+    def _get_symbol(self, buf: memoryview, pos: int) -> Tuple[Optional[str], int]:
+        (code,) = _CODE.unpack_from(buf, pos)
+        pos += _CODE.size
+        if code < len(self._strings):
+            return self._strings[code], pos
+        if code == _NONE_CODE:
+            return None, pos
+        value, pos = self._get_str(buf, pos)
+        if code != _INLINE_CODE:
+            if code != len(self._strings):
+                raise ValueError(f"String code {code} is out of order; decode records in order")
+            self._strings.append(value)
+        return value, pos
+
+    def _get_int(self, buf: memoryview, pos: int) -> Tuple[int, int]:
+        return _INT64.unpack_from(buf, pos)[0], pos + _INT64.size
+
+    def _get_float(self, buf: memoryview, pos: int) -> Tuple[float, int]:
+        return _FLOAT64.unpack_from(buf, pos)[0], pos + _FLOAT64.size
+
+    def _get_str(self, buf: memoryview, pos: int) -> Tuple[str, int]:
+        (length,) = _LEN.unpack_from(buf, pos)
+        start = pos + _LEN.size
+        return str(buf[start : start + length], "utf-8"), start + length
+
+    def _get_bytes(self, buf: memoryview, pos: int) -> Tuple[bytes, int]:
+        (length,) = _LEN.unpack_from(buf, pos)
+        start = pos + _LEN.size
+        return bytes(buf[start : start + length]), start + length
+
+    def _get_list(self, buf: memoryview, pos: int) -> Tuple[list, int]:
+        (count,) = _LEN.unpack_from(buf, pos)
+        pos += _LEN.size
+        items = []
+        get_value = self._get_value
+        for _ in range(count):
+            item, pos = get_value(buf, pos)
+            items.append(item)
+        return items, pos
+
+    def _get_tuple(self, buf: memoryview, pos: int) -> Tuple[tuple, int]:
+        items, pos = self._get_list(buf, pos)
+        return tuple(items), pos
+
+    def _get_dict(self, buf: memoryview, pos: int) -> Tuple[dict, int]:
+        (count,) = _LEN.unpack_from(buf, pos)
+        pos += _LEN.size
+        items = {}
+        get_value = self._get_value
+        for _ in range(count):
+            key, pos = get_value(buf, pos)
+            items[key], pos = get_value(buf, pos)
+        return items, pos
+
+    def _get_pickle(self, buf: memoryview, pos: int) -> Tuple[Any, int]:
+        if not self.allow_pickle:
+            raise ValueError(f"Pickled value at offset {pos - 1} requires allow_pickle=True")
+        (length,) = _LEN.unpack_from(buf, pos)
+        start = pos + _LEN.size
+        return pickle.loads(buf[start : start + length]), start + length
+
+    def _get_alert(self, buf: memoryview, pos: int) -> Tuple[AlertData, int]:
+        alert_type, pos = self._get_symbol(buf, pos)
+        severity, pos = self._get_symbol(buf, pos)
+        source_component, pos = self._get_symbol(buf, pos)
+        message, pos = self._get_str(buf, pos)
+        (epoch_ns,) = _INT64.unpack_from(buf, pos)
+        alert = AlertData(
+            alert_type=alert_type,
+            severity=severity,
+            message=message,
+            source_component=source_component,
+            timestamp_ns=_from_wire_time(epoch_ns),
+        )
+        return alert, pos + _INT64.size
+
+    def _get_obstacle(self, buf: memoryview, pos: int) -> Tuple[ObstacleData, int]:
+        object_type, pos = self._get_symbol(buf, pos)
+        distance, bearing, velocity, confidence, epoch_ns = _OBSTACLE_FIELDS.unpack_from(buf, pos)
+        obstacle = ObstacleData(
+            object_type=object_type,
+            distance=distance,
+            bearing=bearing,
+            velocity=velocity,
+            confidence=confidence,
+            timestamp_ns=_from_wire_time(epoch_ns),
+        )
+        return obstacle, pos + _OBSTACLE_FIELDS.size
+
+    def _get_driver(self, buf: memoryview, pos: int) -> Tuple[DriverState, int]:
+        gaze_direction, pos = self._get_symbol(buf, pos)
+        attention_level, eyes_closed, time_looking_away, epoch_ns = _DRIVER_FIELDS.unpack_from(
+            buf, pos
+        )
+        driver = DriverState(
+            gaze_direction=gaze_direction,
+            attention_level=attention_level,
+            eyes_closed=eyes_closed,
+            time_looking_away=time_looking_away,
+            timestamp_ns=_from_wire_time(epoch_ns),
+        )
+        return driver, pos + _DRIVER_FIELDS.size
+
+    def _get_vehicle_state(self, buf: memoryview, pos: int) -> Tuple[VehicleState, int]:
+        speed, lat, lon, heading, is_stationary, epoch_ns = _VEHICLE_STATE_FIELDS.unpack_from(
+            buf, pos
+        )
+        state = VehicleState(
+            speed=speed,
+            position={"lat": lat, "lon": lon},
+            heading=heading,
+            is_stationary=is_stationary,
+            timestamp_ns=_from_wire_time(epoch_ns),
+        )
+        return state, pos + _VEHICLE_STATE_FIELDS.size
+
+    def _get_vehicle_snapshot(self, buf: memoryview, pos: int) -> Tuple[VehicleSnapshot, int]:
+        fields = _VEHICLE_SNAPSHOT_FIELDS.unpack_from(buf, pos)
+        snapshot = VehicleSnapshot(*fields[:-1], _from_wire_time(fields[-1]))
+        return snapshot, pos + _VEHICLE_SNAPSHOT_FIELDS.size
+
+    def _get_sensor(self, buf: memoryview, pos: int) -> Tuple[SensorData, int]:
+        sensor_type, pos = self._get_symbol(buf, pos)
+        (epoch_ns,) = _INT64.unpack_from(buf, pos)
+        data, pos = self._get_value(buf, pos + _INT64.size)
+        return SensorData(sensor_type, data, timestamp_ns=_from_wire_time(epoch_ns)), pos
@@ -0,0 +1,189 @@
+"""
+Command queue that applies API calls at tick boundaries.
+
+Calling ``set_vehicle_speed()`` or ``driver_monitoring.simulate_gaze_away()``
+directly from another thread changes state while the simulation thread may
+be halfway through a tick. Submitting the call as a command instead stages
+it; the simulator applies every pending command, in submission order, at the
+start of its next tick, so a tick always sees a consistent state and a run
+is reproducible from its command sequence.
+"""
+
+import itertools
+from collections import deque
+from threading import Condition, Lock
+from typing import Any, Deque, Dict, NamedTuple, Optional
+
+
+class Command(NamedTuple):
+    """One staged API call."""
+
+    seq: int  # submission sequence number, starting at 1
+    target: str  # simulator attribute, "" for the simulator itself
+    method: str
+    args: tuple
+    kwargs: dict
+
+
+class CommandQueue:
+    """
+    Stages API calls on a simulator and applies them in batches.
+
+    Submitting takes a short lock so sequence numbers match queue order; the
+    simulation thread only pops from the queue and takes no lock unless a
+    batch was applied while someone waits in ``wait()``.
+
+    Args:
+        simulator: Simulator whose methods the commands call
+    """
+
+    def __init__(self, simulator):
+        self.simulator = simulator
+        self._queue: Deque[Command] = deque()
+        self._submit_lock = Lock()
+        self._applied_cond = Condition(Lock())
+        self._waiters = 0
+        self._seq = itertools.count(1)
+        self.submitted = 0
+        self.applied_seq = 0
+        self.applied = 0
+        self.batches = 0
+        self.max_batch = 0
+        self.errors = 0
+
+    def submit(self, target: str, method: str, *args, **kwargs) -> int:
+        """
+        Stage a call to be applied at the start of the next tick.
+
+        Args:
+            target: Simulator attribute such as "driver_monitoring", or "" for
+                the simulator itself
+            method: Name of the method to call
+
+        Returns:
+            Sequence number of the command
+
+        Raises:
+            AttributeError: If the target has no such method
+        """
+        instance = getattr(self.simulator, target) if target else self.simulator
+        if method.startswith("_") or not callable(getattr(instance, method)):
+            raise AttributeError(f"'{type(instance).__name__}' has no command '{method}'")
+
+        with self._submit_lock:
+            seq = next(self._seq)
+            self._queue.append(Command(seq, target, method, args, kwargs))
+            self.submitted = seq
+        return seq
+
+    @property
+    def pending(self) -> int:
+        """Number of commands waiting for the next tick."""
+        return len(self._queue)
+
+    def apply_pending(self) -> int:
+        """
+        Apply every command submitted so far, in sequence order.
+
+        Called by the simulator at the start of each tick. Commands submitted
+        while the batch is being applied wait for the next call.
+
+        Returns:
+            Number of commands applied
+        """
+        queue = self._queue
+        count = len(queue)
+        if not count:
+            return 0
+
+        simulator = self.simulator
+        applied = 0
+        for _ in range(count):
+            try:
+                command = queue.popleft()
+            except IndexError:
+                # Cleared concurrently
+                break
+            applied += 1
+            instance = getattr(simulator, command.target) if command.target else simulator
+            try:
+                getattr(instance, command.method)(*command.args, **command.kwargs)
+            except Exception as e:
+                # Log error but keep applying the batch
+                self.errors += 1
+                print(f"Error applying command {command.seq} '{command.method}': {e}")
+            self.applied_seq = command.seq
+
+        self.applied += applied
+        self.batches += 1
+        self.max_batch = max(self.max_batch, applied)
+        if self._waiters:
+            with self._applied_cond:
+                self._applied_cond.notify_all()
+        return applied
+
+    def wait(self, seq: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a command has been applied.
+
+        Args:
+            seq: Sequence number returned by ``submit()``
+            timeout: Maximum wait in seconds (None waits indefinitely)
+
+        Returns:
+            True if the command was applied, False on timeout
+        """
+        with self._applied_cond:
+            self._waiters += 1
+            try:
+                return self._applied_cond.wait_for(lambda: self.applied_seq >= seq, timeout)
+            finally:
+                self._waiters -= 1
+
+    def clear(self) -> int:
+        """Discard pending commands; returns how many were dropped."""
+        dropped = 0
+        while self._queue:
+            self._queue.popleft()
+            dropped += 1
+        return dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get submission and application statistics."""
+        return {
+            "submitted": self.submitted,
+            "applied": self.applied,
+            "applied_seq": self.applied_seq,
+            "pending": len(self._queue),
+            "batches": self.batches,
+            "max_batch": self.max_batch,
+            "errors": self.errors,
+        }
+
+
+class DeferredCalls:
+    """
+    Attribute-style front end to a CommandQueue.
+
+    ``simulator.deferred.set_vehicle_speed(80.0)`` and
+    ``simulator.deferred.driver_monitoring.simulate_gaze_away(6.0)`` submit
+    commands instead of calling the methods, and return sequence numbers.
+    """
+
+    def __init__(self, commands: CommandQueue, target: str = ""):
+        self._commands = commands
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        simulator = self._commands.simulator
+        if not self._target and name in simulator.FEATURES:
+            return DeferredCalls(self._commands, name)
+
+        commands, target = self._commands, self._target
+
+        def submit(*args, **kwargs) -> int:
+            return commands.submit(target, name, *args, **kwargs)
+
+        return submit
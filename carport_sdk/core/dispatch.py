@@ -0,0 +1,155 @@
+"""
+Queued event delivery for slow EventBus subscribers.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "coalesce")
+
+
+class QueuedSubscriber:
+    """
+    Delivers events to one callback from a bounded queue on a worker thread.
+
+    The publisher only enqueues, so a slow callback no longer stalls the
+    publishing thread. When the queue is full the overflow policy applies:
+
+    - ``block``: the publisher waits until the worker frees a slot
+    - ``drop_oldest``: the oldest queued event is discarded
+    - ``coalesce``: the newest queued event is replaced by the incoming one,
+      so the subscriber always receives the latest state
+
+    Args:
+        callback: Subscriber callback to run on the worker thread
+        maxsize: Maximum number of queued events
+        overflow: Overflow policy
+        name: Name used for the worker thread and in metrics
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Any], None],
+        maxsize: int = 1000,
+        overflow: str = "block",
+        name: str = "subscriber",
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got '{overflow}'")
+
+        self.callback = callback
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.name = name
+        self.__qualname__ = f"queued:{name}"
+
+        self._queue: Deque[Any] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+        self._thread = threading.Thread(target=self._run, name=f"dispatch-{name}", daemon=True)
+        self._thread.start()
+
+    def __call__(self, event: Any):
+        """Enqueue an event; called by the EventBus on the publisher's thread."""
+        with self._condition:
+            if self._closed:
+                return
+
+            if len(self._queue) >= self.maxsize:
+                if self.overflow == "drop_oldest":
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif self.overflow == "coalesce":
+                    self._queue[-1] = event
+                    self.coalesced += 1
+                    return
+                elif threading.current_thread() is self._thread:
+                    # A callback publishing to itself would wait forever
+                    self.dropped += 1
+                    return
+                else:
+                    while len(self._queue) >= self.maxsize and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+
+            self._queue.append(event)
+            if len(self._queue) > self.max_depth:
+                self.max_depth = len(self._queue)
+            self._condition.notify_all()
+
+    def _run(self):
+        """Worker loop delivering queued events in order."""
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                event = self._queue.popleft()
+                self._busy = True
+                self._condition.notify_all()
+
+            try:
+                self.callback(event)
+            except Exception as e:
+                # Log error but keep delivering
+                print(f"Error in event callback: {e}")
+
+            with self._condition:
+                self._busy = False
+                self.delivered += 1
+                self._condition.notify_all()
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be delivered."""
+        return len(self._queue)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been delivered.
+
+        Returns:
+            True if the queue drained before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 1.0):
+        """Deliver the remaining queued events, then stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and delivery metrics."""
+        return {
+            "callback": self.name,
+            "overflow": self.overflow,
+            "maxsize": self.maxsize,
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
@@ -2,62 +2,402 @@
 Event system for CarPort SDK simulation components.
 """
 
-from typing import Any, Callable, Dict, List
+import asyncio
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 
+from .clock import Clock
+from .dispatch import QueuedSubscriber
+from .history import EventHistory
+from .models import Timestamped, slotted
+from .profiling import Profiler
 
+
+@slotted
 @dataclass
-class Event:
+class Event(Timestamped):
     """Base event class for the simulation system."""
 
     event_type: str
     data: Any = None
     timestamp: datetime = None
     source: str = None
+    timestamp_ns: int = None  # time.monotonic_ns() at creation
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        self._stamp()
 
 
 class EventBus:
-    """Central event bus for component communication."""
+    """
+    Central event bus for component communication.
+
+    Published events are kept in a history whose retention is unbounded by
+    default; see ``configure_history()`` to bound it for long-running
+    simulations.
+
+    Subscriptions are resolved into an immutable callback tuple per event
+    type whenever they change, so ``publish()`` does a single lookup and is
+    unaffected by callbacks subscribing or unsubscribing during dispatch.
+    A subscription pattern ending in ``*`` (e.g. ``"alert.*"`` or ``"*"``)
+    matches every event type with that prefix.
+
+    Args:
+        clock: Time source for history retention and time-based queries
+        max_events: Total history capacity across all event types
+        max_events_per_type: History cap for every type (int) or selected types (dict)
+        max_age: History time window in seconds
+        excluded_types: Event types that are never recorded in the history
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        max_events: Optional[int] = None,
+        max_events_per_type: Optional[Union[int, Dict[str, int]]] = None,
+        max_age: Optional[float] = None,
+        excluded_types: Iterable[str] = (),
+    ):
+        self._lock = threading.Lock()
+        self._subscriptions: List[Tuple[str, Callable[[Event], None]]] = []
+        self._dispatch: Dict[str, Tuple[Callable[[Event], None], ...]] = {}
+        self._type_ids: Dict[str, int] = {}
+        self._history = EventHistory(
+            clock, max_events, max_events_per_type, max_age, excluded_types
+        )
+        self.clock = self._history.clock
+        self._profiler: Optional[Profiler] = None
+        self._queued: Dict[Tuple[str, Callable], QueuedSubscriber] = {}
+
+    def configure_history(
+        self,
+        max_events: Optional[int] = None,
+        max_events_per_type: Optional[Union[int, Dict[str, int]]] = None,
+        max_age: Optional[float] = None,
+        excluded_types: Iterable[str] = (),
+    ):
+        """
+        Set the event history retention policy.
+
+        Args:
+            max_events: Total capacity; the oldest event is evicted when full
+            max_events_per_type: Cap for every type (int) or selected types (dict)
+            max_age: Time window in seconds; older events are evicted
+            excluded_types: Event types that are never recorded
+        """
+        self._history.configure(max_events, max_events_per_type, max_age, excluded_types)
 
-    def __init__(self):
-        self._subscribers: Dict[str, List[Callable[[Event], None]]] = {}
-        self._event_history: List[Event] = []
+    def set_profiler(self, profiler: Optional[Profiler]):
+        """Enable (or with None, disable) latency profiling of publish and callbacks."""
+        self._profiler = profiler
 
-    def subscribe(self, event_type: str, callback: Callable[[Event], None]):
-        """Subscribe to events of a specific type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+    def subscribe(
+        self,
+        event_type: str,
+        callback: Callable[[Event], None],
+        queued: bool = False,
+        maxsize: int = 1000,
+        overflow: str = "block",
+    ):
+        """
+        Subscribe to events of a specific type.
+
+        By default the callback runs synchronously on the publisher's thread.
+        With ``queued=True`` it gets its own bounded queue and worker thread,
+        so a slow callback cannot stall the publisher.
+
+        Args:
+            event_type: Event type to subscribe to
+            callback: Function called with each event
+            queued: Deliver events asynchronously from a per-subscriber queue
+            maxsize: Queue capacity (queued subscribers only)
+            overflow: Policy when the queue is full: "block", "drop_oldest"
+                or "coalesce" (queued subscribers only)
+        """
+        if queued:
+            key = (event_type, callback)
+            if key in self._queued:
+                raise ValueError("Callback is already subscribed to this event type")
+            callback = self._queued[key] = QueuedSubscriber(
+                callback, maxsize, overflow, _callback_name(callback)
+            )
+
+        with self._lock:
+            self._subscriptions.append((event_type, callback))
+            self._rebuild_dispatch(event_type)
 
     def unsubscribe(self, event_type: str, callback: Callable[[Event], None]):
         """Unsubscribe from events of a specific type."""
-        if event_type in self._subscribers:
-            if callback in self._subscribers[event_type]:
-                self._subscribers[event_type].remove(callback)
+        queued = self._queued.pop((event_type, callback), None)
+        if queued is not None:
+            callback = queued
+        with self._lock:
+            if (event_type, callback) in self._subscriptions:
+                self._subscriptions.remove((event_type, callback))
+                self._rebuild_dispatch(event_type)
+        if queued is not None:
+            queued.close()
+
+    def event_type_id(self, event_type: str) -> int:
+        """
+        Get the stable integer ID interned for an event type on this bus.
+
+        IDs are assigned in order of first use and never change, so they can
+        stand in for type strings in compact encodings.
+        """
+        type_id = self._type_ids.get(event_type)
+        if type_id is None:
+            self._register_type(event_type)
+            type_id = self._type_ids[event_type]
+        return type_id
+
+    def get_event_types(self) -> List[str]:
+        """Get all event types seen by this bus, ordered by type ID."""
+        return list(self._type_ids)
+
+    def _register_type(self, event_type: str) -> Tuple[Callable[[Event], None], ...]:
+        """Intern a newly seen event type and resolve its dispatch tuple."""
+        with self._lock:
+            if event_type not in self._type_ids:
+                event_type = sys.intern(event_type)
+                self._type_ids[event_type] = len(self._type_ids)
+                self._dispatch[event_type] = self._resolve(event_type)
+            return self._dispatch[event_type]
+
+    def _resolve(self, event_type: str) -> Tuple[Callable[[Event], None], ...]:
+        """Collect the callbacks of every subscription matching an event type."""
+        return tuple(
+            callback
+            for pattern, callback in self._subscriptions
+            if _matches(pattern, event_type)
+        )
+
+    def _rebuild_dispatch(self, pattern: str):
+        """Rebuild the dispatch tuples affected by a subscription change."""
+        if not pattern.endswith("*") and pattern not in self._type_ids:
+            self._type_ids[sys.intern(pattern)] = len(self._type_ids)
+        for event_type in self._type_ids:
+            if _matches(pattern, event_type):
+                self._dispatch[event_type] = self._resolve(event_type)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued subscribers have processed their pending events.
+
+        Returns:
+            True if every queue drained before the timeout
+        """
+        return all(queued.flush(timeout) for queued in list(self._queued.values()))
+
+    def close(self):
+        """Deliver pending queued events and stop all queued subscriber workers."""
+        for event_type, callback in list(self._queued):
+            self.unsubscribe(event_type, callback)
+
+    def get_dispatch_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get queue depth and drop metrics for queued subscribers, by event type."""
+        stats: Dict[str, List[Dict[str, Any]]] = {}
+        for (event_type, _), queued in list(self._queued.items()):
+            stats.setdefault(event_type, []).append(queued.get_stats())
+        return stats
 
     def publish(self, event: Event):
         """Publish an event to all subscribers."""
-        self._event_history.append(event)
-
-        if event.event_type in self._subscribers:
-            for callback in self._subscribers[event.event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    # Log error but continue with other subscribers
-                    print(f"Error in event callback: {e}")
-
-    def get_event_history(self, event_type: str = None) -> List[Event]:
-        """Get history of events, optionally filtered by type."""
-        if event_type is None:
-            return self._event_history.copy()
-        return [e for e in self._event_history if e.event_type == event_type]
+        if self._profiler is not None:
+            self._publish_profiled(event, self._profiler)
+            return
+
+        self._history.append(event.event_type, event)
+
+        callbacks = self._dispatch.get(event.event_type)
+        if callbacks is None:
+            callbacks = self._register_type(event.event_type)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                # Log error but continue with other subscribers
+                print(f"Error in event callback: {e}")
+
+    def _publish_profiled(self, event: Event, profiler: Profiler):
+        """Publish an event while recording dispatch latencies."""
+        started = profiler.now_ns()
+        self._history.append(event.event_type, event)
+
+        callbacks = self._dispatch.get(event.event_type)
+        if callbacks is None:
+            callbacks = self._register_type(event.event_type)
+        profiler.count(f"fanout:{event.event_type}", len(callbacks))
+        for callback in callbacks:
+            callback_started = profiler.now_ns()
+            try:
+                callback(event)
+            except Exception as e:
+                # Log error but continue with other subscribers
+                print(f"Error in event callback: {e}")
+            profiler.record(
+                f"callback:{_callback_name(callback)}", profiler.now_ns() - callback_started
+            )
+
+        profiler.record(f"publish:{event.event_type}", profiler.now_ns() - started)
+
+    def stream(self, event_type: str, maxsize: int = 0) -> "EventStream":
+        """
+        Open an async stream of events of a specific type.
+
+        Must be called from within a running asyncio event loop. Events
+        published from other threads are handed over to the loop safely.
+
+        Args:
+            event_type: Event type to stream
+            maxsize: Maximum number of buffered events (0 for unbounded);
+                the oldest buffered event is dropped when full
+
+        Usage:
+            async with bus.stream("alert") as alerts:
+                async for event in alerts:
+                    ...
+        """
+        return EventStream(self, event_type, maxsize)
+
+    def get_event_history(
+        self,
+        event_type: str = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+        since_seq: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get history of events, optionally filtered by type and time range.
+
+        Args:
+            event_type: Only return events of this type
+            since: Only return events published at or after this bus clock time
+            until: Only return events published at or before this bus clock time
+            limit: Return at most this many (the oldest matching) events
+            since_seq: Only return events published after this history cursor
+
+        Returns:
+            Matching events in publication order
+        """
+        return self._history.get(event_type, since, until, limit, since_seq)
+
+    def get_timed_history(
+        self,
+        event_type: str = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[Tuple[float, Event]]:
+        """
+        Get history as (clock time, event) pairs, optionally filtered like
+        ``get_event_history()``.
+        """
+        return [
+            (timestamp, event)
+            for _, timestamp, event in self._history.query(
+                event_type, since, until, with_times=True
+            )
+        ]
+
+    def read_history(
+        self, cursor: int = 0, event_type: str = None, limit: Optional[int] = None
+    ) -> Tuple[List[Event], int]:
+        """
+        Incrementally read the event history from a cursor.
+
+        Pass the returned cursor to the next call to receive only events
+        published since the previous read.
+
+        Args:
+            cursor: Cursor returned by the previous read (0 reads from the start)
+            event_type: Only return events of this type
+            limit: Return at most this many events
+
+        Returns:
+            Tuple of (events, new cursor)
+        """
+        records = self._history.query(event_type, limit=limit, since_seq=cursor)
+        if records:
+            cursor = records[-1][0]
+        return [event for _, event in records], cursor
+
+    def get_history_stats(self) -> Dict[str, Any]:
+        """Get event history size and eviction statistics."""
+        return self._history.get_stats()
 
     def clear_history(self):
         """Clear the event history."""
-        self._event_history.clear()
+        self._history.clear()
+
+
+def _matches(pattern: str, event_type: str) -> bool:
+    """Check whether a subscription pattern matches an event type."""
+    if pattern.endswith("*"):
+        return event_type.startswith(pattern[:-1])
+    return pattern == event_type
+
+
+def _callback_name(callback: Callable) -> str:
+    """Get a readable name for a subscriber callback."""
+    return getattr(callback, "__qualname__", None) or type(callback).__qualname__
+
+
+class EventStream:
+    """Async iterator over events of one type published on an EventBus."""
+
+    _CLOSED = object()
+
+    def __init__(self, event_bus: EventBus, event_type: str, maxsize: int = 0):
+        self._event_bus = event_bus
+        self._event_type = event_type
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._maxsize = maxsize
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = False
+        self.dropped = 0
+
+        event_bus.subscribe(event_type, self._on_event)
+
+    def _on_event(self, event: Event):
+        """Receive an event from the bus on the publisher's thread."""
+        if threading.get_ident() == self._loop_thread:
+            self._enqueue(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._enqueue, event)
+
+    def _enqueue(self, event: Event):
+        """Buffer an event on the event loop thread, dropping the oldest when full."""
+        if self._maxsize and self._queue.qsize() >= self._maxsize:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    def close(self):
+        """Stop streaming and unsubscribe from the bus."""
+        if self._closed:
+            return
+        self._closed = True
+        self._event_bus.unsubscribe(self._event_type, self._on_event)
+        self._queue.put_nowait(self._CLOSED)
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> Event:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,377 @@
+"""
+Vectorized fleet simulator for the CarPort SDK.
+
+Holds the state of many vehicles as NumPy structure-of-arrays and advances
+all of them with batched kernels, so fleet-scale validation runs need neither
+one thread nor one set of Python objects per vehicle.
+
+Requires NumPy (listed under the optional dependencies in requirements.txt).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .clock import Clock, RealTimeClock
+from .events import EventBus, Event
+from .models import AlertData
+
+VehicleIds = Union[int, slice, np.ndarray, List[int]]
+
+# Metres per degree of latitude
+_METERS_PER_DEGREE = 111320.0
+
+WEATHER_ADJUSTMENTS = {
+    "clear": 1.0,
+    "rain": 0.8,
+    "heavy_rain": 0.6,
+    "snow": 0.5,
+    "fog": 0.7,
+}
+
+OBSTACLE_TYPES = ("none", "pedestrian", "vehicle", "animal", "static_object")
+
+_ALERT_LEVEL_NAMES = {1: "visual", 2: "audible", 3: "haptic"}
+
+
+@dataclass
+class FleetAlert:
+    """An alert raised for a batch of vehicles in the same simulation step."""
+
+    vehicle_ids: np.ndarray
+    alert: AlertData
+
+    def __iter__(self) -> Iterator[Tuple[int, AlertData]]:
+        for vehicle_id in self.vehicle_ids:
+            yield int(vehicle_id), self.alert
+
+
+class FleetSimulator:
+    """
+    Simulates a fleet of vehicles in a single process.
+
+    Models driver monitoring (DP-601), adaptive speed limiting (DP-602),
+    vehicle motion and the nearest obstacle ahead of each vehicle (DP-604)
+    using the same rules as the single-vehicle feature simulators. Alerts are
+    published on the event bus as ``fleet_alert`` events carrying a
+    ``FleetAlert`` with the affected vehicle IDs.
+
+    Args:
+        size: Number of vehicles in the fleet
+        clock: Time source (defaults to wall-clock time)
+        timestep: Simulation timestep in seconds
+        event_bus: Event bus to publish alerts on (a new one is created if omitted)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        clock: Optional[Clock] = None,
+        timestep: float = 0.1,
+        event_bus: Optional[EventBus] = None,
+    ):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if timestep <= 0:
+            raise ValueError("timestep must be positive")
+
+        self.size = size
+        self.clock = clock or RealTimeClock()
+        self.timestep = timestep
+        self.event_bus = event_bus or EventBus()
+        self.detection_range = 100.0  # meters
+        self.speed_change_rate = 10.0  # km/h per second
+        self._tick_count = 0
+        self._alerts: List[FleetAlert] = []
+
+        # Vehicle state
+        self.speed = np.zeros(size)  # km/h
+        self.lat = np.zeros(size)
+        self.lon = np.zeros(size)
+        self.heading = np.zeros(size)  # degrees
+
+        # Speed limiting state
+        self.speed_limit = np.full(size, 50.0)  # km/h
+        self.weather_adjustment = np.ones(size)
+        self.traffic_adjustment = np.ones(size)
+        self.speed_limiting_enabled = np.ones(size, dtype=bool)
+
+        # Driver monitoring state
+        self.alert_threshold = np.full(size, 5.0)  # seconds
+        self.gaze_away = np.zeros(size, dtype=bool)
+        self.time_looking_away = np.zeros(size)
+        self.alert_level = np.zeros(size, dtype=np.int8)
+
+        # Nearest obstacle per vehicle (type code 0 means no obstacle)
+        self.obstacle_type = np.zeros(size, dtype=np.int8)
+        self.obstacle_distance = np.zeros(size)
+        self.obstacle_velocity = np.zeros(size)
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def set_speed(self, vehicle_ids: VehicleIds, speed):
+        """Set vehicle speed in km/h."""
+        self.speed[vehicle_ids] = speed
+
+    def set_position(self, vehicle_ids: VehicleIds, latitude, longitude):
+        """Set vehicle GPS position."""
+        self.lat[vehicle_ids] = latitude
+        self.lon[vehicle_ids] = longitude
+
+    def set_heading(self, vehicle_ids: VehicleIds, heading):
+        """Set vehicle heading in degrees."""
+        self.heading[vehicle_ids] = heading
+
+    def set_speed_limit(self, vehicle_ids: VehicleIds, limit):
+        """Set the base speed limit in km/h."""
+        self.speed_limit[vehicle_ids] = limit
+
+    def set_weather_condition(self, vehicle_ids: VehicleIds, condition: str):
+        """
+        Set the weather condition for a group of vehicles.
+
+        Args:
+            vehicle_ids: Vehicles to update
+            condition: One of 'clear', 'rain', 'heavy_rain', 'snow', 'fog'
+        """
+        if condition not in WEATHER_ADJUSTMENTS:
+            raise ValueError(f"Unknown weather condition: {condition}")
+        self.weather_adjustment[vehicle_ids] = WEATHER_ADJUSTMENTS[condition]
+
+    def set_alert_threshold(self, vehicle_ids: VehicleIds, threshold):
+        """Set the driver monitoring alert threshold in seconds."""
+        self.alert_threshold[vehicle_ids] = threshold
+
+    def simulate_gaze_away(self, vehicle_ids: VehicleIds):
+        """Simulate drivers looking away from the road."""
+        self.gaze_away[vehicle_ids] = True
+
+    def simulate_gaze_forward(self, vehicle_ids: VehicleIds):
+        """Simulate drivers returning their gaze to the road, resetting alerts."""
+        self.gaze_away[vehicle_ids] = False
+        self.time_looking_away[vehicle_ids] = 0.0
+        self.alert_level[vehicle_ids] = 0
+
+    def add_obstacle(
+        self, vehicle_ids: VehicleIds, object_type: str, distance, velocity=0.0
+    ):
+        """
+        Place an obstacle ahead of a group of vehicles.
+
+        Each vehicle tracks only its nearest obstacle; a new obstacle replaces
+        the previous one.
+
+        Args:
+            vehicle_ids: Vehicles to update
+            object_type: One of 'pedestrian', 'vehicle', 'animal', 'static_object'
+            distance: Distance in meters
+            velocity: Obstacle velocity in m/s
+        """
+        if object_type not in OBSTACLE_TYPES[1:]:
+            raise ValueError(f"Unknown obstacle type: {object_type}")
+
+        ids = self._as_index_array(vehicle_ids)
+        self.obstacle_type[ids] = OBSTACLE_TYPES.index(object_type)
+        self.obstacle_distance[ids] = distance
+        self.obstacle_velocity[ids] = velocity
+        self._process_obstacle_detection(ids, object_type)
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def step(self, n: int = 1):
+        """Advance the whole fleet by a number of timesteps."""
+        for _ in range(n):
+            self.clock.sleep(self.timestep)
+            self._update_fleet(self.timestep)
+
+    def run_for(self, sim_seconds: float):
+        """Advance the whole fleet by a span of simulated time."""
+        self.step(int(round(sim_seconds / self.timestep)))
+
+    def _update_fleet(self, dt: float):
+        """Run every batched kernel for one timestep."""
+        self._tick_count += 1
+        self._update_driver_monitoring(dt)
+        self._update_speed_limiting(dt)
+        self._update_positions(dt)
+        self._update_obstacles(dt)
+
+    def _update_driver_monitoring(self, dt: float):
+        """Accumulate time looking away and escalate alert levels."""
+        self.time_looking_away += np.where(self.gaze_away, dt, 0.0)
+
+        looking_away = self.time_looking_away
+        threshold = self.alert_threshold
+        new_level = (
+            (looking_away >= threshold).astype(np.int8)
+            + (looking_away >= threshold * 2)
+            + (looking_away >= threshold * 3)
+        )
+        escalated = new_level > self.alert_level
+        if not escalated.any():
+            return
+
+        self.alert_level = np.where(escalated, new_level, self.alert_level)
+        for level, name in _ALERT_LEVEL_NAMES.items():
+            ids = np.flatnonzero(escalated & (new_level == level))
+            if ids.size:
+                self._emit_alert(
+                    ids,
+                    alert_type="driver_attention",
+                    severity="warning" if level < 3 else "critical",
+                    message=f"Driver attention required - {name} alert",
+                )
+
+    def _update_speed_limiting(self, dt: float):
+        """Move every vehicle's speed toward its adjusted speed limit."""
+        target = np.maximum(
+            0.0, self.speed_limit * self.weather_adjustment * self.traffic_adjustment
+        )
+        max_change = self.speed_change_rate * dt
+        change = np.clip(target - self.speed, -max_change, max_change)
+        significant = self.speed_limiting_enabled & (np.abs(change) > 0.1)
+        self.speed = np.where(significant, np.maximum(0.0, self.speed + change), self.speed)
+
+    def _update_positions(self, dt: float):
+        """Integrate vehicle positions from speed and heading."""
+        distance = self.speed / 3.6 * dt
+        heading = np.radians(self.heading)
+        self.lat += distance * np.cos(heading) / _METERS_PER_DEGREE
+        cos_lat = np.maximum(np.cos(np.radians(self.lat)), 1e-6)
+        self.lon += distance * np.sin(heading) / (_METERS_PER_DEGREE * cos_lat)
+
+    def _update_obstacles(self, dt: float):
+        """Move obstacles relative to their vehicles and drop those out of range."""
+        tracked = self.obstacle_type != 0
+        if not tracked.any():
+            return
+
+        relative_velocity = self.speed / 3.6 - self.obstacle_velocity
+        self.obstacle_distance = np.where(
+            tracked, self.obstacle_distance + relative_velocity * dt, self.obstacle_distance
+        )
+        out_of_range = tracked & (
+            (self.obstacle_distance > self.detection_range) | (self.obstacle_distance <= 0)
+        )
+        self.obstacle_type[out_of_range] = 0
+
+    def _process_obstacle_detection(self, ids: np.ndarray, object_type: str):
+        """Trigger responses for newly placed obstacles."""
+        distance = self.obstacle_distance[ids]
+        velocity = self.obstacle_velocity[ids]
+
+        if object_type == "pedestrian":
+            emergency = (distance < 20) & (velocity > 0)
+            warning = ~emergency & (distance < 50)
+            self._emit_alert(
+                ids[emergency],
+                alert_type="emergency_stop",
+                severity="critical",
+                message="Emergency stop triggered - pedestrian ahead",
+            )
+            self._emit_alert(
+                ids[warning],
+                alert_type="obstacle_warning",
+                severity="warning",
+                message="Pedestrian detected ahead",
+            )
+        elif object_type == "animal":
+            self._emit_alert(
+                ids[distance < 30],
+                alert_type="slow_down",
+                severity="warning",
+                message="Reducing speed - animal detected",
+            )
+        elif object_type == "static_object":
+            self._emit_alert(
+                ids[distance < 25],
+                alert_type="navigation_required",
+                severity="info",
+                message="Navigation adjustment needed - static_object ahead",
+            )
+
+    def _emit_alert(self, ids: np.ndarray, alert_type: str, severity: str, message: str):
+        """Publish one alert for a batch of vehicles."""
+        if ids.size == 0:
+            return
+
+        fleet_alert = FleetAlert(
+            vehicle_ids=ids,
+            alert=AlertData(
+                alert_type=alert_type,
+                severity=severity,
+                message=message,
+                source_component="FleetSimulator",
+            ),
+        )
+        self._alerts.append(fleet_alert)
+        self.event_bus.publish(Event("fleet_alert", data=fleet_alert, source="FleetSimulator"))
+
+    def _as_index_array(self, vehicle_ids: VehicleIds) -> np.ndarray:
+        """Normalize a vehicle selector into an array of integer indices."""
+        return np.arange(self.size)[vehicle_ids].reshape(-1)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def get_alerts(self, clear: bool = False) -> List[FleetAlert]:
+        """Get batched fleet alerts, optionally clearing them."""
+        alerts = self._alerts.copy()
+        if clear:
+            self._alerts.clear()
+        return alerts
+
+    def get_vehicle_alerts(self, vehicle_id: int) -> List[AlertData]:
+        """Get every alert raised for a single vehicle."""
+        return [
+            fleet_alert.alert
+            for fleet_alert in self._alerts
+            if np.any(fleet_alert.vehicle_ids == vehicle_id)
+        ]
+
+    def get_alert_counts(self) -> np.ndarray:
+        """Get the number of alerts raised per vehicle."""
+        counts = np.zeros(self.size, dtype=np.int64)
+        for fleet_alert in self._alerts:
+            np.add.at(counts, fleet_alert.vehicle_ids, 1)
+        return counts
+
+    def get_vehicle_state(self, vehicle_id: int) -> Dict[str, Any]:
+        """Get the state of a single vehicle as a plain dict."""
+        obstacle_code = int(self.obstacle_type[vehicle_id])
+        return {
+            "speed": float(self.speed[vehicle_id]),
+            "position": {"lat": float(self.lat[vehicle_id]), "lon": float(self.lon[vehicle_id])},
+            "heading": float(self.heading[vehicle_id]),
+            "is_stationary": bool(self.speed[vehicle_id] < 1.0),
+            "time_looking_away": float(self.time_looking_away[vehicle_id]),
+            "alert_level": int(self.alert_level[vehicle_id]),
+            "obstacle": (
+                {
+                    "object_type": OBSTACLE_TYPES[obstacle_code],
+                    "distance": float(self.obstacle_distance[vehicle_id]),
+                    "velocity": float(self.obstacle_velocity[vehicle_id]),
+                }
+                if obstacle_code
+                else None
+            ),
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get aggregate fleet status."""
+        return {
+            "size": self.size,
+            "sim_time": self.clock.now(),
+            "tick_count": self._tick_count,
+            "mean_speed": float(self.speed.mean()),
+            "stationary_count": int(np.count_nonzero(self.speed < 1.0)),
+            "drivers_looking_away": int(np.count_nonzero(self.gaze_away)),
+            "obstacles_tracked": int(np.count_nonzero(self.obstacle_type)),
+            "alert_count": sum(fleet_alert.vehicle_ids.size for fleet_alert in self._alerts),
+        }
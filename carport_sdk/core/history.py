@@ -0,0 +1,340 @@
+"""
+Bounded event history storage for the EventBus.
+"""
+
+import bisect
+import heapq
+import itertools
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .clock import Clock, RealTimeClock
+
+# Only compact a buffer once this many evicted slots have accumulated
+_COMPACT_THRESHOLD = 1024
+
+# Sweep every buffer for expired events after this many appends
+_AGE_SWEEP_INTERVAL = 256
+
+
+class _HistoryBuffer:
+    """
+    Append-only FIFO of (sequence, time, event) records for one event type.
+
+    Records are kept in parallel lists with a moving start offset, so evicting
+    from the front is O(1) amortized and the lists stay indexable.
+
+    Sequence numbers always increase. Times normally do too, but a clock can
+    go backwards (a restored snapshot rewinds a VirtualClock, the wall clock
+    can be stepped); ``ordered`` records whether the times are still sorted
+    so time queries and expiry can fall back to a scan.
+    """
+
+    __slots__ = ("seqs", "times", "events", "start", "ordered")
+
+    def __init__(self):
+        self.seqs: List[int] = []
+        self.times: List[float] = []
+        self.events: List[Any] = []
+        self.start = 0
+        self.ordered = True
+
+    def __len__(self) -> int:
+        return len(self.events) - self.start
+
+    def append(self, seq: int, timestamp: float, event: Any):
+        if not len(self):
+            self.ordered = True
+        elif timestamp < self.times[-1]:
+            self.ordered = False
+        self.seqs.append(seq)
+        self.times.append(timestamp)
+        self.events.append(event)
+
+    def popleft(self):
+        self.events[self.start] = None
+        self.start += 1
+        if self.start >= _COMPACT_THRESHOLD and self.start * 2 >= len(self.events):
+            self._keep(range(self.start, len(self.events)))
+
+    def remove_older(self, cutoff: float) -> int:
+        """Remove records timed before a cutoff; returns how many were removed."""
+        if self.ordered:
+            removed = 0
+            while len(self) and self.times[self.start] < cutoff:
+                self.popleft()
+                removed += 1
+            return removed
+
+        times = self.times
+        kept = [i for i in range(self.start, len(self.events)) if times[i] >= cutoff]
+        removed = len(self) - len(kept)
+        if removed:
+            self._keep(kept)
+        return removed
+
+    def _keep(self, indices: Iterable[int]):
+        """Rebuild the lists from the given indices, dropping evicted slots."""
+        indices = list(indices)
+        self.seqs = [self.seqs[i] for i in indices]
+        self.times = [self.times[i] for i in indices]
+        self.events = [self.events[i] for i in indices]
+        self.start = 0
+        if not self.ordered:
+            times = self.times
+            self.ordered = all(times[i] <= times[i + 1] for i in range(len(times) - 1))
+
+    def oldest_seq(self) -> int:
+        return self.seqs[self.start]
+
+    def records(
+        self, lo: Optional[int] = None, hi: Optional[int] = None, with_times: bool = False
+    ) -> Iterator[Tuple]:
+        lo = self.start if lo is None else lo
+        hi = len(self.events) if hi is None else hi
+        columns = [self.seqs, self.times, self.events] if with_times else [self.seqs, self.events]
+        return zip(*(itertools.islice(column, lo, hi) for column in columns))
+
+    def bounds(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        since_seq: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        Binary-search the index range matching a time window and cursor.
+
+        Only valid for time windows while ``ordered`` is true.
+        """
+        lo, hi = self.start, len(self.events)
+        if since is not None:
+            lo = bisect.bisect_left(self.times, since, lo, hi)
+        if since_seq is not None:
+            lo = max(lo, bisect.bisect_right(self.seqs, since_seq, lo, hi))
+        if until is not None:
+            hi = bisect.bisect_right(self.times, until, lo, hi)
+        return lo, max(lo, hi)
+
+    def select(
+        self,
+        since: Optional[float],
+        until: Optional[float],
+        since_seq: Optional[int],
+        limit: Optional[int],
+        with_times: bool,
+    ) -> Optional[Iterator[Tuple]]:
+        """Get the records matching a query, or None if there are none."""
+        if self.ordered or (since is None and until is None):
+            lo, hi = self.bounds(since, until, since_seq)
+            if lo >= hi:
+                return None
+            hi = hi if limit is None else min(hi, lo + limit)
+            return self.records(lo, hi, with_times)
+
+        # Times are unsorted: narrow by sequence number, then scan the times
+        lo, hi = self.bounds(since_seq=since_seq)
+        low = float("-inf") if since is None else since
+        high = float("inf") if until is None else until
+        matching = [
+            record for record in self.records(lo, hi, True) if low <= record[1] <= high
+        ][:limit]
+        if not matching:
+            return None
+        if with_times:
+            return iter(matching)
+        return ((seq, event) for seq, _, event in matching)
+
+
+class EventHistory:
+    """
+    Event history with configurable retention.
+
+    By default every event is kept. Retention can be bounded by:
+
+    - ``max_events``: total capacity across all types; the oldest event is evicted
+    - ``max_events_per_type``: a cap for every type (int) or for selected types (dict)
+    - ``max_age``: time window in seconds; older events are evicted
+    - ``excluded_types``: event types that are never recorded
+
+    Args:
+        clock: Time source used to stamp events for time-window retention
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        max_events: Optional[int] = None,
+        max_events_per_type: Optional[Union[int, Dict[str, int]]] = None,
+        max_age: Optional[float] = None,
+        excluded_types: Iterable[str] = (),
+    ):
+        self.clock = clock or RealTimeClock()
+        self._lock = Lock()
+        self._buffers: Dict[str, _HistoryBuffer] = {}
+        self._sequence = 0
+        self._size = 0
+        self._evicted = 0
+        self._appends_since_sweep = 0
+        self.configure(max_events, max_events_per_type, max_age, excluded_types)
+
+    def configure(
+        self,
+        max_events: Optional[int] = None,
+        max_events_per_type: Optional[Union[int, Dict[str, int]]] = None,
+        max_age: Optional[float] = None,
+        excluded_types: Iterable[str] = (),
+    ):
+        """Replace the retention policy and apply it to the stored events."""
+        with self._lock:
+            self.max_events = max_events
+            self.max_events_per_type = max_events_per_type
+            self.max_age = max_age
+            self.excluded_types = frozenset(excluded_types)
+
+            for event_type in list(self._buffers):
+                buffer = self._buffers[event_type]
+                if event_type in self.excluded_types:
+                    self._size -= len(buffer)
+                    self._evicted += len(buffer)
+                    del self._buffers[event_type]
+                else:
+                    self._enforce_type_cap(event_type, buffer)
+            self._sweep_expired()
+            self._enforce_total_cap()
+
+    def append(self, event_type: str, event: Any):
+        """Record an event, evicting older events as the policy requires."""
+        if event_type in self.excluded_types:
+            return
+
+        now = self.clock.now()
+        with self._lock:
+            buffer = self._buffers.get(event_type)
+            if buffer is None:
+                buffer = self._buffers[event_type] = _HistoryBuffer()
+
+            self._sequence += 1
+            buffer.append(self._sequence, now, event)
+            self._size += 1
+
+            self._enforce_type_cap(event_type, buffer)
+            if self.max_age is not None:
+                if buffer.ordered:
+                    self._expire(buffer, now - self.max_age)
+                self._appends_since_sweep += 1
+                if self._appends_since_sweep >= _AGE_SWEEP_INTERVAL:
+                    self._sweep_expired()
+            self._enforce_total_cap()
+
+    def get(
+        self,
+        event_type: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+        since_seq: Optional[int] = None,
+    ) -> List[Any]:
+        """Get retained events in publication order; see ``query()`` for the filters."""
+        return [event for _, event in self.query(event_type, since, until, limit, since_seq)]
+
+    def query(
+        self,
+        event_type: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+        since_seq: Optional[int] = None,
+        with_times: bool = False,
+    ) -> List[Tuple]:
+        """
+        Get retained (sequence, event) records in publication order.
+
+        Runs in logarithmic time plus output size: every type has its own
+        buffer, and timestamps and sequence numbers within a buffer are
+        monotonic, so the matching range is found by binary search. If the
+        clock went backwards while a buffer was filled, time windows on that
+        buffer are answered by a scan instead.
+
+        Args:
+            event_type: Only return events of this type
+            since: Only return events recorded at or after this clock time
+            until: Only return events recorded at or before this clock time
+            limit: Return at most this many (the oldest matching) records
+            since_seq: Only return events with a sequence number above this cursor
+            with_times: Return (sequence, clock time, event) records instead
+        """
+        with self._lock:
+            if event_type is not None:
+                buffer = self._buffers.get(event_type)
+                buffers = [buffer] if buffer else []
+            else:
+                buffers = list(self._buffers.values())
+
+            ranges = []
+            for buffer in buffers:
+                records = buffer.select(since, until, since_seq, limit, with_times)
+                if records is not None:
+                    ranges.append(records)
+
+            if not ranges:
+                return []
+            records = ranges[0] if len(ranges) == 1 else heapq.merge(*ranges)
+            return list(itertools.islice(records, limit))
+
+    def clear(self):
+        """Discard all retained events."""
+        with self._lock:
+            self._buffers.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get retention statistics."""
+        with self._lock:
+            return {
+                "size": self._size,
+                "evicted": self._evicted,
+                "per_type": {name: len(buffer) for name, buffer in self._buffers.items()},
+            }
+
+    def _type_cap(self, event_type: str) -> Optional[int]:
+        caps = self.max_events_per_type
+        if isinstance(caps, dict):
+            return caps.get(event_type)
+        return caps
+
+    def _evict_from(self, buffer: _HistoryBuffer):
+        buffer.popleft()
+        self._size -= 1
+        self._evicted += 1
+
+    def _enforce_type_cap(self, event_type: str, buffer: _HistoryBuffer):
+        cap = self._type_cap(event_type)
+        if cap is not None:
+            while len(buffer) > cap:
+                self._evict_from(buffer)
+
+    def _enforce_total_cap(self):
+        if self.max_events is None:
+            return
+        while self._size > self.max_events:
+            oldest = min(
+                (buffer for buffer in self._buffers.values() if len(buffer)),
+                key=_HistoryBuffer.oldest_seq,
+            )
+            self._evict_from(oldest)
+
+    def _expire(self, buffer: _HistoryBuffer, cutoff: float):
+        removed = buffer.remove_older(cutoff)
+        self._size -= removed
+        self._evicted += removed
+
+    def _sweep_expired(self):
+        self._appends_since_sweep = 0
+        if self.max_age is None:
+            return
+        cutoff = self.clock.now() - self.max_age
+        for buffer in self._buffers.values():
+            self._expire(buffer, cutoff)
@@ -0,0 +1,230 @@
+"""
+Shared scheduler that ticks many simulators from a small pool of threads.
+"""
+
+import heapq
+import itertools
+from threading import Lock, Thread, Event as ThreadEvent
+from typing import Any, Dict, List, Optional, Tuple
+
+from .clock import Clock, RealTimeClock
+from .events import Event
+
+
+class _HostedSimulator:
+    """Scheduling record for one simulator registered with a host."""
+
+    __slots__ = ("simulator", "period", "deadline", "ticks", "overruns")
+
+    def __init__(self, simulator, period: float):
+        self.simulator = simulator
+        self.period = period
+        self.deadline = 0.0
+        self.ticks = 0
+        self.overruns = 0
+
+
+class _HostWorker:
+    """One host thread with its own deadline queue."""
+
+    def __init__(self, host: "SimulationHost", index: int):
+        self.host = host
+        self.index = index
+        self.lock = Lock()
+        self.wakeup = ThreadEvent()
+        self.queue: List[Tuple[float, int, _HostedSimulator]] = []
+        self.entries: Dict[int, _HostedSimulator] = {}
+        self.thread: Optional[Thread] = None
+
+    def push(self, entry: _HostedSimulator):
+        with self.lock:
+            heapq.heappush(self.queue, (entry.deadline, next(self.host._sequence), entry))
+        self.wakeup.set()
+
+    def run(self):
+        clock = self.host.clock
+        stop_event = self.host._stop_event
+
+        while not stop_event.is_set():
+            with self.lock:
+                # Drop simulators that were removed while queued
+                while self.queue and id(self.queue[0][2].simulator) not in self.entries:
+                    heapq.heappop(self.queue)
+                deadline = self.queue[0][0] if self.queue else None
+
+            if deadline is None:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+
+            delay = deadline - clock.now()
+            if delay > 0:
+                self.wakeup.wait(delay)
+                self.wakeup.clear()
+                continue
+
+            with self.lock:
+                if not self.queue or self.queue[0][0] > clock.now():
+                    continue
+                _, _, entry = heapq.heappop(self.queue)
+                if id(entry.simulator) not in self.entries:
+                    continue
+
+            if not entry.simulator._running:
+                # Stopped directly through CarPortSimulator.stop()
+                continue
+
+            try:
+                entry.simulator._update_simulation()
+            except Exception as e:
+                # Log error but keep ticking the other simulators
+                print(f"Error ticking hosted simulator: {e}")
+            entry.ticks += 1
+
+            # Next deadline on the simulator's fixed grid; realign if far behind
+            entry.deadline += entry.period
+            now = clock.now()
+            if entry.deadline < now - entry.period:
+                entry.overruns += 1
+                entry.deadline = now + entry.period
+
+            with self.lock:
+                if id(entry.simulator) in self.entries:
+                    # A fresh sequence number puts equal deadlines in round-robin order
+                    heapq.heappush(
+                        self.queue, (entry.deadline, next(self.host._sequence), entry)
+                    )
+
+
+class SimulationHost:
+    """
+    Ticks any number of CarPortSimulator instances from a few shared threads.
+
+    Simulators registered with a host must not be started with their own
+    ``start()``; the host drives their ticks instead, so they must use a
+    wall clock. Each simulator is pinned to the least-loaded host thread, and
+    simulators whose deadlines coincide are ticked in round-robin order.
+
+    Args:
+        threads: Number of host threads (caps the total thread count)
+        clock: Wall-clock time source used for tick deadlines
+    """
+
+    def __init__(self, threads: int = 1, clock: Optional[Clock] = None):
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+
+        self.clock = clock or RealTimeClock()
+        self._sequence = itertools.count()
+        self._stop_event = ThreadEvent()
+        self._running = False
+        self._workers = [_HostWorker(self, index) for index in range(threads)]
+        self._assignments: Dict[int, _HostWorker] = {}
+
+    def add(self, simulator, tick_rate: Optional[float] = None):
+        """
+        Register a simulator with the host.
+
+        Args:
+            simulator: CarPortSimulator to drive
+            tick_rate: Tick rate in Hz (defaults to the simulator's base tick rate)
+
+        Raises:
+            ValueError: If the simulator runs on a virtual clock, which the
+                host's wall-clock deadlines would never advance
+        """
+        if simulator.clock.is_virtual:
+            raise ValueError("SimulationHost requires simulators on a wall clock")
+        if simulator._running:
+            raise RuntimeError("Simulator is already running")
+        if id(simulator) in self._assignments:
+            raise ValueError("Simulator is already registered with this host")
+
+        period = 1.0 / tick_rate if tick_rate else simulator.tick_period
+        entry = _HostedSimulator(simulator, period)
+        worker = min(self._workers, key=lambda w: len(w.entries))
+
+        with worker.lock:
+            worker.entries[id(simulator)] = entry
+        self._assignments[id(simulator)] = worker
+
+        if self._running:
+            self._activate(entry, worker)
+
+    def remove(self, simulator):
+        """Unregister a simulator; it stops being ticked immediately."""
+        worker = self._assignments.pop(id(simulator), None)
+        if worker is None:
+            return
+
+        with worker.lock:
+            worker.entries.pop(id(simulator), None)
+        if simulator._running:
+            simulator._running = False
+            simulator.event_bus.publish(Event("simulation_stopped", source="CarPortSimulator"))
+        worker.wakeup.set()
+
+    def start(self):
+        """Start the host threads and all registered simulators."""
+        if self._running:
+            return
+
+        self._running = True
+        self._stop_event.clear()
+
+        for worker in self._workers:
+            for entry in list(worker.entries.values()):
+                self._activate(entry, worker)
+            worker.thread = Thread(target=worker.run, daemon=True)
+            worker.thread.start()
+
+    def stop(self):
+        """Stop the host threads and all registered simulators."""
+        if not self._running:
+            return
+
+        self._running = False
+        self._stop_event.set()
+
+        for worker in self._workers:
+            worker.wakeup.set()
+            if worker.thread:
+                worker.thread.join(timeout=1.0)
+            with worker.lock:
+                worker.queue.clear()
+                entries = list(worker.entries.values())
+            for entry in entries:
+                entry.simulator._running = False
+                entry.simulator.event_bus.publish(
+                    Event("simulation_stopped", source="CarPortSimulator")
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get host statistics, including per-simulator tick counts."""
+        simulators = []
+        for worker in self._workers:
+            with worker.lock:
+                entries = list(worker.entries.values())
+            for entry in entries:
+                simulators.append(
+                    {
+                        "thread": worker.index,
+                        "tick_rate_hz": 1.0 / entry.period,
+                        "ticks": entry.ticks,
+                        "overruns": entry.overruns,
+                    }
+                )
+
+        return {
+            "running": self._running,
+            "threads": len(self._workers),
+            "simulator_count": len(self._assignments),
+            "simulators": simulators,
+        }
+
+    def _activate(self, entry: _HostedSimulator, worker: _HostWorker):
+        """Mark a simulator as running and queue its first tick."""
+        entry.simulator._running = True
+        entry.simulator.event_bus.publish(Event("simulation_started", source="CarPortSimulator"))
+        entry.deadline = self.clock.now()
+        worker.push(entry)
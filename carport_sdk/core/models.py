@@ -2,13 +2,85 @@
 Core data models for the CarPort SDK simulator.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+import time
+from dataclasses import dataclass, fields
+from typing import Dict, Any, NamedTuple, Optional
 from datetime import datetime
 
+_monotonic_ns = time.monotonic_ns
 
+# Offset that maps time.monotonic_ns() onto the Unix epoch, fixed at import
+_MONOTONIC_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+
+
+def monotonic_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a ``time.monotonic_ns()`` timestamp to a local datetime."""
+    return datetime.fromtimestamp((timestamp_ns + _MONOTONIC_EPOCH_NS) / 1e9)
+
+
+def datetime_to_monotonic(timestamp: datetime) -> int:
+    """Convert a datetime to the ``time.monotonic_ns()`` timescale."""
+    return int(timestamp.timestamp() * 1e9) - _MONOTONIC_EPOCH_NS
+
+
+def monotonic_to_epoch_ns(timestamp_ns: int) -> int:
+    """Convert a ``time.monotonic_ns()`` timestamp to Unix epoch nanoseconds."""
+    return timestamp_ns + _MONOTONIC_EPOCH_NS
+
+
+def epoch_to_monotonic_ns(epoch_ns: int) -> int:
+    """Convert Unix epoch nanoseconds to this process's ``time.monotonic_ns()`` scale."""
+    return epoch_ns - _MONOTONIC_EPOCH_NS
+
+
+def slotted(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` instead of a per-instance ``__dict__``.
+
+    Equivalent to ``@dataclass(slots=True)``, which requires Python 3.10.
+    """
+    namespace = dict(cls.__dict__)
+    names = tuple(f.name for f in fields(cls))
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+class Timestamped:
+    """
+    Mixin for slotted models stamped with ``time.monotonic_ns()``.
+
+    Creating a model only records the integer ``timestamp_ns``; the
+    ``timestamp`` datetime is computed on first access and cached. An explicit
+    ``timestamp`` passed to the constructor is kept as given.
+    """
+
+    __slots__ = ()
+
+    def _stamp(self):
+        """Fill in whichever of timestamp/timestamp_ns was not provided."""
+        if self.timestamp is None:
+            # Leave the slot empty so __getattr__ converts it lazily
+            del self.timestamp
+            if self.timestamp_ns is None:
+                self.timestamp_ns = _monotonic_ns()
+        elif self.timestamp_ns is None:
+            self.timestamp_ns = datetime_to_monotonic(self.timestamp)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "timestamp":
+            value = monotonic_to_datetime(self.timestamp_ns)
+            self.timestamp = value
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+@slotted
 @dataclass
-class VehicleState:
+class VehicleState(Timestamped):
     """Represents the current state of the simulated vehicle."""
 
     speed: float = 0.0  # km/h
@@ -16,29 +88,73 @@ class VehicleState:
     heading: float = 0.0  # degrees
     is_stationary: bool = True
     timestamp: datetime = None
+    timestamp_ns: int = None  # time.monotonic_ns() at creation
 
     def __post_init__(self):
         if self.position is None:
             self.position = {"lat": 0.0, "lon": 0.0}
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
-
-
+        self._stamp()
+
+    def freeze(self, sim_time: float = 0.0) -> "VehicleSnapshot":
+        """Capture the current state as an immutable snapshot."""
+        position = self.position
+        return VehicleSnapshot(
+            self.speed,
+            position["lat"],
+            position["lon"],
+            self.heading,
+            self.is_stationary,
+            sim_time,
+            self.timestamp_ns,
+        )
+
+
+class VehicleSnapshot(NamedTuple):
+    """
+    Immutable point-in-time copy of a VehicleState.
+
+    Published in ``vehicle_state_update`` events, so history and telemetry
+    keep the values from the moment of publication.
+    """
+
+    speed: float  # km/h
+    lat: float
+    lon: float
+    heading: float  # degrees
+    is_stationary: bool
+    sim_time: float  # simulation clock time of the snapshot
+    timestamp_ns: int = None  # time.monotonic_ns() of the source VehicleState
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """Creation time of the source VehicleState as a datetime."""
+        if self.timestamp_ns is None:
+            return None
+        return monotonic_to_datetime(self.timestamp_ns)
+
+    @property
+    def position(self) -> Dict[str, float]:
+        """Position in the same form as ``VehicleState.position``."""
+        return {"lat": self.lat, "lon": self.lon}
+
+
+@slotted
 @dataclass
-class SensorData:
+class SensorData(Timestamped):
     """Generic sensor data structure."""
 
     sensor_type: str
     data: Dict[str, Any]
     timestamp: datetime = None
+    timestamp_ns: int = None  # time.monotonic_ns() at creation
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        self._stamp()
 
 
+@slotted
 @dataclass
-class DriverState:
+class DriverState(Timestamped):
     """Driver monitoring state data."""
 
     gaze_direction: str = "forward"  # forward, left, right, down, away
@@ -46,14 +162,15 @@ class DriverState:
     eyes_closed: bool = False
     time_looking_away: float = 0.0  # seconds
     timestamp: datetime = None
+    timestamp_ns: int = None  # time.monotonic_ns() at creation
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        self._stamp()
 
 
+@slotted
 @dataclass
-class ObstacleData:
+class ObstacleData(Timestamped):
     """Obstacle detection data."""
 
     object_type: str  # pedestrian, vehicle, animal, static_object
@@ -62,14 +179,15 @@ class ObstacleData:
     velocity: float = 0.0  # m/s
     confidence: float = 1.0  # 0.0 to 1.0
     timestamp: datetime = None
+    timestamp_ns: int = None  # time.monotonic_ns() at creation
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        self._stamp()
 
 
+@slotted
 @dataclass
-class AlertData:
+class AlertData(Timestamped):
     """Alert/notification data structure."""
 
     alert_type: str
@@ -77,7 +195,7 @@ class AlertData:
     message: str
     source_component: str
     timestamp: datetime = None
+    timestamp_ns: int = None  # time.monotonic_ns() at creation
 
     def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+        self._stamp()
@@ -0,0 +1,145 @@
+"""
+Low-overhead hot-path profiling for the CarPort SDK.
+
+Latencies are recorded into fixed-size logarithmic histograms, so recording is
+a few integer operations and memory use does not grow with run length.
+Instrumented components hold an optional profiler reference and skip all
+timing when it is None, so instrumentation costs close to nothing when
+profiling is disabled.
+"""
+
+import json
+import time
+from threading import Lock
+from typing import Any, Dict
+
+# Each power-of-two range of nanoseconds is split into this many linear sub-buckets
+_SUB_BUCKET_BITS = 2
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_BUCKET_COUNT = 64 * _SUB_BUCKETS
+
+
+def _bucket_index(value_ns: int) -> int:
+    """Map a latency in nanoseconds to its histogram bucket."""
+    if value_ns < _SUB_BUCKETS:
+        return max(0, value_ns)
+    exponent = value_ns.bit_length() - 1
+    mantissa = (value_ns >> (exponent - _SUB_BUCKET_BITS)) & (_SUB_BUCKETS - 1)
+    return (exponent - _SUB_BUCKET_BITS + 1) * _SUB_BUCKETS + mantissa
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """Get the largest latency in nanoseconds that falls into a bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+    exponent = index // _SUB_BUCKETS + _SUB_BUCKET_BITS - 1
+    mantissa = index % _SUB_BUCKETS
+    width = 1 << (exponent - _SUB_BUCKET_BITS)
+    return (1 << exponent) + (mantissa + 1) * width - 1
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear latency histogram with roughly 25% bucket resolution."""
+
+    __slots__ = ("counts", "count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        """Record one latency sample in nanoseconds."""
+        self.counts[_bucket_index(value_ns)] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Get an upper bound for a latency percentile.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.99
+
+        Returns:
+            Latency in nanoseconds (capped at the observed maximum)
+        """
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(_bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the histogram in microseconds."""
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000.0 if self.count else 0.0,
+            "p50_us": self.percentile(0.50) / 1000.0,
+            "p99_us": self.percentile(0.99) / 1000.0,
+            "max_us": self.max_ns / 1000.0,
+        }
+
+
+class Profiler:
+    """
+    Collects latency histograms and counters for instrumented hot paths.
+
+    Timing keys used by the SDK:
+
+    - ``tick``: one ``CarPortSimulator._update_simulation()`` call
+    - ``update:<component>``: one feature ``update()`` (or vehicle state publication)
+    - ``publish:<event_type>``: one ``EventBus.publish()`` including all callbacks
+    - ``callback:<name>``: one subscriber callback invocation
+
+    Counter keys are ``fanout:<event_type>`` (total subscriber deliveries).
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._counters: Dict[str, int] = {}
+
+    @staticmethod
+    def now_ns() -> int:
+        """Get a high-resolution timestamp for latency measurements."""
+        return time.perf_counter_ns()
+
+    def record(self, key: str, elapsed_ns: int):
+        """Record a latency sample for a key."""
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        histogram.record(elapsed_ns)
+
+    def count(self, key: str, amount: int = 1):
+        """Increment a counter."""
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def reset(self):
+        """Discard all collected samples."""
+        with self._lock:
+            self._histograms = {}
+            self._counters = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get latency summaries and counters."""
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+        return {
+            "latency": {key: histograms[key].to_dict() for key in sorted(histograms)},
+            "counters": {key: counters[key] for key in sorted(counters)},
+        }
+
+    def to_json(self, indent: int = None) -> str:
+        """Export the collected statistics as JSON."""
+        return json.dumps(self.get_stats(), indent=indent)
@@ -0,0 +1,236 @@
+"""
+Tick scheduling for the CarPort SDK simulation loop.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from .clock import Clock
+from .profiling import Profiler
+
+
+class FixedStepScheduler:
+    """
+    Deadline-driven fixed-timestep scheduler.
+
+    Tick deadlines lie on an absolute grid (start + n * period), so the cost of
+    the update work does not accumulate into drift. When the loop falls behind,
+    the overrun policy decides what happens to the missed ticks:
+
+    - ``catch_up``: run the missed ticks back to back (at most ``max_catch_up``)
+    - ``skip``: run a single tick and drop the missed ones
+    """
+
+    CATCH_UP = "catch_up"
+    SKIP = "skip"
+
+    def __init__(
+        self, clock: Clock, period: float, policy: str = CATCH_UP, max_catch_up: int = 5
+    ):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if policy not in (self.CATCH_UP, self.SKIP):
+            raise ValueError(f"Unknown overrun policy: {policy}")
+
+        self.clock = clock
+        self.period = period
+        self.policy = policy
+        self.max_catch_up = max(1, max_catch_up)
+        self.reset()
+
+    def set_period(self, period: float):
+        """Change the tick period; the next deadline is kept."""
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+
+    def reset(self):
+        """Restart the deadline grid at the current time and clear statistics."""
+        now = self.clock.now()
+        self._start_time = now
+        self._next_deadline = now
+        self._ticks = 0
+        self._wakeups = 0
+        self._overruns = 0
+        self._skipped_ticks = 0
+        self._jitter_total = 0.0
+        self._jitter_max = 0.0
+        self._last_jitter = 0.0
+
+    def time_until_next(self) -> float:
+        """Get the time in seconds until the next tick deadline."""
+        return max(0.0, self._next_deadline - self.clock.now())
+
+    def due_ticks(self) -> int:
+        """
+        Collect the ticks that are due at the current time.
+
+        Returns:
+            Number of ticks the caller should run now (0 if woken early)
+        """
+        now = self.clock.now()
+        lateness = now - self._next_deadline
+        if lateness < 0:
+            return 0
+
+        due = int(lateness // self.period) + 1
+        self._next_deadline += due * self.period
+
+        self._wakeups += 1
+        self._last_jitter = lateness
+        self._jitter_total += lateness
+        self._jitter_max = max(self._jitter_max, lateness)
+
+        if due > 1:
+            self._overruns += 1
+
+        if self.policy == self.SKIP:
+            ticks = 1
+        else:
+            ticks = min(due, self.max_catch_up)
+
+        self._skipped_ticks += due - ticks
+        self._ticks += ticks
+        return ticks
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler timing statistics."""
+        elapsed = self.clock.now() - self._start_time
+        return {
+            "policy": self.policy,
+            "target_rate_hz": 1.0 / self.period,
+            "achieved_rate_hz": self._ticks / elapsed if elapsed > 0 else 0.0,
+            "ticks": self._ticks,
+            "overruns": self._overruns,
+            "skipped_ticks": self._skipped_ticks,
+            "jitter_last_ms": self._last_jitter * 1000.0,
+            "jitter_mean_ms": (
+                self._jitter_total / self._wakeups * 1000.0 if self._wakeups else 0.0
+            ),
+            "jitter_max_ms": self._jitter_max * 1000.0,
+        }
+
+
+class _RateTask:
+    """A periodic callback registered with a MultiRateScheduler."""
+
+    __slots__ = ("name", "callback", "period", "next_due")
+
+    def __init__(self, name: str, callback: Callable[[], None], period: float):
+        self.name = name
+        self.callback = callback
+        self.period = period
+        self.next_due: Optional[float] = None
+
+
+class MultiRateScheduler:
+    """
+    Runs registered callbacks at individual rates from a single base tick.
+
+    The caller invokes ``run_due()`` once per base tick; each task runs only
+    when its own deadline has been reached. The base tick period is the
+    shortest period of all registered tasks.
+    """
+
+    # Tolerance for floating-point accumulation in simulated time
+    _EPSILON = 1e-6
+
+    def __init__(self, clock: Clock):
+        self.clock = clock
+        self._tasks: List[_RateTask] = []
+        self._task_index: Dict[str, _RateTask] = {}
+        self.profiler: Optional[Profiler] = None
+
+    def add(self, name: str, callback: Callable[[], None], rate_hz: float):
+        """
+        Register a periodic task.
+
+        Args:
+            name: Unique task name
+            callback: Function called without arguments when the task is due
+            rate_hz: Update rate in Hz
+        """
+        if name in self._task_index:
+            raise ValueError(f"Task already registered: {name}")
+        task = _RateTask(name, callback, self._period_for(rate_hz))
+        self._tasks.append(task)
+        self._task_index[name] = task
+
+    def set_rate(self, name: str, rate_hz: float):
+        """Change the update rate of a registered task."""
+        if name not in self._task_index:
+            raise KeyError(f"Unknown task: {name}")
+        task = self._task_index[name]
+        task.period = self._period_for(rate_hz)
+        if task.next_due is not None:
+            task.next_due = min(task.next_due, self.clock.now() + task.period)
+
+    def get_rates(self) -> Dict[str, float]:
+        """Get the update rate in Hz of every registered task."""
+        return {task.name: 1.0 / task.period for task in self._tasks}
+
+    def get_deadlines(self) -> Dict[str, Optional[float]]:
+        """Get the next due time of every task (None if it has not run yet)."""
+        return {task.name: task.next_due for task in self._tasks}
+
+    def set_deadlines(self, deadlines: Dict[str, Optional[float]], time_offset: float = 0.0):
+        """Restore task due times captured by ``get_deadlines()``."""
+        for name, next_due in deadlines.items():
+            task = self._task_index[name]
+            task.next_due = None if next_due is None else next_due + time_offset
+
+    @property
+    def base_period(self) -> float:
+        """Shortest task period, used as the base tick period."""
+        return min(task.period for task in self._tasks)
+
+    def run_due(self, catching_up: bool = False) -> int:
+        """
+        Run every task whose deadline has been reached.
+
+        Args:
+            catching_up: More base ticks follow immediately to make up for
+                missed ones. Late tasks then advance by a single period
+                instead of realigning, so they run again on those ticks.
+
+        Returns:
+            Number of tasks that ran
+        """
+        now = self.clock.now()
+        threshold = now + self._EPSILON
+        profiler = self.profiler
+        ran = 0
+
+        for task in self._tasks:
+            if task.next_due is not None and task.next_due > threshold:
+                continue
+
+            if profiler is None:
+                task.callback()
+            else:
+                started = profiler.now_ns()
+                task.callback()
+                profiler.record(f"update:{task.name}", profiler.now_ns() - started)
+            ran += 1
+
+            if task.next_due is None:
+                task.next_due = now + task.period
+            else:
+                task.next_due += task.period
+                if task.next_due <= threshold and not catching_up:
+                    # Fell behind by more than a period, realign instead of bursting
+                    task.next_due = now + task.period
+
+        return ran
+
+    def run_all(self):
+        """Run every task immediately and restart its period from now."""
+        now = self.clock.now()
+        for task in self._tasks:
+            task.callback()
+            task.next_due = now + task.period
+
+    @staticmethod
+    def _period_for(rate_hz: float) -> float:
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        return 1.0 / rate_hz
@@ -2,11 +2,18 @@
 Main CarPort Simulator class that orchestrates all simulation components.
 """
 
-import time
-from typing import List, Dict, Any
+import copy
+import random
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from threading import Thread, Event as ThreadEvent
 
+from .alerts import AlertLog, AlertPredicate
+from .clock import Clock, RealTimeClock
+from .commands import CommandQueue, DeferredCalls
 from .events import EventBus, Event
+from .profiling import Profiler
+from .scheduler import FixedStepScheduler, MultiRateScheduler
 from .models import VehicleState, AlertData
 from ..features.driver_monitoring import DriverMonitoringSimulator
 from ..features.speed_limiting import SpeedLimitingSimulator
@@ -15,30 +22,96 @@ from ..features.obstacle_detection import ObstacleDetectionSimulator
 from ..features.regulatory_mode import RegulatoryModeSimulator
 
 
+@dataclass(frozen=True)
+class SimulatorSnapshot:
+    """Point-in-time copy of the complete state of a CarPortSimulator."""
+
+    sim_time: float
+    tick_count: int
+    vehicle_state: VehicleState
+    features: Dict[str, Dict[str, Any]]
+    feature_deadlines: Dict[str, Optional[float]]
+    rng_state: Tuple
+    alerts: Tuple[AlertData, ...]
+
+
 class CarPortSimulator:
     """
     Main simulation engine for the CarPort SDK.
 
     Orchestrates all Drive Pilot feature simulators and provides
     a unified interface for testing autonomous driving features.
+
+    Args:
+        clock: Time source shared by all components (defaults to wall-clock time).
+            Pass a ``VirtualClock`` to run scenarios faster than real time.
+        timestep: Default update period in seconds for the vehicle state and
+            every feature simulator
+        feature_rates: Optional per-component update rates in Hz, keyed by
+            ``"vehicle_state"`` or a feature attribute name such as
+            ``"driver_monitoring"``
+        overrun_policy: What the background loop does with missed ticks when it
+            falls behind, ``"catch_up"`` or ``"skip"``
+        max_catch_up: Maximum number of missed ticks run back to back
+        seed: Seed for the simulator's random number generator, for
+            reproducible sensor noise and obstacle placement
     """
 
-    def __init__(self):
-        self.event_bus = EventBus()
+    FEATURES = (
+        "driver_monitoring",
+        "speed_limiting",
+        "ota_updates",
+        "obstacle_detection",
+        "regulatory_mode",
+    )
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        timestep: float = 0.1,
+        feature_rates: Optional[Dict[str, float]] = None,
+        overrun_policy: str = FixedStepScheduler.CATCH_UP,
+        max_catch_up: int = 5,
+        seed: Optional[int] = None,
+    ):
+        self.clock = clock or RealTimeClock()
+        self.timestep = timestep
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self._scheduler = FixedStepScheduler(self.clock, timestep, overrun_policy, max_catch_up)
+        self.event_bus = EventBus(self.clock)
         self.vehicle_state = VehicleState()
         self._running = False
         self._stop_event = ThreadEvent()
         self._simulation_thread = None
+        self._tick_count = 0
+        self._profiler: Optional[Profiler] = None
+        self._tick_listeners: Tuple[Callable[["CarPortSimulator"], None], ...] = ()
+
+        # API calls staged from other threads, applied at the start of each tick
+        self.commands = CommandQueue(self)
+        self.deferred = DeferredCalls(self.commands)
 
         # Initialize feature simulators
-        self.driver_monitoring = DriverMonitoringSimulator(self.event_bus)
-        self.speed_limiting = SpeedLimitingSimulator(self.event_bus)
-        self.ota_updates = OTAUpdateSimulator(self.event_bus)
-        self.obstacle_detection = ObstacleDetectionSimulator(self.event_bus)
-        self.regulatory_mode = RegulatoryModeSimulator(self.event_bus)
+        self.driver_monitoring = DriverMonitoringSimulator(self.event_bus, self.clock)
+        self.speed_limiting = SpeedLimitingSimulator(self.event_bus, self.clock)
+        self.ota_updates = OTAUpdateSimulator(self.event_bus, self.clock)
+        self.obstacle_detection = ObstacleDetectionSimulator(
+            self.event_bus, self.clock, self.rng
+        )
+        self.regulatory_mode = RegulatoryModeSimulator(self.event_bus, self.clock)
+
+        # Run each component at its own rate from a single base tick
+        self._feature_scheduler = MultiRateScheduler(self.clock)
+        self._feature_scheduler.add("vehicle_state", self._publish_vehicle_state, 1.0 / timestep)
+        for name in self.FEATURES:
+            self._feature_scheduler.add(name, self._feature_updater(name), 1.0 / timestep)
+        for name, rate_hz in (feature_rates or {}).items():
+            self._feature_scheduler.set_rate(name, rate_hz)
+        self._scheduler.set_period(self._feature_scheduler.base_period)
 
         # Track alerts
-        self._alerts: List[AlertData] = []
+        self.alert_log = AlertLog()
 
         # Subscribe to alert events
         self.event_bus.subscribe("alert", self._handle_alert)
@@ -72,42 +145,206 @@ class CarPortSimulator:
 
     def _simulation_loop(self):
         """Main simulation loop running in a separate thread."""
+        self._scheduler.reset()
+
         while self._running and not self._stop_event.is_set():
-            # Update simulation state
+            # Wait for the next absolute tick deadline
+            self.clock.sleep(self._scheduler.time_until_next(), self._stop_event)
+            if self._stop_event.is_set():
+                break
+
+            self._run_due_ticks()
+
+    def step(self, n: int = 1):
+        """
+        Advance the simulation by a number of base ticks.
+
+        The base tick period is the shortest component update period. With a
+        ``VirtualClock`` this runs as fast as the CPU allows; with the default
+        wall clock each step waits for one real tick period.
+
+        Args:
+            n: Number of base ticks to simulate
+        """
+        if self._running:
+            raise RuntimeError("Cannot step a simulation that is running in its own thread")
+
+        tick_period = self.tick_period
+        for _ in range(n):
+            self.clock.sleep(tick_period)
             self._update_simulation()
 
-            # Sleep for simulation timestep (100ms)
-            time.sleep(0.1)
+    def run_for(self, sim_seconds: float):
+        """
+        Advance the simulation by a span of simulated time.
 
-    def _update_simulation(self):
-        """Update simulation state and publish vehicle state event."""
-        # Publish current vehicle state
-        self.event_bus.publish(
-            Event("vehicle_state_update", data=self.vehicle_state, source="CarPortSimulator")
+        Args:
+            sim_seconds: Simulated duration in seconds
+        """
+        self.step(int(round(sim_seconds / self.tick_period)))
+
+    @property
+    def tick_period(self) -> float:
+        """Base tick period in seconds (the shortest component update period)."""
+        return self._feature_scheduler.base_period
+
+    def set_feature_rate(self, name: str, rate_hz: float):
+        """
+        Set the update rate of a single component.
+
+        Args:
+            name: ``"vehicle_state"`` or a feature name such as ``"driver_monitoring"``
+            rate_hz: Update rate in Hz
+        """
+        self._feature_scheduler.set_rate(name, rate_hz)
+        self._scheduler.set_period(self._feature_scheduler.base_period)
+
+    def get_feature_rates(self) -> Dict[str, float]:
+        """Get the update rate in Hz of every component."""
+        return self._feature_scheduler.get_rates()
+
+    def _run_due_ticks(self):
+        """Run every tick that is due under the overrun policy."""
+        ticks = self._scheduler.due_ticks()
+        for i in range(ticks):
+            # Every tick but the last makes up for a missed one
+            self._update_simulation(i < ticks - 1)
+
+    def _update_simulation(self, catching_up: bool = False):
+        """
+        Run one base tick, updating every component that is due.
+
+        Args:
+            catching_up: The tick makes up for a missed one and more follow
+                immediately, see ``MultiRateScheduler.run_due()``
+        """
+        self._run_tick(self._feature_scheduler.run_due, catching_up)
+
+    def _run_tick(self, run_components: Callable[..., Any], *args):
+        """
+        Run one tick: apply staged commands, update components, notify listeners.
+
+        Shared by every execution mode so commands and tick listeners behave
+        the same whichever engine drives the simulator.
+
+        Args:
+            run_components: Scheduler call that updates the components
+            *args: Arguments for ``run_components``
+        """
+        self.commands.apply_pending()
+        self._tick_count += 1
+        if self._profiler is None:
+            run_components(*args)
+            self._notify_tick_listeners()
+        else:
+            started = self._profiler.now_ns()
+            run_components(*args)
+            self._notify_tick_listeners()
+            self._profiler.record("tick", self._profiler.now_ns() - started)
+
+    def add_tick_listener(self, callback: Callable[["CarPortSimulator"], None]):
+        """
+        Call a function at the end of every tick, after all due components ran.
+
+        Args:
+            callback: Function called with the simulator
+        """
+        self._tick_listeners = self._tick_listeners + (callback,)
+
+    def remove_tick_listener(self, callback: Callable[["CarPortSimulator"], None]):
+        """Stop calling a function added with ``add_tick_listener()``."""
+        self._tick_listeners = tuple(
+            listener for listener in self._tick_listeners if listener != callback
         )
 
-        # Update all feature simulators
-        self.driver_monitoring.update(self.vehicle_state)
-        self.speed_limiting.update(self.vehicle_state)
-        self.ota_updates.update(self.vehicle_state)
-        self.obstacle_detection.update(self.vehicle_state)
-        self.regulatory_mode.update(self.vehicle_state)
+    def _notify_tick_listeners(self):
+        for listener in self._tick_listeners:
+            try:
+                listener(self)
+            except Exception as e:
+                # Log error but keep the simulation running
+                print(f"Error in tick listener: {e}")
+
+    def enable_profiling(self) -> Profiler:
+        """
+        Enable hot-path latency profiling.
+
+        Instruments ticks, every component update, event publication and each
+        subscriber callback. Results appear under ``get_status()["profiling"]``.
+
+        Returns:
+            The active profiler, e.g. for ``to_json()`` export
+        """
+        if self._profiler is None:
+            self._profiler = Profiler()
+            self._feature_scheduler.profiler = self._profiler
+            self.event_bus.set_profiler(self._profiler)
+        return self._profiler
+
+    def disable_profiling(self):
+        """Disable profiling and drop collected samples."""
+        self._profiler = None
+        self._feature_scheduler.profiler = None
+        self.event_bus.set_profiler(None)
+
+    def _feature_updater(self, name: str):
+        """Build the scheduler callback that updates one feature simulator."""
+        feature = getattr(self, name)
+
+        def update():
+            feature.update(self.vehicle_state)
+
+        return update
+
+    def _publish_vehicle_state(self):
+        """Publish the current vehicle state."""
+        self.event_bus.publish(
+            Event(
+                "vehicle_state_update",
+                data=self.vehicle_state.freeze(self.clock.now()),
+                source="CarPortSimulator",
+            )
+        )
 
     def _handle_alert(self, event: Event):
         """Handle alert events from feature simulators."""
         if isinstance(event.data, AlertData):
-            self._alerts.append(event.data)
+            self.alert_log.append(event.data)
 
     def get_alerts(self, clear: bool = False) -> List[AlertData]:
         """Get current alerts, optionally clearing them."""
-        alerts = self._alerts.copy()
-        if clear:
-            self._alerts.clear()
-        return alerts
+        return self.alert_log.get_all(clear)
 
     def clear_alerts(self):
         """Clear all current alerts."""
-        self._alerts.clear()
+        self.alert_log.clear()
+
+    def alerts_since(self, cursor: int = 0) -> Tuple[List[AlertData], int]:
+        """
+        Get only the alerts raised after a cursor.
+
+        Args:
+            cursor: Value returned by the previous call (0 for all alerts)
+
+        Returns:
+            (alerts, cursor): New alerts, and the cursor for the next call
+        """
+        return self.alert_log.alerts_since(cursor)
+
+    def wait_for_alert(
+        self, predicate: Optional[AlertPredicate] = None, timeout: Optional[float] = None
+    ) -> Optional[AlertData]:
+        """
+        Block until a current or future alert matches a predicate.
+
+        Args:
+            predicate: Condition the alert must meet (default: any alert)
+            timeout: Maximum wait in wall-clock seconds
+
+        Returns:
+            The first matching alert, or None on timeout
+        """
+        return self.alert_log.wait_for_alert(predicate, timeout)
 
     def set_vehicle_position(self, latitude: float, longitude: float):
         """Set vehicle position for testing geofencing features."""
@@ -118,12 +355,65 @@ class CarPortSimulator:
         self.vehicle_state.speed = speed
         self.vehicle_state.is_stationary = speed < 1.0
 
+    def snapshot(self) -> SimulatorSnapshot:
+        """
+        Capture the complete simulation state.
+
+        Covers the vehicle state, every feature simulator's internal state, the
+        scheduler deadlines, the random number generator and recorded alerts.
+        The event history is not included. Immutable values such as alerts are
+        shared with the live simulator rather than copied.
+        """
+        vehicle_state = copy.copy(self.vehicle_state)
+        vehicle_state.position = dict(self.vehicle_state.position)
+
+        return SimulatorSnapshot(
+            sim_time=self.clock.now(),
+            tick_count=self._tick_count,
+            vehicle_state=vehicle_state,
+            features={name: getattr(self, name).snapshot() for name in self.FEATURES},
+            feature_deadlines=self._feature_scheduler.get_deadlines(),
+            rng_state=self.rng.getstate(),
+            alerts=tuple(self.alert_log.get_all()),
+        )
+
+    def restore(self, snapshot: SimulatorSnapshot):
+        """
+        Restore state captured by ``snapshot()``.
+
+        A snapshot can be restored any number of times, so a shared scenario
+        prefix can branch into many variants. With a ``VirtualClock`` the clock
+        is rewound to the snapshot time; with a wall clock, captured clock
+        readings are shifted to the present instead.
+        """
+        if self.clock.is_virtual:
+            self.clock.reset(snapshot.sim_time)
+            time_offset = 0.0
+        else:
+            time_offset = self.clock.now() - snapshot.sim_time
+
+        self._tick_count = snapshot.tick_count
+        for field_name in ("speed", "heading", "is_stationary", "timestamp", "timestamp_ns"):
+            setattr(self.vehicle_state, field_name, getattr(snapshot.vehicle_state, field_name))
+        self.vehicle_state.position = dict(snapshot.vehicle_state.position)
+
+        for name in self.FEATURES:
+            getattr(self, name).restore(snapshot.features[name], time_offset)
+        self._feature_scheduler.set_deadlines(snapshot.feature_deadlines, time_offset)
+        self.rng.setstate(snapshot.rng_state)
+        self.alert_log.restore(snapshot.alerts)
+
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive simulation status."""
         return {
             "running": self._running,
-            "vehicle_state": self.vehicle_state,
-            "alert_count": len(self._alerts),
+            "sim_time": self.clock.now(),
+            "tick_count": self._tick_count,
+            "scheduler": self._scheduler.get_stats(),
+            "feature_rates": self.get_feature_rates(),
+            "profiling": self._profiler.get_stats() if self._profiler else None,
+            "vehicle_state": self.vehicle_state.freeze(self.clock.now()),
+            "alert_count": len(self.alert_log),
             "features": {
                 "driver_monitoring": self.driver_monitoring.get_status(),
                 "speed_limiting": self.speed_limiting.get_status(),
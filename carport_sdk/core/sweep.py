@@ -0,0 +1,192 @@
+"""
+Parameter sweep runner for CarPort SDK scenarios.
+
+Fans scenarios out across a process pool. Every scenario runs on its own
+virtual-clock simulator with a seed derived from the sweep's base seed and the
+scenario index, so results are reproducible regardless of which worker picks
+up which scenario. Workers send back compact result records instead of whole
+simulators.
+"""
+
+import itertools
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from .clock import VirtualClock
+from .events import Event
+from .models import AlertData
+from .simulator import CarPortSimulator
+
+# Scenario callables receive a fresh simulator plus one parameter combination
+# as keyword arguments. They return a pass/fail bool, a dict of metrics
+# (optionally including "passed"), or None.
+Scenario = Callable[..., Any]
+
+
+@dataclass
+class SweepResult:
+    """Compact result record for one scenario of a sweep."""
+
+    index: int
+    params: Dict[str, Any]
+    seed: int
+    passed: Optional[bool] = None
+    alert_counts: Dict[str, int] = field(default_factory=dict)
+    reaction_times: Dict[str, float] = field(default_factory=dict)  # sim seconds to first alert
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    sim_time: float = 0.0
+    wall_time: float = 0.0
+    error: Optional[str] = None
+
+
+def expand_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into every parameter combination.
+
+    Args:
+        grid: Mapping of parameter name to the values to sweep
+
+    Returns:
+        One dict per combination, in row-major order
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def run_scenario(
+    scenario: Scenario, index: int, params: Dict[str, Any], seed: int, timestep: float = 0.1
+) -> SweepResult:
+    """
+    Run a single scenario on a fresh virtual-clock simulator.
+
+    This is the unit of work executed by sweep workers. Exceptions raised by
+    the scenario are captured in the result instead of propagating.
+    """
+    simulator = CarPortSimulator(clock=VirtualClock(), timestep=timestep, seed=seed)
+    result = SweepResult(index=index, params=params, seed=seed)
+    start_time = simulator.clock.now()
+
+    def record_alert(event: Event):
+        if isinstance(event.data, AlertData):
+            alert_type = event.data.alert_type
+            result.alert_counts[alert_type] = result.alert_counts.get(alert_type, 0) + 1
+            if alert_type not in result.reaction_times:
+                result.reaction_times[alert_type] = simulator.clock.now() - start_time
+
+    simulator.event_bus.subscribe("alert", record_alert)
+
+    started = time.perf_counter()
+    try:
+        outcome = scenario(simulator, **params)
+    except Exception as e:
+        result.passed = False
+        result.error = f"{type(e).__name__}: {e}"
+    else:
+        if isinstance(outcome, dict):
+            outcome = dict(outcome)
+            passed = outcome.pop("passed", None)
+            result.passed = None if passed is None else bool(passed)
+            result.metrics = outcome
+        elif outcome is not None:
+            result.passed = bool(outcome)
+
+    result.wall_time = time.perf_counter() - started
+    result.sim_time = simulator.clock.now() - start_time
+    return result
+
+
+class ScenarioSweep:
+    """
+    Runs a scenario over a parameter grid on a process pool.
+
+    Args:
+        scenario: Module-level function ``scenario(simulator, **params)``; it
+            must be picklable so worker processes can import it
+        grid: Mapping of parameter name to the values to sweep
+        workers: Number of worker processes (defaults to the CPU count);
+            ``0`` runs every scenario inline in the calling process
+        base_seed: Seed from which every scenario seed is derived
+        timestep: Simulation timestep passed to each simulator
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        grid: Dict[str, Sequence[Any]],
+        workers: Optional[int] = None,
+        base_seed: int = 0,
+        timestep: float = 0.1,
+    ):
+        self.scenario = scenario
+        self.grid = grid
+        self.workers = workers
+        self.base_seed = base_seed
+        self.timestep = timestep
+
+    def combinations(self) -> List[Dict[str, Any]]:
+        """Get every parameter combination of the sweep."""
+        return expand_grid(self.grid)
+
+    def run(self) -> Iterator[SweepResult]:
+        """
+        Run the sweep, yielding results as scenarios complete.
+
+        Results arrive in completion order; use ``SweepResult.index`` to
+        restore grid order.
+        """
+        combinations = self.combinations()
+
+        if self.workers == 0:
+            for index, params in enumerate(combinations):
+                yield run_scenario(
+                    self.scenario, index, params, self._seed_for(index), self.timestep
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(
+                    run_scenario,
+                    self.scenario,
+                    index,
+                    params,
+                    self._seed_for(index),
+                    self.timestep,
+                )
+                for index, params in enumerate(combinations)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def run_all(self) -> List[SweepResult]:
+        """Run the sweep and return every result in grid order."""
+        return sorted(self.run(), key=lambda result: result.index)
+
+    def _seed_for(self, index: int) -> int:
+        """Derive a reproducible per-scenario seed."""
+        return random.Random(self.base_seed * 1_000_003 + index).getrandbits(32)
+
+
+def summarize(results: Sequence[SweepResult]) -> Dict[str, Any]:
+    """
+    Aggregate sweep results.
+
+    Returns:
+        Dict with pass/fail/error counts and total alert counts per alert type
+    """
+    alert_totals: Dict[str, int] = {}
+    for result in results:
+        for alert_type, count in result.alert_counts.items():
+            alert_totals[alert_type] = alert_totals.get(alert_type, 0) + count
+
+    return {
+        "total": len(results),
+        "passed": sum(1 for r in results if r.passed is True),
+        "failed": sum(1 for r in results if r.passed is False),
+        "errors": sum(1 for r in results if r.error is not None),
+        "alert_counts": alert_totals,
+        "wall_time": sum(r.wall_time for r in results),
+    }
@@ -6,8 +6,10 @@ Implements the test cases from the Drive Pilot specification:
 - TC-601.1: Driver looks away >5 sec → escalating alerts
 """
 
-import time
-from typing import Dict, Any
+import copy
+from dataclasses import replace
+from typing import Dict, Any, Optional
+from ..core.clock import Clock, RealTimeClock
 from ..core.events import EventBus, Event
 from ..core.models import VehicleState, DriverState, AlertData
 
@@ -22,13 +24,14 @@ class DriverMonitoringSimulator:
     - GDPR compliance simulation
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, clock: Optional[Clock] = None):
         self.event_bus = event_bus
+        self.clock = clock or RealTimeClock()
         self.driver_state = DriverState()
         self.alert_threshold = 5.0  # seconds
         self.enabled = True
         self._time_looking_away = 0.0
-        self._last_update_time = time.time()
+        self._last_update_time = self.clock.now()
         self._alert_level = 0  # 0=none, 1=visual, 2=audible, 3=haptic
 
     def set_alert_threshold(self, threshold: float):
@@ -83,7 +86,7 @@ class DriverMonitoringSimulator:
         if not self.enabled:
             return
 
-        current_time = time.time()
+        current_time = self.clock.now()
         delta_time = current_time - self._last_update_time
         self._last_update_time = current_time
 
@@ -97,9 +100,23 @@ class DriverMonitoringSimulator:
 
         # Publish driver state update
         self.event_bus.publish(
-            Event("driver_state_update", data=self.driver_state, source="DriverMonitoringSimulator")
+            Event(
+                "driver_state_update",
+                data=replace(self.driver_state, timestamp=None, timestamp_ns=None),
+                source="DriverMonitoringSimulator",
+            )
         )
 
+    def next_event_time(self, vehicle_state: VehicleState) -> Optional[float]:
+        """Get the simulation time of the next alert escalation, if any."""
+        if not self.enabled or self.driver_state.gaze_direction == "forward":
+            return None
+        if self._alert_level >= 3:
+            return None
+
+        remaining = self.alert_threshold * (self._alert_level + 1) - self._time_looking_away
+        return self._last_update_time + max(0.0, remaining)
+
     def _check_alert_conditions(self):
         """Check if alert conditions are met and escalate accordingly."""
         if not self.enabled:
@@ -136,6 +153,32 @@ class DriverMonitoringSimulator:
         """Reset alert state."""
         self._alert_level = 0
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the complete simulation state of driver monitoring."""
+        return {
+            "enabled": self.enabled,
+            "alert_threshold": self.alert_threshold,
+            "driver_state": copy.copy(self.driver_state),
+            "time_looking_away": self._time_looking_away,
+            "last_update_time": self._last_update_time,
+            "alert_level": self._alert_level,
+        }
+
+    def restore(self, state: Dict[str, Any], time_offset: float = 0.0):
+        """
+        Restore state captured by ``snapshot()``.
+
+        Args:
+            state: Snapshot to restore
+            time_offset: Amount to shift captured clock readings by
+        """
+        self.enabled = state["enabled"]
+        self.alert_threshold = state["alert_threshold"]
+        self.driver_state = copy.copy(state["driver_state"])
+        self._time_looking_away = state["time_looking_away"]
+        self._last_update_time = state["last_update_time"] + time_offset
+        self._alert_level = state["alert_level"]
+
     def get_status(self) -> Dict[str, Any]:
         """Get current status of driver monitoring."""
         return {
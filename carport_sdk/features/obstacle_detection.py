@@ -8,10 +8,12 @@ Implements the test cases from the Drive Pilot specification:
 - TC-604.3: Static object → navigate around
 """
 
-import time
+import copy
 import math
 import random
-from typing import Dict, Any, List
+from dataclasses import replace
+from typing import Dict, Any, List, Optional
+from ..core.clock import Clock, RealTimeClock
 from ..core.events import EventBus, Event
 from ..core.models import VehicleState, ObstacleData, AlertData
 
@@ -28,13 +30,21 @@ class ObstacleDetectionSimulator:
     - Performance benchmarking
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(
+        self,
+        event_bus: EventBus,
+        clock: Optional[Clock] = None,
+        rng: Optional[random.Random] = None,
+    ):
         self.event_bus = event_bus
+        self.clock = clock or RealTimeClock()
+        self._rng = rng or random.Random()
         self.enabled = True
         self.detection_range = 100.0  # meters
         self.confidence_threshold = 0.7
         self._obstacles: List[ObstacleData] = []
         self._sensor_fusion_enabled = True
+        self._last_update_time = self.clock.now()
 
         # Sensor characteristics
         self._sensor_ranges = {
@@ -98,7 +108,7 @@ class ObstacleDetectionSimulator:
             crossing: Whether pedestrian is crossing the road
         """
         velocity = 1.4 if crossing else 0.0  # m/s walking speed
-        bearing = 0.0 if crossing else random.uniform(-45, 45)
+        bearing = 0.0 if crossing else self._rng.uniform(-45, 45)
 
         self.add_obstacle("pedestrian", distance, bearing, velocity)
 
@@ -116,8 +126,8 @@ class ObstacleDetectionSimulator:
         obstacle = ObstacleData(
             object_type="animal",
             distance=distance,
-            bearing=random.uniform(-30, 30),
-            velocity=random.uniform(0.5, 3.0),  # Variable animal movement
+            bearing=self._rng.uniform(-30, 30),
+            velocity=self._rng.uniform(0.5, 3.0),  # Variable animal movement
             confidence=self._calculate_fusion_confidence(distance, "animal") * confidence_modifier,
         )
 
@@ -154,18 +164,40 @@ class ObstacleDetectionSimulator:
             self.event_bus.publish(
                 Event(
                     "obstacles_detected",
-                    data=self._obstacles.copy(),
+                    data=[
+                        replace(obstacle, timestamp=None, timestamp_ns=None)
+                        for obstacle in self._obstacles
+                    ],
                     source="ObstacleDetectionSimulator",
                 )
             )
 
+    def next_event_time(self, vehicle_state: VehicleState) -> Optional[float]:
+        """Get the simulation time at which the next obstacle leaves detection range."""
+        if not self.enabled or not self._obstacles:
+            return None
+
+        vehicle_velocity = vehicle_state.speed / 3.6
+        exit_times = []
+        for obstacle in self._obstacles:
+            relative_velocity = vehicle_velocity - obstacle.velocity
+            if relative_velocity > 0:
+                exit_times.append((self.detection_range - obstacle.distance) / relative_velocity)
+            elif relative_velocity < 0:
+                exit_times.append(obstacle.distance / -relative_velocity)
+
+        if not exit_times:
+            return None
+        return self._last_update_time + max(0.0, min(exit_times))
+
     def _update_obstacle_positions(self, vehicle_state: VehicleState):
         """Update obstacle positions based on vehicle movement."""
+        current_time = self.clock.now()
+        time_delta = current_time - self._last_update_time
+        self._last_update_time = current_time
+
         # Simplified position update - in reality this would use Kalman filtering
         for obstacle in self._obstacles:
-            # Simulate relative movement
-            time_delta = 0.1  # 100ms simulation step
-
             # Update distance based on relative velocities
             relative_velocity = vehicle_state.speed / 3.6 - obstacle.velocity  # Convert km/h to m/s
             obstacle.distance += relative_velocity * time_delta
@@ -198,7 +230,7 @@ class ObstacleDetectionSimulator:
         base_confidence *= type_modifiers.get(object_type, 0.7)
 
         # Add some sensor fusion noise
-        noise = random.uniform(-0.1, 0.1)
+        noise = self._rng.uniform(-0.1, 0.1)
         return max(0.0, min(1.0, base_confidence + noise))
 
     def _process_obstacle_detection(self, obstacle: ObstacleData, is_night: bool = False):
@@ -271,6 +303,32 @@ class ObstacleDetectionSimulator:
         """Clear all detected obstacles."""
         self._obstacles.clear()
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the complete simulation state of obstacle detection."""
+        return {
+            "enabled": self.enabled,
+            "detection_range": self.detection_range,
+            "confidence_threshold": self.confidence_threshold,
+            "sensor_fusion_enabled": self._sensor_fusion_enabled,
+            "obstacles": [copy.copy(obstacle) for obstacle in self._obstacles],
+            "last_update_time": self._last_update_time,
+        }
+
+    def restore(self, state: Dict[str, Any], time_offset: float = 0.0):
+        """
+        Restore state captured by ``snapshot()``.
+
+        Args:
+            state: Snapshot to restore
+            time_offset: Amount to shift captured clock readings by
+        """
+        self.enabled = state["enabled"]
+        self.detection_range = state["detection_range"]
+        self.confidence_threshold = state["confidence_threshold"]
+        self._sensor_fusion_enabled = state["sensor_fusion_enabled"]
+        self._obstacles = [copy.copy(obstacle) for obstacle in state["obstacles"]]
+        self._last_update_time = state["last_update_time"] + time_offset
+
     def get_status(self) -> Dict[str, Any]:
         """Get current obstacle detection status."""
         return {
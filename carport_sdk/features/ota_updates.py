@@ -8,10 +8,10 @@ Implements the test cases from the Drive Pilot specification:
 - TC-603.3: Simulate failure → rollback
 """
 
-import time
 import hashlib
 from enum import Enum
 from typing import Dict, Any, Optional
+from ..core.clock import Clock, RealTimeClock
 from ..core.events import EventBus, Event
 from ..core.models import VehicleState, AlertData
 
@@ -38,16 +38,21 @@ class OTAUpdateSimulator:
     - Update progress tracking
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, clock: Optional[Clock] = None):
         self.event_bus = event_bus
+        self.clock = clock or RealTimeClock()
         self.enabled = True
         self.status = UpdateStatus.IDLE
         self.current_version = "1.0.0"
         self.backup_version = "1.0.0"
         self.progress = 0.0  # 0.0 to 1.0
         self._update_start_time = None
+        self._phase_start_time = None
+        self._simulate_failure = False
         self._simulated_bandwidth = 1.0  # MB/s
         self._package_size = 100.0  # MB
+        self._validation_time = 2.0  # seconds
+        self._install_time = 10.0  # seconds
 
         # Simulated security keys
         self._valid_signatures = {"2.0.0": "sha256:abc123def456", "1.1.0": "sha256:fed456cba321"}
@@ -101,7 +106,8 @@ class OTAUpdateSimulator:
         # Start update process
         self.status = UpdateStatus.DOWNLOADING
         self.progress = 0.0
-        self._update_start_time = time.time()
+        self._update_start_time = self.clock.now()
+        self._phase_start_time = self._update_start_time
         self._simulate_failure = simulate_failure
 
         self._notify_update_status(f"Starting update to version {version}")
@@ -134,49 +140,61 @@ class OTAUpdateSimulator:
         if self._update_start_time is None:
             return
 
-        elapsed = time.time() - self._update_start_time
-        download_time = self._package_size / self._simulated_bandwidth
-
-        self.progress = min(1.0, elapsed / download_time)
+        self.progress = min(1.0, self._phase_elapsed() / self._download_time())
 
         if self.progress >= 1.0:
-            self.status = UpdateStatus.VALIDATING
-            self.progress = 0.0
+            self._enter_phase(UpdateStatus.VALIDATING)
             self._notify_update_status("Download complete, validating package")
 
     def _update_validation(self):
         """Update package validation simulation."""
-        # Simulate validation taking 2 seconds
-        if self.progress == 0.0:
-            self._validation_start = time.time()
-
-        elapsed = time.time() - self._validation_start
-        self.progress = min(1.0, elapsed / 2.0)
+        self.progress = min(1.0, self._phase_elapsed() / self._validation_time)
 
         if self.progress >= 1.0:
-            if hasattr(self, "_simulate_failure") and self._simulate_failure:
+            if self._simulate_failure:
                 self._trigger_rollback("Package validation failed")
             else:
-                self.status = UpdateStatus.INSTALLING
-                self.progress = 0.0
+                self._enter_phase(UpdateStatus.INSTALLING)
                 self._notify_update_status("Validation complete, installing update")
 
     def _update_installation(self):
         """Update installation progress simulation."""
-        if not hasattr(self, "_install_start"):
-            self._install_start = time.time()
-
-        elapsed = time.time() - self._install_start
-        install_time = 10.0  # 10 seconds to install
-
-        self.progress = min(1.0, elapsed / install_time)
+        self.progress = min(1.0, self._phase_elapsed() / self._install_time)
 
         if self.progress >= 1.0:
-            if hasattr(self, "_simulate_failure") and self._simulate_failure:
+            if self._simulate_failure:
                 self._trigger_rollback("Installation failed")
             else:
                 self._complete_update()
 
+    def next_event_time(self, vehicle_state: VehicleState) -> Optional[float]:
+        """Get the simulation time at which the current update phase completes."""
+        if not self.enabled or self._phase_start_time is None:
+            return None
+
+        phase_durations = {
+            UpdateStatus.DOWNLOADING: self._download_time(),
+            UpdateStatus.VALIDATING: self._validation_time,
+            UpdateStatus.INSTALLING: self._install_time,
+        }
+        if self.status not in phase_durations:
+            return None
+        return self._phase_start_time + phase_durations[self.status]
+
+    def _download_time(self) -> float:
+        """Get simulated package download duration in seconds."""
+        return self._package_size / self._simulated_bandwidth
+
+    def _enter_phase(self, status: UpdateStatus):
+        """Switch to a new update phase and restart its timer."""
+        self.status = status
+        self.progress = 0.0
+        self._phase_start_time = self.clock.now()
+
+    def _phase_elapsed(self) -> float:
+        """Get simulated time spent in the current update phase."""
+        return self.clock.now() - self._phase_start_time
+
     def _complete_update(self):
         """Complete the update successfully."""
         self.backup_version = self.current_version
@@ -234,6 +252,40 @@ class OTAUpdateSimulator:
         )
         self.event_bus.publish(Event("alert", data=alert, source="OTAUpdateSimulator"))
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the complete simulation state of the OTA update system."""
+        return {
+            "enabled": self.enabled,
+            "status": self.status,
+            "current_version": self.current_version,
+            "backup_version": self.backup_version,
+            "progress": self.progress,
+            "update_start_time": self._update_start_time,
+            "phase_start_time": self._phase_start_time,
+            "simulate_failure": self._simulate_failure,
+            "simulated_bandwidth": self._simulated_bandwidth,
+            "package_size": self._package_size,
+        }
+
+    def restore(self, state: Dict[str, Any], time_offset: float = 0.0):
+        """
+        Restore state captured by ``snapshot()``.
+
+        Args:
+            state: Snapshot to restore
+            time_offset: Amount to shift captured clock readings by
+        """
+        self.enabled = state["enabled"]
+        self.status = state["status"]
+        self.current_version = state["current_version"]
+        self.backup_version = state["backup_version"]
+        self.progress = state["progress"]
+        self._update_start_time = _shift(state["update_start_time"], time_offset)
+        self._phase_start_time = _shift(state["phase_start_time"], time_offset)
+        self._simulate_failure = state["simulate_failure"]
+        self._simulated_bandwidth = state["simulated_bandwidth"]
+        self._package_size = state["package_size"]
+
     def get_status(self) -> Dict[str, Any]:
         """Get current OTA update status."""
         return {
@@ -244,3 +296,8 @@ class OTAUpdateSimulator:
             "progress": self.progress,
             "bandwidth_mbps": self._simulated_bandwidth,
         }
+
+
+def _shift(timestamp: Optional[float], offset: float) -> Optional[float]:
+    """Shift an optional clock reading by an offset."""
+    return None if timestamp is None else timestamp + offset
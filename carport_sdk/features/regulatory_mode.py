@@ -8,6 +8,7 @@ Implements the test cases from the Drive Pilot specification:
 """
 
 from typing import Dict, Any, List, Optional
+from ..core.clock import Clock, RealTimeClock
 from ..core.events import EventBus, Event
 from ..core.models import VehicleState, AlertData
 
@@ -36,8 +37,9 @@ class RegulatoryModeSimulator:
     - Regulatory database simulation
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, clock: Optional[Clock] = None):
         self.event_bus = event_bus
+        self.clock = clock or RealTimeClock()
         self.enabled = True
         self.current_region = None
         self._initialize_regions()
@@ -205,6 +207,10 @@ class RegulatoryModeSimulator:
             if lat != 0.0 or lon != 0.0:
                 self.simulate_gps_position(lat, lon)
 
+    def next_event_time(self, vehicle_state: VehicleState) -> Optional[float]:
+        """Regulatory mode only reacts to position changes, never to elapsed time."""
+        return None
+
     def _determine_region_from_coordinates(self, lat: float, lon: float) -> RegulatoryRegion:
         """
         Determine regulatory region from GPS coordinates.
@@ -300,6 +306,25 @@ class RegulatoryModeSimulator:
         """Get current regulatory region."""
         return self.current_region
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the complete simulation state of regulatory mode."""
+        return {
+            "enabled": self.enabled,
+            "current_region": self.current_region.code if self.current_region else None,
+        }
+
+    def restore(self, state: Dict[str, Any], time_offset: float = 0.0):
+        """
+        Restore state captured by ``snapshot()``.
+
+        Args:
+            state: Snapshot to restore
+            time_offset: Unused; regulatory mode holds no clock readings
+        """
+        self.enabled = state["enabled"]
+        code = state["current_region"]
+        self.current_region = self._regions[code] if code else None
+
     def get_status(self) -> Dict[str, Any]:
         """Get current regulatory mode status."""
         return {
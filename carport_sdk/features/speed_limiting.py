@@ -7,8 +7,8 @@ Implements the test cases from the Drive Pilot specification:
 - TC-602.2: Weather change → reduce speed + notify driver
 """
 
-import time
 from typing import Dict, Any, Optional
+from ..core.clock import Clock, RealTimeClock
 from ..core.events import EventBus, Event
 from ..core.models import VehicleState, AlertData
 
@@ -24,15 +24,16 @@ class SpeedLimitingSimulator:
     - Smooth speed transitions
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, clock: Optional[Clock] = None):
         self.event_bus = event_bus
+        self.clock = clock or RealTimeClock()
         self.enabled = True
         self.current_speed_limit = 50.0  # km/h
         self.weather_adjustment = 1.0  # multiplier (0.5-1.0)
         self.traffic_adjustment = 1.0  # multiplier (0.5-1.0)
         self._target_speed = 50.0
         self._speed_change_rate = 10.0  # km/h per second
-        self._last_update_time = time.time()
+        self._last_update_time = self.clock.now()
 
         # Simulated zones and conditions
         self._speed_zones = {"city": 50.0, "highway": 120.0, "school": 30.0, "construction": 40.0}
@@ -112,7 +113,7 @@ class SpeedLimitingSimulator:
         if not self.enabled:
             return
 
-        current_time = time.time()
+        current_time = self.clock.now()
         delta_time = current_time - self._last_update_time
         self._last_update_time = current_time
 
@@ -144,6 +145,16 @@ class SpeedLimitingSimulator:
                 )
             )
 
+    def next_event_time(self, vehicle_state: VehicleState) -> Optional[float]:
+        """Get the simulation time at which the vehicle reaches the target speed."""
+        if not self.enabled:
+            return None
+
+        speed_diff = abs(self._target_speed - vehicle_state.speed)
+        if speed_diff <= 0.1:
+            return None
+        return self._last_update_time + speed_diff / self._speed_change_rate
+
     def _calculate_target_speed(self):
         """Calculate target speed based on all factors."""
         base_speed = self.current_speed_limit
@@ -179,6 +190,34 @@ class SpeedLimitingSimulator:
         """Get the current target speed after adjustments."""
         return self._target_speed
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Capture the complete simulation state of speed limiting."""
+        return {
+            "enabled": self.enabled,
+            "current_speed_limit": self.current_speed_limit,
+            "weather_adjustment": self.weather_adjustment,
+            "traffic_adjustment": self.traffic_adjustment,
+            "target_speed": self._target_speed,
+            "speed_change_rate": self._speed_change_rate,
+            "last_update_time": self._last_update_time,
+        }
+
+    def restore(self, state: Dict[str, Any], time_offset: float = 0.0):
+        """
+        Restore state captured by ``snapshot()``.
+
+        Args:
+            state: Snapshot to restore
+            time_offset: Amount to shift captured clock readings by
+        """
+        self.enabled = state["enabled"]
+        self.current_speed_limit = state["current_speed_limit"]
+        self.weather_adjustment = state["weather_adjustment"]
+        self.traffic_adjustment = state["traffic_adjustment"]
+        self._target_speed = state["target_speed"]
+        self._speed_change_rate = state["speed_change_rate"]
+        self._last_update_time = state["last_update_time"] + time_offset
+
     def get_status(self) -> Dict[str, Any]:
         """Get current status of speed limiting."""
         return {
@@ -0,0 +1,14 @@
+"""
+Inter-process streaming of CarPort SDK simulation events.
+"""
+
+from .server import EventStreamServer
+from .client import EventStreamClient
+from .shm import SharedMemoryBridge, SharedMemoryReader
+
+__all__ = [
+    "EventStreamServer",
+    "EventStreamClient",
+    "SharedMemoryBridge",
+    "SharedMemoryReader",
+]
@@ -0,0 +1,79 @@
+"""
+Client for the event streaming server.
+"""
+
+import socket
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .framing import FrameReader, encode_frame
+
+Address = Union[str, Tuple[str, int]]
+
+
+class EventStreamClient:
+    """
+    Receives events streamed by an EventStreamServer.
+
+    Usage:
+        with EventStreamClient("/tmp/carport.sock", ["alert", "vehicle_state_update"]) as client:
+            for message in client:
+                print(message["type"], message["data"])
+
+    Args:
+        address: Unix socket path, or (host, port) for TCP
+        topics: Event types to receive (patterns ending in ``*`` match by prefix)
+        timeout: Socket timeout in seconds for receiving (None blocks)
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        topics: Iterable[str] = ("*",),
+        timeout: Optional[float] = None,
+    ):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.connect(address)
+        self._sock.settimeout(timeout)
+        self._reader = FrameReader()
+        self._messages: Deque[Dict[str, Any]] = deque()
+        self.subscribe(topics)
+
+    def subscribe(self, topics: Iterable[str]):
+        """Replace the set of event types streamed to this client."""
+        self._sock.sendall(encode_frame({"subscribe": list(topics)}))
+
+    def recv(self) -> Optional[Dict[str, Any]]:
+        """
+        Receive the next event message.
+
+        Returns:
+            The decoded message, or None once the server closed the connection
+
+        Raises:
+            socket.timeout: If no message arrives within the timeout
+        """
+        while not self._messages:
+            data = self._sock.recv(65536)
+            if not data:
+                return None
+            self._messages.extend(self._reader.feed(data))
+        return self._messages.popleft()
+
+    def close(self):
+        """Close the connection."""
+        self._sock.close()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            message = self.recv()
+            if message is None:
+                return
+            yield message
+
+    def __enter__(self) -> "EventStreamClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,106 @@
+"""
+Length-prefixed JSON framing for the event streaming protocol.
+
+Every message is a 4-byte big-endian payload length followed by a compact
+UTF-8 JSON document. Clients send ``{"subscribe": [<topic>, ...]}`` to choose
+event types (patterns ending in ``*`` match by prefix); the server sends one
+frame per event::
+
+    {"type": ..., "source": ..., "time": <sim time>, "ts": <epoch ns>, "data": ...}
+"""
+
+import dataclasses
+import json
+import struct
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from ..core.events import Event
+from ..core.models import monotonic_to_epoch_ns
+
+_LENGTH = struct.Struct(">I")
+
+# Frames larger than this are treated as a protocol error
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+def encode_frame(message: Any) -> bytes:
+    """Encode a JSON-serializable message as one frame."""
+    payload = json.dumps(message, separators=(",", ":"), default=_json_default).encode("utf-8")
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def encode_event(event: Event, sim_time: float) -> bytes:
+    """Encode an event as one frame."""
+    return encode_frame(
+        {
+            "type": event.event_type,
+            "source": event.source,
+            "time": sim_time,
+            "ts": monotonic_to_epoch_ns(event.timestamp_ns),
+            "data": to_jsonable(event.data),
+        }
+    )
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert event payloads (models, named tuples, enums) to plain JSON types."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if hasattr(value, "_asdict"):
+        return {key: to_jsonable(item) for key, item in value._asdict().items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if dataclasses.is_dataclass(value):
+        return {
+            field.name: to_jsonable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+            if field.name != "timestamp"
+        }
+    return _json_default(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class FrameReader:
+    """Incrementally splits a byte stream into decoded frames."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """
+        Add received bytes and return every message completed by them.
+
+        Raises:
+            ValueError: If a frame exceeds MAX_FRAME_SIZE or is not valid JSON
+        """
+        self._buffer += data
+        messages = []
+        while True:
+            message = self._next()
+            if message is None:
+                return messages
+            messages.append(message)
+
+    def _next(self) -> Optional[Dict[str, Any]]:
+        if len(self._buffer) < _LENGTH.size:
+            return None
+        (length,) = _LENGTH.unpack_from(self._buffer)
+        if length > MAX_FRAME_SIZE:
+            raise ValueError(f"Frame of {length} bytes exceeds the maximum frame size")
+        end = _LENGTH.size + length
+        if len(self._buffer) < end:
+            return None
+        payload = bytes(self._buffer[_LENGTH.size : end])
+        del self._buffer[:end]
+        return json.loads(payload)
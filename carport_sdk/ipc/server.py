@@ -0,0 +1,330 @@
+"""
+Socket server that streams EventBus events to external processes.
+"""
+
+import os
+import selectors
+import socket
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from ..core.events import Event, EventBus
+from .framing import FrameReader, encode_event
+
+Address = Union[str, Tuple[str, int]]
+
+SLOW_CLIENT_POLICIES = ("drop", "disconnect")
+
+# Upper bound on bytes handed to a single send() call
+_BATCH_BYTES = 256 * 1024
+
+
+class _Client:
+    """Connection state of one streaming client."""
+
+    def __init__(self, sock: socket.socket, address: Any):
+        self.sock = sock
+        self.address = address
+        self.reader = FrameReader()
+        self.topics: Tuple[str, ...] = ()
+        self.matches: Dict[str, bool] = {}
+        self.queue: Deque[bytes] = deque()
+        self.outbuf = b""
+        self.sent = 0
+        self.dropped = 0
+
+    def wants(self, event_type: str) -> bool:
+        """Check the client's topics, caching the result per event type."""
+        wanted = self.matches.get(event_type)
+        if wanted is None:
+            wanted = self.matches[event_type] = any(
+                event_type.startswith(topic[:-1]) if topic.endswith("*") else topic == event_type
+                for topic in self.topics
+            )
+        return wanted
+
+
+class EventStreamServer:
+    """
+    Streams events from an EventBus to clients on a local socket.
+
+    ``publish()`` only appends the event to a bounded queue; a server thread
+    encodes each event once, fans it out to the clients subscribed to its
+    type and batches pending frames into as few socket writes as possible.
+    A client that cannot keep up has its oldest frames dropped or is
+    disconnected, depending on ``slow_client``, so it never blocks the
+    simulation.
+
+    Usage:
+        server = EventStreamServer(simulator.event_bus, "/tmp/carport.sock")
+        server.start()
+        ...
+        server.stop()
+
+    Args:
+        event_bus: Bus whose events are streamed
+        address: Unix socket path, or (host, port) for TCP (port 0 picks a free port)
+        max_client_queue: Frames buffered per client before the slow-client policy applies
+        slow_client: "drop" (discard the oldest frames) or "disconnect"
+        max_pending: Events buffered between publish() and the server thread
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        address: Address,
+        max_client_queue: int = 10000,
+        slow_client: str = "drop",
+        max_pending: int = 100000,
+    ):
+        if slow_client not in SLOW_CLIENT_POLICIES:
+            raise ValueError(
+                f"slow_client must be one of {SLOW_CLIENT_POLICIES}, got '{slow_client}'"
+            )
+
+        self.event_bus = event_bus
+        self.address = address
+        self.max_client_queue = max_client_queue
+        self.slow_client = slow_client
+
+        self._pending: Deque[Tuple[float, Event]] = deque(maxlen=max_pending)
+        self._clients: Dict[socket.socket, _Client] = {}
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._listener: Optional[socket.socket] = None
+        self._wake_reader: Optional[socket.socket] = None
+        self._wake_writer: Optional[socket.socket] = None
+        self._wake_lock = threading.Lock()
+        self._wake_pending = False
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self.published = 0
+        self.dropped_pending = 0
+        self.disconnected_slow = 0
+
+    def start(self):
+        """Bind the socket and start streaming."""
+        if self._running:
+            return
+
+        if isinstance(self.address, str):
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind(self.address)
+        self._listener.listen()
+        self._listener.setblocking(False)
+        self.address = self._listener.getsockname()
+
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ, "accept")
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, "wake")
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="event-stream-server", daemon=True)
+        self._thread.start()
+        self.event_bus.subscribe("*", self._on_event)
+
+    def stop(self):
+        """Stop streaming and close all client connections."""
+        if not self._running:
+            return
+        self.event_bus.unsubscribe("*", self._on_event)
+        self._running = False
+        self._wake()
+        self._thread.join(timeout=2.0)
+
+        for client in list(self._clients.values()):
+            self._close_client(client)
+        self._selector.close()
+        for sock in (self._listener, self._wake_reader, self._wake_writer):
+            sock.close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get server and per-client streaming statistics."""
+        clients: List[Dict[str, Any]] = [
+            {
+                "address": str(client.address),
+                "topics": list(client.topics),
+                "queued": len(client.queue),
+                "sent": client.sent,
+                "dropped": client.dropped,
+            }
+            for client in list(self._clients.values())
+        ]
+        return {
+            "running": self._running,
+            "address": self.address,
+            "published": self.published,
+            "pending": len(self._pending),
+            "dropped_pending": self.dropped_pending,
+            "disconnected_slow": self.disconnected_slow,
+            "clients": clients,
+        }
+
+    def __enter__(self) -> "EventStreamServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _on_event(self, event: Event):
+        """Hand an event to the server thread; never blocks the publisher."""
+        if not self._clients:
+            return
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped_pending += 1
+        self._pending.append((self.event_bus.clock.now(), event))
+        self._wake()
+
+    def _wake(self):
+        """Wake the server thread unless a wakeup is already pending."""
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        try:
+            self._wake_writer.send(b"\0")
+        except OSError:
+            pass
+
+    def _run(self):
+        """Server thread: accept clients, read subscriptions, write batches."""
+        while self._running:
+            for key, mask in self._selector.select(timeout=0.5):
+                if key.data == "accept":
+                    self._accept()
+                elif key.data == "wake":
+                    self._drain_wakeups()
+                else:
+                    client = key.data
+                    if mask & selectors.EVENT_READ and not self._read(client):
+                        continue
+                    if mask & selectors.EVENT_WRITE:
+                        self._write(client)
+
+            self._fan_out()
+
+    def _accept(self):
+        try:
+            sock, address = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        client = _Client(sock, address)
+        self._clients[sock] = client
+        self._selector.register(sock, selectors.EVENT_READ, client)
+
+    def _drain_wakeups(self):
+        with self._wake_lock:
+            self._wake_pending = False
+        try:
+            while self._wake_reader.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    def _read(self, client: _Client) -> bool:
+        """Process subscription messages; returns False if the client went away."""
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return True
+        except OSError:
+            data = b""
+        if not data:
+            self._close_client(client)
+            return False
+
+        try:
+            messages = client.reader.feed(data)
+        except ValueError as e:
+            print(f"Error reading from stream client {client.address}: {e}")
+            self._close_client(client)
+            return False
+
+        for message in messages:
+            topics = message.get("subscribe") if isinstance(message, dict) else None
+            if topics is not None:
+                client.topics = tuple(str(topic) for topic in topics)
+                client.matches = {}
+        return True
+
+    def _fan_out(self):
+        """Encode pending events once and queue them for every interested client."""
+        while self._pending:
+            sim_time, event = self._pending.popleft()
+            self.published += 1
+            frame = None
+            for client in list(self._clients.values()):
+                if not client.wants(event.event_type):
+                    continue
+                if frame is None:
+                    try:
+                        frame = encode_event(event, sim_time)
+                    except Exception as e:
+                        print(f"Error encoding event '{event.event_type}': {e}")
+                        break
+                if len(client.queue) >= self.max_client_queue:
+                    if self.slow_client == "disconnect":
+                        self.disconnected_slow += 1
+                        self._close_client(client)
+                        continue
+                    client.queue.popleft()
+                    client.dropped += 1
+                client.queue.append(frame)
+
+        for client in list(self._clients.values()):
+            if client.queue or client.outbuf:
+                self._write(client)
+
+    def _write(self, client: _Client):
+        """Send as much queued data as the socket accepts, in large batches."""
+        while True:
+            if not client.outbuf:
+                if not client.queue:
+                    break
+                batch = []
+                size = 0
+                while client.queue and size < _BATCH_BYTES:
+                    frame = client.queue.popleft()
+                    batch.append(frame)
+                    size += len(frame)
+                client.outbuf = b"".join(batch)
+                client.sent += len(batch)
+            try:
+                written = client.sock.send(client.outbuf)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                self._close_client(client)
+                return
+            client.outbuf = client.outbuf[written:]
+            if client.outbuf:
+                break
+
+        events = selectors.EVENT_READ
+        if client.outbuf or client.queue:
+            events |= selectors.EVENT_WRITE
+        try:
+            self._selector.modify(client.sock, events, client)
+        except (KeyError, ValueError):
+            pass
+
+    def _close_client(self, client: _Client):
+        if self._clients.pop(client.sock, None) is None:
+            return
+        try:
+            self._selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
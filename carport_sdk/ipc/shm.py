@@ -0,0 +1,392 @@
+"""
+Shared-memory ring of per-tick simulation records for in-the-loop controllers.
+
+A ``SharedMemoryBridge`` owns a ``multiprocessing.shared_memory`` block laid
+out as a small header followed by a ring of fixed-width records (see
+``TICK_RECORD_DTYPE``). The simulator writes one record per tick holding the
+vehicle state, driver state, detected obstacles and the alerts raised since
+the previous tick. A ``SharedMemoryReader`` in another process maps the same
+block and reads records without any copying or serialization.
+
+There is one writer and no locks. Each record starts with a ``version`` word
+used as a seqlock: the writer makes it odd before overwriting a slot and even
+once the slot is complete, then advances the header ``write_seq``. A reader
+accepts a record if its version was even and unchanged across the read.
+
+Obstacles and alerts are stored in fixed-size arrays (``MAX_OBSTACLES``,
+``MAX_ALERTS``) with a count; strings are UTF-8 encoded into fixed-width
+byte fields and truncated if longer.
+"""
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.events import Event
+
+MAGIC = b"CPSHMRNG"
+FORMAT_VERSION = 1
+
+MAX_OBSTACLES = 16
+MAX_ALERTS = 8
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("capacity", "<u4"),
+        ("record_size", "<u4"),
+        ("reserved", "<u4"),
+        ("write_seq", "<u8"),  # sequence number of the newest complete record
+    ]
+)
+
+# Names of the blocks created by bridges in this process
+_created = set()
+
+# Records start at this offset so they stay cache-line aligned
+HEADER_SIZE = 64
+
+OBSTACLE_SLOT_DTYPE = np.dtype(
+    [
+        ("object_type", "S16"),
+        ("distance", "<f8"),
+        ("bearing", "<f8"),
+        ("velocity", "<f8"),
+        ("confidence", "<f8"),
+    ],
+    align=True,
+)
+
+ALERT_SLOT_DTYPE = np.dtype(
+    [
+        ("alert_type", "S32"),
+        ("severity", "S8"),
+        ("source_component", "S32"),
+        ("message", "S96"),
+    ],
+    align=True,
+)
+
+TICK_RECORD_DTYPE = np.dtype(
+    [
+        ("version", "<u8"),  # seqlock word: odd while the slot is being written
+        ("seq", "<u8"),  # record sequence number, starting at 1
+        ("tick", "<u8"),
+        ("sim_time", "<f8"),
+        ("speed", "<f8"),
+        ("lat", "<f8"),
+        ("lon", "<f8"),
+        ("heading", "<f8"),
+        ("is_stationary", "?"),
+        ("eyes_closed", "?"),
+        ("gaze_direction", "S8"),
+        ("attention_level", "<f8"),
+        ("time_looking_away", "<f8"),
+        ("obstacle_count", "<u4"),
+        ("alert_count", "<u4"),
+        ("alerts_dropped", "<u4"),
+        ("obstacles", OBSTACLE_SLOT_DTYPE, (MAX_OBSTACLES,)),
+        ("alerts", ALERT_SLOT_DTYPE, (MAX_ALERTS,)),
+    ],
+    align=True,
+)
+
+# Record bytes after the version word, copied separately from it
+_BODY_OFFSET = TICK_RECORD_DTYPE.fields["seq"][1]
+
+
+def _encode(value: Optional[str]) -> bytes:
+    return (value or "").encode("utf-8")
+
+
+def decode_string(value: bytes) -> str:
+    """Convert a fixed-width byte field of a record back into a string."""
+    return bytes(value).decode("utf-8", "ignore")
+
+
+def _ring_views(buf: memoryview, capacity: int) -> Tuple[np.ndarray, np.ndarray]:
+    header = np.ndarray((), dtype=HEADER_DTYPE, buffer=buf)
+    ring = np.ndarray((capacity,), dtype=TICK_RECORD_DTYPE, buffer=buf, offset=HEADER_SIZE)
+    return header, ring
+
+
+class SharedMemoryBridge:
+    """
+    Publishes one fixed-layout record per simulation tick to shared memory.
+
+    Usage:
+        bridge = SharedMemoryBridge("carport", capacity=1024)
+        bridge.attach(simulator)
+        simulator.run_for(60.0)
+        bridge.close()
+        bridge.unlink()
+
+    Args:
+        name: Shared memory block name (default: a generated unique name)
+        capacity: Number of records kept in the ring
+    """
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.capacity = capacity
+        # _shm is the open mapping (None once closed); _block is kept for unlink()
+        self._shm = self._block = shared_memory.SharedMemory(
+            name=name, create=True, size=HEADER_SIZE + capacity * TICK_RECORD_DTYPE.itemsize
+        )
+        self.name = self._shm.name
+        _created.add(self._block._name)
+        self._header, self._ring = _ring_views(self._shm.buf, capacity)
+        self._ring_bytes = self._ring.view(np.uint8).reshape(capacity, TICK_RECORD_DTYPE.itemsize)
+        self._header["magic"] = MAGIC
+        self._header["version"] = FORMAT_VERSION
+        self._header["capacity"] = capacity
+        self._header["record_size"] = TICK_RECORD_DTYPE.itemsize
+        self._header["write_seq"] = 0
+
+        self._scratch = np.zeros((), dtype=TICK_RECORD_DTYPE)
+        self._scratch_body = self._scratch.reshape(1).view(np.uint8)[_BODY_OFFSET:]
+        self._alerts: List[Any] = []
+        self._simulator = None
+        self.written = 0
+        self.alerts_dropped = 0
+
+    def attach(self, simulator):
+        """Write a record at the end of every tick of a simulator."""
+        self.detach()
+        self._simulator = simulator
+        simulator.event_bus.subscribe("alert", self._on_alert)
+        simulator.add_tick_listener(self.write)
+
+    def detach(self):
+        """Stop writing records for the attached simulator."""
+        if self._simulator is None:
+            return
+        self._simulator.remove_tick_listener(self.write)
+        self._simulator.event_bus.unsubscribe("alert", self._on_alert)
+        self._simulator = None
+        self._alerts = []
+
+    def write(self, simulator):
+        """Write the current state of a simulator as the next record."""
+        record = self._scratch
+        seq = self.written + 1
+
+        vehicle = simulator.vehicle_state
+        position = vehicle.position
+        record["seq"] = seq
+        record["tick"] = simulator._tick_count
+        record["sim_time"] = simulator.clock.now()
+        record["speed"] = vehicle.speed
+        record["lat"] = position["lat"]
+        record["lon"] = position["lon"]
+        record["heading"] = vehicle.heading
+        record["is_stationary"] = vehicle.is_stationary
+
+        driver = simulator.driver_monitoring.driver_state
+        record["gaze_direction"] = _encode(driver.gaze_direction)
+        record["attention_level"] = driver.attention_level
+        record["eyes_closed"] = driver.eyes_closed
+        record["time_looking_away"] = driver.time_looking_away
+
+        obstacles = simulator.obstacle_detection.get_detected_obstacles()[:MAX_OBSTACLES]
+        record["obstacle_count"] = len(obstacles)
+        slots = record["obstacles"]
+        for i, obstacle in enumerate(obstacles):
+            slots[i] = (
+                _encode(obstacle.object_type),
+                obstacle.distance,
+                obstacle.bearing,
+                obstacle.velocity,
+                obstacle.confidence,
+            )
+
+        alerts, self._alerts = self._alerts, []
+        dropped = max(0, len(alerts) - MAX_ALERTS)
+        alerts = alerts[dropped:]
+        self.alerts_dropped += dropped
+        record["alert_count"] = len(alerts)
+        record["alerts_dropped"] = dropped
+        slots = record["alerts"]
+        for i, alert in enumerate(alerts):
+            slots[i] = (
+                _encode(alert.alert_type),
+                _encode(alert.severity),
+                _encode(alert.source_component),
+                _encode(alert.message),
+            )
+
+        # Seqlock: the version is made odd before the body is overwritten and
+        # even after it is complete, each as a separate store
+        index = (seq - 1) % self.capacity
+        versions = self._ring["version"]
+        version = int(versions[index])
+        versions[index] = version + 1
+        self._ring_bytes[index, _BODY_OFFSET:] = self._scratch_body
+        versions[index] = version + 2
+        self._header["write_seq"] = seq
+        self.written = seq
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ring statistics."""
+        return {
+            "name": self.name,
+            "capacity": self.capacity,
+            "record_size": TICK_RECORD_DTYPE.itemsize,
+            "written": self.written,
+            "alerts_dropped": self.alerts_dropped,
+        }
+
+    def close(self):
+        """Detach and release this process's mapping of the block."""
+        self.detach()
+        if self._shm is None:
+            return
+        # Views into the buffer must be released before the mapping is closed
+        self._header = self._ring = self._ring_bytes = None
+        self._shm.close()
+        self._shm = None
+
+    def unlink(self):
+        """Destroy the shared memory block once every process has closed it."""
+        self._block.unlink()
+        _created.discard(self._block._name)
+
+    def __enter__(self) -> "SharedMemoryBridge":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        self.unlink()
+
+    def _on_alert(self, event: Event):
+        self._alerts.append(event.data)
+
+
+class SharedMemoryReader:
+    """
+    Reads tick records written by a SharedMemoryBridge in another process.
+
+    Usage:
+        reader = SharedMemoryReader("carport")
+        seq = 0
+        while True:
+            records, seq = reader.read_since(seq)
+            for record in records:
+                control(record["speed"], record["obstacles"][: record["obstacle_count"]])
+
+    Args:
+        name: Name of the bridge's shared memory block
+    """
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        if bytes(header["magic"]) != MAGIC:
+            self._shm.close()
+            raise ValueError(f"Shared memory block '{name}' is not a tick record ring")
+        if int(header["version"]) != FORMAT_VERSION or int(
+            header["record_size"]
+        ) != TICK_RECORD_DTYPE.itemsize:
+            self._shm.close()
+            raise ValueError(f"Unsupported tick record ring version: {int(header['version'])}")
+
+        self.name = name
+        self.capacity = int(header["capacity"])
+        self._header, self._ring = _ring_views(self._shm.buf, self.capacity)
+        self.lost = 0
+
+    @property
+    def write_seq(self) -> int:
+        """Sequence number of the newest complete record (0 if none yet)."""
+        return int(self._header["write_seq"])
+
+    @property
+    def records(self) -> np.ndarray:
+        """
+        Zero-copy view of the whole ring.
+
+        Slots may be overwritten while they are read; use ``read_since()`` or
+        ``latest()`` for validated copies.
+        """
+        return self._ring
+
+    def latest(self) -> Optional[np.void]:
+        """Get a consistent copy of the newest record, or None if none was written."""
+        while True:
+            seq = self.write_seq
+            if seq == 0:
+                return None
+            records = self._read_range(seq, seq)
+            if len(records):
+                return records[0]
+
+    def read_since(self, seq: int) -> Tuple[np.ndarray, int]:
+        """
+        Get the records written after a sequence number.
+
+        Records overwritten before they could be read are skipped and counted
+        in ``lost``.
+
+        Args:
+            seq: Sequence number of the last record already read (0 for none)
+
+        Returns:
+            (records, seq): Copied records in order, and the sequence number to
+            pass to the next call
+        """
+        newest = self.write_seq
+        if newest <= seq:
+            return np.empty(0, dtype=TICK_RECORD_DTYPE), seq
+        first = max(seq + 1, newest - self.capacity + 1)
+        records = self._read_range(first, newest)
+        self.lost += newest - seq - len(records)
+        return records, newest
+
+    def close(self):
+        """Release this process's mapping of the block."""
+        if self._shm is None:
+            return
+        self._header = self._ring = None
+        self._shm.close()
+        self._shm = None
+
+    def __enter__(self) -> "SharedMemoryReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _read_range(self, first: int, last: int) -> np.ndarray:
+        """Copy records first..last, keeping those not overwritten meanwhile."""
+        seqs = np.arange(first, last + 1, dtype=np.uint64)
+        slots = (seqs - 1) % self.capacity
+        versions = self._ring["version"][slots]
+        records = self._ring[slots]
+        valid = (
+            (versions % 2 == 0)
+            & (self._ring["version"][slots] == versions)
+            & (records["seq"] == seqs)
+        )
+        return records[valid]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block without registering it for cleanup by this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+
+    # Before Python 3.13 attaching always registers the block with the
+    # resource tracker, which destroys it when this process exits. Undo the
+    # registration, unless the block belongs to a bridge in this process.
+    shm = shared_memory.SharedMemory(name=name)
+    if shm._name not in _created:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
@@ -0,0 +1,22 @@
+"""
+Telemetry capture and replay for CarPort SDK simulations.
+"""
+
+from .recorder import SessionRecorder, SessionReplayer
+from .columnar import DictionaryColumn, export_columns, read_columns, write_columns
+from .store import TelemetryStore, TelemetryWindow
+from .inputs import InputLog, InputRecorder, InputReplay
+
+__all__ = [
+    "SessionRecorder",
+    "SessionReplayer",
+    "DictionaryColumn",
+    "export_columns",
+    "read_columns",
+    "write_columns",
+    "TelemetryStore",
+    "TelemetryWindow",
+    "InputLog",
+    "InputRecorder",
+    "InputReplay",
+]
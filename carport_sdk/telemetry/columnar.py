@@ -0,0 +1,214 @@
+"""
+Columnar export of event history for vectorized analysis.
+
+Events are split into one table per event type. Every table has ``sim_time``
+(clock time of publication), ``timestamp_ns`` and ``source`` columns, plus one
+column per scalar payload field (dataclass fields, named tuple fields or dict
+keys). Payloads that are lists, such as ``obstacles_detected``, produce one
+row per list item. String columns are dictionary-encoded as integer codes
+plus a table of distinct values.
+
+Tables are written to a compressed NumPy ``.npz`` file under keys of the form
+``<event_type>/<column>``; dictionary-encoded columns are stored as
+``<event_type>/<column>/codes`` and ``<event_type>/<column>/categories``.
+"""
+
+import dataclasses
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from ..core.events import Event, EventBus
+
+
+class DictionaryColumn(NamedTuple):
+    """Dictionary-encoded string column."""
+
+    codes: np.ndarray  # int32 index into categories for every row
+    categories: np.ndarray  # distinct string values
+
+    def decode(self) -> np.ndarray:
+        """Expand the column into an array of strings."""
+        return self.categories[self.codes]
+
+    def code_of(self, value: str) -> int:
+        """Get the code of a value, or -1 if it never occurs."""
+        matches = np.flatnonzero(self.categories == value)
+        return int(matches[0]) if len(matches) else -1
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+Column = Union[np.ndarray, DictionaryColumn]
+Tables = Dict[str, Dict[str, Column]]
+
+
+def export_columns(
+    source: Union[EventBus, Iterable[Tuple[float, Event]]],
+    event_types: Optional[Iterable[str]] = None,
+) -> Tables:
+    """
+    Convert events into typed columnar tables, one per event type.
+
+    Args:
+        source: EventBus whose history is exported, or an iterable of
+            (sim_time, event) pairs such as a SessionReplayer
+        event_types: Only export these event types (default: all)
+
+    Returns:
+        Mapping of event type to a mapping of column name to column
+    """
+    if isinstance(source, EventBus):
+        source = source.get_timed_history()
+    wanted = None if event_types is None else set(event_types)
+
+    rows: Dict[str, List[Tuple[float, Event, Dict[str, Any]]]] = {}
+    for sim_time, event in source:
+        if wanted is not None and event.event_type not in wanted:
+            continue
+        table = rows.setdefault(event.event_type, [])
+        data = event.data
+        if type(data) in (list, tuple):
+            for item in data:
+                table.append((sim_time, event, _payload_fields(item)))
+        else:
+            table.append((sim_time, event, _payload_fields(data)))
+
+    return {event_type: _build_table(table) for event_type, table in rows.items()}
+
+
+def write_columns(
+    path: str,
+    source: Union[EventBus, Iterable[Tuple[float, Event]], Tables],
+    event_types: Optional[Iterable[str]] = None,
+):
+    """
+    Write events as compressed columnar tables to an ``.npz`` file.
+
+    Args:
+        path: Output file
+        source: EventBus, iterable of (sim_time, event) pairs, or tables
+            returned by ``export_columns()``
+        event_types: Only export these event types (default: all)
+    """
+    tables = source if isinstance(source, dict) else export_columns(source, event_types)
+
+    arrays: Dict[str, np.ndarray] = {}
+    for event_type, columns in tables.items():
+        for name, column in columns.items():
+            key = f"{event_type}/{name}"
+            if isinstance(column, DictionaryColumn):
+                arrays[f"{key}/codes"] = column.codes
+                arrays[f"{key}/categories"] = column.categories
+            else:
+                arrays[key] = column
+
+    np.savez_compressed(path, **arrays)
+
+
+def read_columns(path: str) -> Tables:
+    """Load tables written by ``write_columns()``."""
+    tables: Tables = {}
+    encoded: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+
+    with np.load(path, allow_pickle=False) as archive:
+        for key in archive.files:
+            event_type, name = key.rsplit("/", 1)
+            if name in ("codes", "categories"):
+                event_type, column = event_type.rsplit("/", 1)
+                encoded.setdefault((event_type, column), {})[name] = archive[key]
+            else:
+                tables.setdefault(event_type, {})[name] = archive[key]
+
+    for (event_type, column), parts in encoded.items():
+        tables.setdefault(event_type, {})[column] = DictionaryColumn(
+            parts["codes"], parts["categories"]
+        )
+    return tables
+
+
+# Payload type -> field names read from instances (None if not a record type)
+_FIELD_NAMES: Dict[type, Optional[Tuple[str, ...]]] = {}
+
+
+def _record_fields(kind: type) -> Optional[Tuple[str, ...]]:
+    """Get the scalar-candidate field names of a named tuple or dataclass type."""
+    if kind not in _FIELD_NAMES:
+        if issubclass(kind, tuple) and hasattr(kind, "_fields"):
+            names = kind._fields
+        elif dataclasses.is_dataclass(kind):
+            # The datetime timestamp is covered by the timestamp_ns column
+            names = tuple(f.name for f in dataclasses.fields(kind) if f.name != "timestamp")
+        else:
+            names = None
+        _FIELD_NAMES[kind] = names
+    return _FIELD_NAMES[kind]
+
+
+def _payload_fields(data: Any) -> Dict[str, Any]:
+    """Get the named fields of an event payload."""
+    if data is None:
+        return {}
+    if isinstance(data, dict):
+        return data
+    names = _record_fields(type(data))
+    if names is None:
+        return {"value": data}
+    return {name: getattr(data, name) for name in names}
+
+
+def _build_table(rows: List[Tuple[float, Event, Dict[str, Any]]]) -> Dict[str, Column]:
+    """Convert rows of one event type into typed columns."""
+    columns: Dict[str, Column] = {
+        "sim_time": np.fromiter((row[0] for row in rows), dtype=np.float64, count=len(rows)),
+        "timestamp_ns": np.fromiter(
+            (row[1].timestamp_ns for row in rows), dtype=np.int64, count=len(rows)
+        ),
+        "source": _encode_strings([row[1].source for row in rows]),
+    }
+
+    names: Dict[str, None] = {}
+    for _, _, payload in rows:
+        names.update(dict.fromkeys(payload))
+
+    for name in names:
+        if name in columns:
+            continue
+        column = _to_column([payload.get(name) for _, _, payload in rows])
+        if column is not None:
+            columns[name] = column
+    return columns
+
+
+def _to_column(values: List[Any]) -> Optional[Column]:
+    """Convert payload values to a typed column, or None if they are not scalars."""
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+
+    if all(isinstance(value, (bool, np.bool_)) for value in present):
+        if len(present) == len(values):
+            return np.array(values, dtype=bool)
+        return np.array([np.nan if v is None else float(v) for v in values])
+    if len(present) == len(values) and all(
+        isinstance(value, (int, np.integer)) for value in present
+    ):
+        return np.array(values, dtype=np.int64)
+    if all(isinstance(value, (int, float, np.number)) for value in present):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if all(isinstance(value, str) for value in present):
+        return _encode_strings(values)
+    return None
+
+
+def _encode_strings(values: List[Optional[str]]) -> DictionaryColumn:
+    """Dictionary-encode a list of strings (None becomes an empty string)."""
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(value or "", len(index)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    categories = np.array(list(index), dtype=str) if index else np.array([], dtype="<U1")
+    return DictionaryColumn(codes, categories)
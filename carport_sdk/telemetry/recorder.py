@@ -0,0 +1,176 @@
+"""
+Binary session recording and replay of EventBus traffic.
+
+A session log is a short header followed by append-only records. Each record
+is a fixed frame holding the payload length and the simulation time the event
+was published at, followed by the event encoded with an ``EventCodec``::
+
+    header:  magic (6 bytes) | format version (uint16)
+    record:  payload length (uint32) | sim_time (float64) | payload
+
+The codec's string table is shared by all records of a log, so records are
+decoded in order. Records are never rewritten, so a log cut short by a crash
+is still readable up to its last complete record.
+"""
+
+import struct
+from threading import Lock
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+from ..core.clock import Clock, RealTimeClock
+from ..core.codec import EventCodec
+from ..core.events import Event, EventBus
+
+MAGIC = b"CPSESS"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<6sH")
+_FRAME = struct.Struct("<Id")
+
+
+class SessionRecorder:
+    """
+    Records every event published on an EventBus into a binary session log.
+
+    Usage:
+        with SessionRecorder("session.cpsess", simulator.event_bus):
+            simulator.run_for(60.0)
+
+    Args:
+        path: Log file to create (overwritten if it exists)
+        event_bus: Bus to record
+        event_types: Event types or patterns to record (default: all)
+    """
+
+    def __init__(self, path: str, event_bus: EventBus, event_types: Iterable[str] = ("*",)):
+        self.path = path
+        self.event_bus = event_bus
+        self.event_types = tuple(event_types)
+        self._file: Optional[BinaryIO] = None
+        self._codec = EventCodec()
+        self._lock = Lock()
+        self.recorded = 0
+        self.errors = 0
+
+    def start(self):
+        """Open the log and start recording."""
+        if self._file is not None:
+            return
+        self._file = open(self.path, "wb")
+        self._codec.reset()
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION))
+        for event_type in self.event_types:
+            self.event_bus.subscribe(event_type, self._on_event)
+
+    def stop(self):
+        """Stop recording and close the log."""
+        if self._file is None:
+            return
+        for event_type in self.event_types:
+            self.event_bus.unsubscribe(event_type, self._on_event)
+        with self._lock:
+            self._file.close()
+            self._file = None
+
+    def flush(self):
+        """Flush buffered records to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def _on_event(self, event: Event):
+        """Append one event to the log."""
+        sim_time = self.event_bus.clock.now()
+        with self._lock:
+            if self._file is None:
+                return
+            # Encode under the lock so records reach the file in string table order
+            try:
+                payload = self._codec.encode_event(event)
+            except Exception as e:
+                # Log error but keep recording
+                self.errors += 1
+                print(f"Error recording event '{event.event_type}': {e}")
+                return
+            self._file.write(_FRAME.pack(len(payload), sim_time))
+            self._file.write(payload)
+            self.recorded += 1
+
+    def __enter__(self) -> "SessionRecorder":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class SessionReplayer:
+    """
+    Reads a session log and re-publishes it into an EventBus.
+
+    Args:
+        path: Session log written by SessionRecorder
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __iter__(self) -> Iterator[Tuple[float, Event]]:
+        """Iterate over (sim_time, event) records in recording order."""
+        with open(self.path, "rb") as log:
+            header = log.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f"'{self.path}' is not a session log")
+            magic, version = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"'{self.path}' is not a session log")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported session log version: {version}")
+
+            codec = EventCodec()
+            while True:
+                frame = log.read(_FRAME.size)
+                if len(frame) < _FRAME.size:
+                    return
+                length, sim_time = _FRAME.unpack(frame)
+                payload = log.read(length)
+                if len(payload) < length:
+                    # Truncated final record
+                    return
+                yield sim_time, codec.decode_event(payload)[0]
+
+    def replay(
+        self,
+        event_bus: EventBus,
+        speed: Optional[float] = 1.0,
+        clock: Optional[Clock] = None,
+    ) -> int:
+        """
+        Publish the recorded events into an event bus.
+
+        Args:
+            event_bus: Bus to publish into
+            speed: Playback speed relative to the recording (1.0 for real
+                time, 10.0 for 10x); None replays as fast as possible
+            clock: Clock used to pace playback (defaults to the wall clock)
+
+        Returns:
+            Number of events published
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive or None")
+        clock = clock or RealTimeClock()
+
+        count = 0
+        start_sim_time = None
+        start_time = clock.now()
+        for sim_time, event in self:
+            if speed is not None:
+                if start_sim_time is None:
+                    start_sim_time = sim_time
+                # Pace against absolute deadlines so sleep overshoot does not accumulate
+                clock.sleep(start_time + (sim_time - start_sim_time) / speed - clock.now())
+            event_bus.publish(event)
+            count += 1
+        return count
+
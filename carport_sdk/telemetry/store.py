@@ -0,0 +1,428 @@
+"""
+Memory-mapped on-disk telemetry store with time-indexed random access.
+
+Each stream is persisted to a file of fixed-width NumPy records ordered by
+simulation time, next to a sparse index holding the time of every
+``index_interval``-th record. Low-cardinality strings (types, severities,
+components, gaze directions) are replaced by integer codes into a per-field
+string table kept in ``strings.json``; free-text alert messages are stored in
+the record as fixed-width UTF-8 bytes, truncated if longer.
+
+A store directory contains, per stream (``vehicle``, ``driver``,
+``obstacles``, ``alerts``)::
+
+    <stream>.dat   fixed-width records (see the *_DTYPE constants)
+    <stream>.idx   float64 sim_time of every index_interval-th record
+
+Records are buffered in a fixed-size chunk and appended to disk when it fills,
+so recording memory stays constant however long the run.
+"""
+
+import bisect
+import json
+import os
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ..core.events import Event, EventBus
+
+VEHICLE_DTYPE = np.dtype(
+    [
+        ("sim_time", "<f8"),
+        ("timestamp_ns", "<i8"),
+        ("speed", "<f8"),
+        ("lat", "<f8"),
+        ("lon", "<f8"),
+        ("heading", "<f8"),
+        ("is_stationary", "?"),
+    ]
+)
+
+DRIVER_DTYPE = np.dtype(
+    [
+        ("sim_time", "<f8"),
+        ("timestamp_ns", "<i8"),
+        ("gaze_direction", "<u2"),
+        ("attention_level", "<f8"),
+        ("eyes_closed", "?"),
+        ("time_looking_away", "<f8"),
+    ]
+)
+
+OBSTACLE_DTYPE = np.dtype(
+    [
+        ("sim_time", "<f8"),
+        ("timestamp_ns", "<i8"),
+        ("object_type", "<u2"),
+        ("distance", "<f8"),
+        ("bearing", "<f8"),
+        ("velocity", "<f8"),
+        ("confidence", "<f8"),
+    ]
+)
+
+ALERT_DTYPE = np.dtype(
+    [
+        ("sim_time", "<f8"),
+        ("timestamp_ns", "<i8"),
+        ("alert_type", "<u2"),
+        ("severity", "<u2"),
+        ("source_component", "<u2"),
+        ("message", "S96"),  # UTF-8, not interned since messages embed measurements
+    ]
+)
+
+
+class TelemetryWindow(NamedTuple):
+    """Records of every stream within a time window (read-only array views)."""
+
+    vehicle: np.ndarray
+    driver: np.ndarray
+    obstacles: np.ndarray
+    alerts: np.ndarray
+
+
+class _Stream:
+    """One fixed-width record file with its sparse time index and write buffer."""
+
+    def __init__(self, directory: str, name: str, dtype: np.dtype, chunk_size: int):
+        self.name = name
+        self.dtype = dtype
+        self.data_path = os.path.join(directory, f"{name}.dat")
+        self.index_path = os.path.join(directory, f"{name}.idx")
+        self.buffer = np.zeros(chunk_size, dtype=dtype)
+        self.pending = 0
+        self.count = 0
+        self.index: List[float] = []
+        self._data_file = None
+        self._index_file = None
+        self._unsaved_index = 0
+        self._view: Optional[np.ndarray] = None
+
+    def open_for_writing(self):
+        self._data_file = open(self.data_path, "wb")
+        self._index_file = open(self.index_path, "wb")
+
+    def open_for_reading(self):
+        self.count = os.path.getsize(self.data_path) // self.dtype.itemsize
+        self.index = np.fromfile(self.index_path, dtype="<f8").tolist()
+
+    def append(self, record: Tuple, index_interval: int):
+        if self.pending == len(self.buffer):
+            self.flush()
+        if (self.count + self.pending) % index_interval == 0:
+            self.index.append(record[0])
+        self.buffer[self.pending] = record
+        self.pending += 1
+
+    def flush(self):
+        if self._data_file is None:
+            return
+        if self.pending:
+            self._data_file.write(self.buffer[: self.pending].tobytes())
+            self.count += self.pending
+            self.pending = 0
+            self._data_file.flush()
+        if self._unsaved_index < len(self.index):
+            self._index_file.write(np.asarray(self.index[self._unsaved_index :], "<f8").tobytes())
+            self._unsaved_index = len(self.index)
+            self._index_file.flush()
+
+    def close(self):
+        self.flush()
+        for handle in (self._data_file, self._index_file):
+            if handle is not None:
+                handle.close()
+        self._data_file = self._index_file = None
+
+    def records(self) -> np.ndarray:
+        """Memory-map all flushed records."""
+        if self._view is None or len(self._view) != self.count:
+            if self.count == 0:
+                self._view = np.empty(0, dtype=self.dtype)
+            else:
+                self._view = np.memmap(self.data_path, self.dtype, mode="r", shape=(self.count,))
+        return self._view
+
+    def window(self, t0: float, t1: float, index_interval: int) -> np.ndarray:
+        """Get a view of the records with t0 <= sim_time <= t1."""
+        records = self.records()
+        times = records["sim_time"]
+        lo = self._locate(times, t0, "left", index_interval)
+        hi = self._locate(times, t1, "right", index_interval)
+        return records[lo:max(lo, hi)]
+
+    def _locate(self, times: np.ndarray, t: float, side: str, index_interval: int) -> int:
+        """Find a record position using the sparse index, then search one block."""
+        if side == "left":
+            block = bisect.bisect_left(self.index, t)
+        else:
+            block = bisect.bisect_right(self.index, t)
+        start = max(0, block - 1) * index_interval
+        end = min(len(times), block * index_interval + 1)
+        if start >= end:
+            return min(start, len(times))
+        return start + int(np.searchsorted(times[start:end], t, side=side))
+
+
+class TelemetryStore:
+    """
+    On-disk telemetry store with zero-copy time-window access.
+
+    Usage:
+        store = TelemetryStore("soak_run", mode="w")
+        store.attach(simulator.event_bus, exclude_from_history=True)
+        simulator.run_for(86_400.0)
+        store.close()
+
+        store = TelemetryStore("soak_run")
+        window = store.window(3600.0, 3660.0)
+        window.vehicle["speed"].mean()
+
+    Args:
+        directory: Store directory (created in write mode)
+        mode: "w" to create a new store, "r" to open an existing one
+        index_interval: Records between sparse index entries
+        chunk_size: Records buffered per stream before writing to disk
+    """
+
+    STREAMS = {
+        "vehicle": VEHICLE_DTYPE,
+        "driver": DRIVER_DTYPE,
+        "obstacles": OBSTACLE_DTYPE,
+        "alerts": ALERT_DTYPE,
+    }
+
+    def __init__(
+        self,
+        directory: str,
+        mode: str = "r",
+        index_interval: int = 1024,
+        chunk_size: int = 4096,
+    ):
+        if mode not in ("r", "w"):
+            raise ValueError(f"mode must be 'r' or 'w', got '{mode}'")
+
+        self.directory = directory
+        self.mode = mode
+        self.index_interval = index_interval
+        self._lock = Lock()
+        self._strings: Dict[str, Dict[str, int]] = {}
+        self._strings_dirty = False
+        self._streams = {
+            name: _Stream(directory, name, dtype, chunk_size)
+            for name, dtype in self.STREAMS.items()
+        }
+        self._subscriptions: List[Tuple[EventBus, str, Callable]] = []
+
+        strings_path = os.path.join(directory, "strings.json")
+        if mode == "w":
+            os.makedirs(directory, exist_ok=True)
+            for stream in self._streams.values():
+                stream.open_for_writing()
+            self._strings_dirty = True
+            self._flush()
+        else:
+            with open(strings_path, "r", encoding="utf-8") as fh:
+                metadata = json.load(fh)
+            self.index_interval = metadata["index_interval"]
+            self._strings = {
+                field: {value: code for code, value in enumerate(values)}
+                for field, values in metadata["strings"].items()
+            }
+            for stream in self._streams.values():
+                stream.open_for_reading()
+
+    def attach(self, event_bus: EventBus, exclude_from_history: bool = False):
+        """
+        Persist the vehicle, driver, obstacle and alert events of a bus.
+
+        The bus keeps its own in-memory history of the same events, which is
+        unbounded by default; bound it with ``configure_history()`` or pass
+        ``exclude_from_history=True`` so only the store keeps them.
+
+        Args:
+            event_bus: Event bus to record
+            exclude_from_history: Add the persisted event types to the bus's
+                history ``excluded_types``, keeping the rest of its policy
+        """
+        if self.mode != "w":
+            raise RuntimeError("Store is read-only")
+        handlers = {
+            "vehicle_state_update": self._on_vehicle_state,
+            "driver_state_update": self._on_driver_state,
+            "obstacles_detected": self._on_obstacles,
+            "alert": self._on_alert,
+        }
+        if exclude_from_history:
+            history = event_bus._history
+            event_bus.configure_history(
+                history.max_events,
+                history.max_events_per_type,
+                history.max_age,
+                history.excluded_types | handlers.keys(),
+            )
+        for event_type, method in handlers.items():
+            handler = partial(method, event_bus)
+            event_bus.subscribe(event_type, handler)
+            self._subscriptions.append((event_bus, event_type, handler))
+
+    def detach(self):
+        """Stop persisting events from all attached buses."""
+        for event_bus, event_type, handler in self._subscriptions:
+            event_bus.unsubscribe(event_type, handler)
+        self._subscriptions = []
+
+    def window(self, t0: float, t1: float) -> TelemetryWindow:
+        """
+        Get the records of every stream with ``t0 <= sim_time <= t1``.
+
+        Returns read-only views into the memory-mapped record files; nothing
+        outside the window is read from disk.
+        """
+        with self._lock:
+            self._flush()
+            return TelemetryWindow(
+                *(stream.window(t0, t1, self.index_interval) for stream in self._streams.values())
+            )
+
+    def records(self, stream: str) -> np.ndarray:
+        """Get a memory-mapped view of all records of one stream."""
+        with self._lock:
+            self._flush()
+            return self._streams[stream].records()
+
+    def strings(self, field: str) -> List[str]:
+        """Get the string table of a coded field; a record's code indexes into it."""
+        return list(self._strings.get(field, {}))
+
+    def decode(self, field: str, codes: Iterable[Any]) -> List[str]:
+        """Convert codes of a string field (or fixed-width message bytes) into strings."""
+        codes = np.asarray(codes)
+        if codes.dtype.kind == "S":
+            return [value.decode("utf-8", "ignore") for value in codes]
+        table = self.strings(field)
+        return [table[code] for code in codes]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get record counts per stream."""
+        with self._lock:
+            return {
+                name: stream.count + stream.pending for name, stream in self._streams.items()
+            }
+
+    def flush(self):
+        """Write buffered records to disk."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Detach from all buses and flush everything to disk."""
+        self.detach()
+        with self._lock:
+            self._flush()
+            for stream in self._streams.values():
+                stream.close()
+
+    def __enter__(self) -> "TelemetryStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _flush(self):
+        if self.mode != "w":
+            return
+        for stream in self._streams.values():
+            stream.flush()
+        if self._strings_dirty:
+            with open(os.path.join(self.directory, "strings.json"), "w", encoding="utf-8") as fh:
+                json.dump(
+                    {
+                        "index_interval": self.index_interval,
+                        "strings": {field: list(table) for field, table in self._strings.items()},
+                    },
+                    fh,
+                )
+            self._strings_dirty = False
+
+    def _code(self, field: str, value: Optional[str]) -> int:
+        """Get the string table code of a value, adding it if new."""
+        table = self._strings.setdefault(field, {})
+        value = value or ""
+        code = table.get(value)
+        if code is None:
+            code = table[value] = len(table)
+            self._strings_dirty = True
+        return code
+
+    def _append(self, stream: str, record: Tuple):
+        with self._lock:
+            self._streams[stream].append(record, self.index_interval)
+
+    def _on_vehicle_state(self, event_bus: EventBus, event: Event):
+        state = event.data
+        self._append(
+            "vehicle",
+            (
+                state.sim_time,
+                event.timestamp_ns,
+                state.speed,
+                state.lat,
+                state.lon,
+                state.heading,
+                state.is_stationary,
+            ),
+        )
+
+    def _on_driver_state(self, event_bus: EventBus, event: Event):
+        driver = event.data
+        sim_time = event_bus.clock.now()
+        with self._lock:
+            self._streams["driver"].append(
+                (
+                    sim_time,
+                    event.timestamp_ns,
+                    self._code("gaze_direction", driver.gaze_direction),
+                    driver.attention_level,
+                    driver.eyes_closed,
+                    driver.time_looking_away,
+                ),
+                self.index_interval,
+            )
+
+    def _on_obstacles(self, event_bus: EventBus, event: Event):
+        sim_time = event_bus.clock.now()
+        with self._lock:
+            for obstacle in event.data:
+                self._streams["obstacles"].append(
+                    (
+                        sim_time,
+                        event.timestamp_ns,
+                        self._code("object_type", obstacle.object_type),
+                        obstacle.distance,
+                        obstacle.bearing,
+                        obstacle.velocity,
+                        obstacle.confidence,
+                    ),
+                    self.index_interval,
+                )
+
+    def _on_alert(self, event_bus: EventBus, event: Event):
+        alert = event.data
+        sim_time = event_bus.clock.now()
+        with self._lock:
+            self._streams["alerts"].append(
+                (
+                    sim_time,
+                    event.timestamp_ns,
+                    self._code("alert_type", alert.alert_type),
+                    self._code("severity", alert.severity),
+                    self._code("source_component", alert.source_component),
+                    (alert.message or "").encode("utf-8"),
+                ),
+                self.index_interval,
+            )
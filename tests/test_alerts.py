@@ -0,0 +1,86 @@
+"""
+Tests for the sequence-numbered alert log.
+"""
+
+import threading
+
+from carport_sdk import CarPortSimulator, RealTimeClock, VirtualClock
+from carport_sdk.core import AlertLog
+from carport_sdk.core.models import AlertData
+
+def make_alert(alert_type="test", message="message"):
+    return AlertData(alert_type, "warning", message, "TestComponent")
+
+def test_alerts_since_returns_only_new_alerts():
+    """Test a cursor only yields alerts added after it."""
+    log = AlertLog()
+    log.append(make_alert(message="a"))
+    alerts, cursor = log.alerts_since(0)
+    assert [a.message for a in alerts] == ["a"] and cursor == 1
+
+    log.append(make_alert(message="b"))
+    log.append(make_alert(message="c"))
+    alerts, cursor = log.alerts_since(cursor)
+    assert [a.message for a in alerts] == ["b", "c"] and cursor == 3
+    assert log.alerts_since(cursor) == ([], 3)
+
+def test_cursors_survive_clear():
+    """Test clearing drops alerts without renumbering later ones."""
+    log = AlertLog()
+    for message in "abc":
+        log.append(make_alert(message=message))
+    _, cursor = log.alerts_since(1)
+    assert log.get_all(clear=True)[-1].message == "c"
+    assert len(log) == 0
+
+    assert log.append(make_alert(message="d")) == 4
+    alerts, cursor = log.alerts_since(cursor)
+    assert [a.message for a in alerts] == ["d"] and cursor == 4
+    alerts, _ = log.alerts_since(0)
+    assert [a.message for a in alerts] == ["d"]
+
+def test_restore_keeps_cursors_moving_forward():
+    """Test restoring a snapshot does not replay alerts to an up-to-date cursor."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=1)
+    simulator.driver_monitoring.simulate_gaze_away(6.0)
+    simulator.run_for(1.0)
+    snapshot = simulator.snapshot()
+    simulator.run_for(10.0)
+
+    _, cursor = simulator.alerts_since(0)
+    simulator.restore(snapshot)
+    assert simulator.get_alerts() == list(snapshot.alerts)
+    assert simulator.alerts_since(cursor) == ([], cursor)
+
+    simulator.run_for(10.0)
+    alerts, _ = simulator.alerts_since(cursor)
+    assert alerts == simulator.get_alerts()[len(snapshot.alerts):]
+
+def test_wait_for_alert_from_simulation_thread():
+    """Test waiting for an alert raised by the running simulation."""
+    simulator = CarPortSimulator(clock=RealTimeClock(), timestep=0.01)
+    simulator.driver_monitoring.set_alert_threshold(0.1)
+    simulator.start()
+    try:
+        simulator.driver_monitoring.simulate_gaze_direction("away")
+        alert = simulator.wait_for_alert(lambda a: a.alert_type == "driver_attention", timeout=5.0)
+    finally:
+        simulator.stop()
+    assert alert is not None and alert.source_component == "DriverMonitoringSimulator"
+
+    assert simulator.wait_for_alert(lambda a: a.alert_type == "never", timeout=0.05) is None
+
+def test_follow_yields_alerts_until_idle():
+    """Test following the log yields appended alerts and stops after the timeout."""
+    log = AlertLog()
+    log.append(make_alert(message="a"))
+
+    def produce():
+        for message in "bc":
+            log.append(make_alert(message=message))
+
+    producer = threading.Timer(0.05, produce)
+    producer.start()
+    messages = [alert.message for alert in log.follow(timeout=0.5)]
+    producer.join()
+    assert messages == ["a", "b", "c"]
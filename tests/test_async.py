@@ -0,0 +1,64 @@
+"""
+Tests for the asyncio simulator and async event streams.
+"""
+
+import asyncio
+import threading
+from carport_sdk import Event, EventBus, VirtualClock
+from carport_sdk.core.async_simulator import AsyncCarPortSimulator
+from carport_sdk.core.models import AlertData
+
+def test_stream_receives_events_from_other_threads():
+    """Test events published on another thread reach the async stream."""
+    async def scenario():
+        bus = EventBus()
+        received = []
+        async with bus.stream("alert") as alerts:
+            publisher = threading.Thread(
+                target=lambda: [bus.publish(Event("alert", data=i)) for i in range(3)]
+            )
+            publisher.start()
+            async for event in alerts:
+                received.append(event.data)
+                if len(received) == 3:
+                    break
+            publisher.join()
+        return received
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+
+def test_stream_drops_oldest_when_full():
+    """Test bounded streams drop the oldest buffered event."""
+    async def scenario():
+        bus = EventBus()
+        stream = bus.stream("tick", maxsize=2)
+        for i in range(5):
+            bus.publish(Event("tick", data=i))
+        stream.close()
+        return [event.data async for event in stream], stream.dropped
+
+    data, dropped = asyncio.run(scenario())
+    assert data == [3, 4]
+    assert dropped == 3
+
+def test_async_simulator_streams_alerts():
+    """Test TC-601.1 alerts arrive through the stream while running on a loop."""
+    async def scenario():
+        simulator = AsyncCarPortSimulator(clock=VirtualClock())
+        simulator.driver_monitoring.set_alert_threshold(1.0)
+        async with simulator.event_bus.stream("alert") as alerts:
+            simulator.driver_monitoring.simulate_gaze_direction("away")
+            await simulator.start()
+            event = await asyncio.wait_for(alerts.__anext__(), timeout=5.0)
+            await simulator.stop()
+        return event
+
+    event = asyncio.run(scenario())
+    assert isinstance(event.data, AlertData)
+    assert event.data.alert_type == "driver_attention"
+
+def test_async_run_for():
+    """Test run_for advances simulated time cooperatively."""
+    simulator = AsyncCarPortSimulator(clock=VirtualClock())
+    asyncio.run(simulator.run_for(2.0))
+    assert simulator.get_status()["tick_count"] == 20
@@ -0,0 +1,143 @@
+"""
+Tests for the simulation clock and faster-than-real-time stepping.
+"""
+
+import time
+import pytest
+from carport_sdk import CarPortSimulator, Clock, VirtualClock
+from carport_sdk.core.scheduler import FixedStepScheduler
+
+@pytest.fixture
+def virtual_simulator():
+    """Create a CarPort simulator driven by a virtual clock."""
+    return CarPortSimulator(clock=VirtualClock())
+
+def test_virtual_clock_advance():
+    """Test virtual clock only moves when advanced."""
+    clock = VirtualClock(start=10.0)
+    assert clock.now() == 10.0
+
+    clock.advance(2.5)
+    clock.sleep(0.5)
+    assert clock.now() == 13.0
+
+    with pytest.raises(ValueError):
+        clock.advance(-1.0)
+
+def test_clock_subclass_must_implement_interface():
+    """Test a clock missing now() or sleep() cannot be instantiated."""
+
+    class NowOnlyClock(Clock):
+        def now(self):
+            return 0.0
+
+    with pytest.raises(TypeError):
+        Clock()
+    with pytest.raises(TypeError):
+        NowOnlyClock()
+
+def test_step_advances_simulated_time(virtual_simulator):
+    """Test step() advances the shared clock by whole timesteps."""
+    virtual_simulator.step(50)
+
+    status = virtual_simulator.get_status()
+    assert status["tick_count"] == 50
+    assert status["sim_time"] == pytest.approx(5.0)
+
+def test_tc_601_1_with_virtual_clock(virtual_simulator):
+    """Test TC-601.1 escalation through simulated time only."""
+    virtual_simulator.driver_monitoring.set_alert_threshold(5.0)
+    virtual_simulator.driver_monitoring.simulate_gaze_direction("away")
+
+    virtual_simulator.run_for(4.0)
+    assert not virtual_simulator.get_alerts()
+
+    virtual_simulator.run_for(12.0)
+    levels = [a.message for a in virtual_simulator.get_alerts()
+              if a.alert_type == "driver_attention"]
+    assert len(levels) == 3
+
+def test_ota_update_runs_faster_than_real_time(virtual_simulator):
+    """Test a full 100 MB OTA update completes without wall-clock waits."""
+    ota = virtual_simulator.ota_updates
+    assert ota.start_update("2.0.0", "sha256:abc123def456")
+
+    started = time.time()
+    virtual_simulator.run_for(120.0)
+
+    assert time.time() - started < 5.0
+    assert ota.current_version == "2.0.0"
+    assert ota.get_status()["status"] == "idle"
+
+def test_scheduler_catch_up_policy():
+    """Test missed deadlines are run back to back under catch-up."""
+    clock = VirtualClock()
+    scheduler = FixedStepScheduler(clock, 0.1, policy="catch_up", max_catch_up=5)
+
+    assert scheduler.due_ticks() == 1
+    clock.advance(0.35)  # deadlines at 0.1, 0.2 and 0.3 have passed
+    assert scheduler.due_ticks() == 3
+    assert scheduler.time_until_next() == pytest.approx(0.05)
+
+    stats = scheduler.get_stats()
+    assert stats["overruns"] == 1
+    assert stats["skipped_ticks"] == 0
+    assert stats["jitter_max_ms"] == pytest.approx(250.0)
+
+def test_catch_up_ticks_run_components():
+    """Test ticks run to make up for a stall update the components."""
+    simulator = CarPortSimulator(clock=VirtualClock(), timestep=0.05)
+    updates = []
+    simulator.event_bus.subscribe("vehicle_state_update", updates.append)
+    simulator._scheduler.reset()
+    simulator._run_due_ticks()
+
+    simulator.clock.advance(0.3)  # stall: six deadlines pass at once
+    simulator._run_due_ticks()
+
+    stats = simulator._scheduler.get_stats()
+    assert stats["ticks"] == simulator._tick_count == 6
+    assert len(updates) == 6
+
+def test_scheduler_skip_policy():
+    """Test missed deadlines are dropped under the skip policy."""
+    clock = VirtualClock()
+    scheduler = FixedStepScheduler(clock, 0.1, policy="skip")
+
+    scheduler.due_ticks()
+    clock.advance(0.35)
+    assert scheduler.due_ticks() == 1
+    assert scheduler.get_stats()["skipped_ticks"] == 2
+
+def test_background_loop_reports_scheduler_stats(simulator):
+    """Test the threaded loop keeps its cadence and reports timing stats."""
+    simulator.start()
+    time.sleep(0.5)
+    simulator.stop()
+
+    stats = simulator.get_status()["scheduler"]
+    assert stats["target_rate_hz"] == pytest.approx(10.0)
+    assert 4 <= stats["ticks"] <= 7
+
+def test_multi_rate_feature_updates():
+    """Test each feature is only updated at its own rate."""
+    simulator = CarPortSimulator(
+        clock=VirtualClock(),
+        feature_rates={"driver_monitoring": 30.0, "regulatory_mode": 1.0},
+    )
+    assert simulator.tick_period == pytest.approx(1.0 / 30.0)
+
+    simulator.run_for(2.0)
+
+    history = simulator.event_bus.get_event_history
+    assert len(history("driver_state_update")) == 60
+    assert len(history("vehicle_state_update")) == 20
+
+def test_set_feature_rate_changes_base_tick(virtual_simulator):
+    """Test lowering a feature rate keeps the base tick at the fastest rate."""
+    virtual_simulator.set_feature_rate("ota_updates", 1.0)
+    assert virtual_simulator.tick_period == pytest.approx(0.1)
+    assert virtual_simulator.get_feature_rates()["ota_updates"] == pytest.approx(1.0)
+
+    with pytest.raises(KeyError):
+        virtual_simulator.set_feature_rate("unknown_feature", 5.0)
@@ -0,0 +1,84 @@
+"""
+Tests for the binary event codec.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+from carport_sdk import CarPortSimulator, Event, VirtualClock
+from carport_sdk.core import EventCodec
+from carport_sdk.core.models import AlertData, DriverState, ObstacleData, SensorData, VehicleState
+
+def fields(event):
+    return event.event_type, event.source, event.timestamp_ns, event.data
+
+def test_round_trips_simulation_history():
+    """Test every event of a simulation decodes to an equal event."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=3)
+    simulator.set_vehicle_speed(80.0)
+    simulator.obstacle_detection.set_confidence_threshold(0.0)
+    simulator.obstacle_detection.simulate_pedestrian(30.0)
+    simulator.driver_monitoring.simulate_gaze_direction("away")
+    simulator.run_for(20.0)
+    history = simulator.event_bus.get_event_history()
+
+    buffer = EventCodec().encode_events(history)
+    events, offset = EventCodec().decode_events(memoryview(buffer))
+
+    assert offset == len(buffer)
+    assert [fields(e) for e in events] == [fields(e) for e in history]
+    assert len(buffer) < sum(len(pickle.dumps(fields(e))) for e in history) / 2
+
+def test_round_trips_models_and_plain_values():
+    """Test models and structural payloads survive encoding."""
+    values = [
+        AlertData("speed_warning", "warning", "Slow down", "SpeedLimitingSimulator"),
+        ObstacleData("animal", 12.5, -3.0, velocity=2.0, confidence=0.8),
+        DriverState(gaze_direction="left", attention_level=0.4, eyes_closed=True),
+        VehicleState(speed=50.0, position={"lat": 52.1, "lon": 13.4}, heading=90.0),
+        SensorData("radar", {"range": 200.0, "targets": [1, 2]}),
+        {"old_speed": 80.0, "flag": None, 3: (True, b"raw", "text")},
+    ]
+    codec = EventCodec()
+    buffer = bytearray()
+    for value in values:
+        codec.encode(value, buffer)
+
+    decoder = EventCodec()
+    offset = 0
+    for value in values:
+        decoded, offset = decoder.decode(buffer, offset)
+        assert decoded == value
+        assert type(decoded) is type(value)
+
+def test_pickle_fallback_is_opt_in():
+    """Test unsupported values are rejected unless pickling is allowed."""
+    with pytest.raises(TypeError):
+        EventCodec().encode({"speed": 2**70})
+
+    buffer = EventCodec(allow_pickle=True).encode({"speed": 2**70})
+    with pytest.raises(ValueError):
+        EventCodec().decode(buffer)
+    assert EventCodec(allow_pickle=True).decode(buffer)[0] == {"speed": 2**70}
+
+def test_repeated_strings_use_the_table():
+    """Test a repeated alert is smaller than its first occurrence."""
+    codec = EventCodec()
+    alert = Event("alert", AlertData("a" * 20, "critical", "msg", "Component" * 3), source="Src")
+    first = len(codec.encode_event(alert))
+    second = len(codec.encode_event(alert))
+    assert second < first - 60
+
+def test_failed_encode_leaves_stream_consistent():
+    """Test an event that cannot be encoded does not corrupt later records."""
+    codec = EventCodec()
+    out = bytearray()
+    bad = Event("new_type", data=lambda: None, source="new_source")
+    with pytest.raises(TypeError):
+        codec.encode_event(bad, out)
+    assert out == bytearray()
+
+    codec.encode_event(Event("other", data=np.float64(1.5), source="new_source"), out)
+    event, _ = EventCodec().decode_event(out)
+    assert (event.event_type, event.source, event.data) == ("other", "new_source", 1.5)
@@ -0,0 +1,84 @@
+"""
+Tests for columnar telemetry export.
+"""
+
+import numpy as np
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.telemetry import (
+    SessionRecorder,
+    SessionReplayer,
+    export_columns,
+    read_columns,
+    write_columns,
+)
+
+@pytest.fixture
+def simulator():
+    """Run a session with speed changes, obstacles and distraction."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=3)
+    simulator.speed_limiting.set_speed_zone("city")
+    simulator.set_vehicle_speed(80.0)
+    simulator.obstacle_detection.simulate_pedestrian(30.0)
+    simulator.driver_monitoring.simulate_gaze_direction("away")
+    simulator.run_for(10.0)
+    return simulator
+
+def test_obstacle_columns_are_point_in_time():
+    """Test each obstacles_detected row keeps the distance at publication time."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=3)
+    simulator.set_vehicle_speed(36.0)
+    simulator.obstacle_detection.set_confidence_threshold(0.0)
+    simulator.obstacle_detection.add_obstacle("pedestrian", 30.0, 0.0)
+    simulator.run_for(1.0)
+
+    obstacles = export_columns(simulator.event_bus)["obstacles_detected"]
+    assert len(np.unique(obstacles["distance"])) == len(obstacles["distance"]) > 1
+    assert np.all(np.diff(obstacles["distance"]) > 0)
+
+def test_export_typed_columns(simulator):
+    """Test history is split into typed per-type columns."""
+    tables = export_columns(simulator.event_bus)
+
+    states = tables["vehicle_state_update"]
+    assert states["speed"].dtype == np.float64
+    assert len(states["speed"]) == 100
+    assert np.all(np.diff(states["sim_time"]) > 0)
+
+    driver = tables["driver_state_update"]
+    assert np.all(np.diff(driver["time_looking_away"]) > 0)
+    assert set(driver["gaze_direction"].decode()) == {"away"}
+
+    assert tables["speed_adjusted"]["target_speed"].dtype == np.float64
+    assert "distance" in tables["obstacles_detected"]
+
+    alerts = tables["alert"]
+    history = simulator.event_bus.get_event_history("alert")
+    assert list(alerts["severity"].decode()) == [e.data.severity for e in history]
+    assert alerts["alert_type"].codes.dtype == np.int32
+
+def test_npz_round_trip(simulator, tmp_path):
+    """Test tables survive writing to and reading from an .npz file."""
+    path = tmp_path / "run.npz"
+    write_columns(str(path), simulator.event_bus)
+    tables = read_columns(str(path))
+    expected = export_columns(simulator.event_bus)
+
+    assert tables.keys() == expected.keys()
+    np.testing.assert_array_equal(
+        tables["vehicle_state_update"]["speed"], expected["vehicle_state_update"]["speed"]
+    )
+    severity = tables["alert"]["severity"]
+    assert list(severity.decode()) == list(expected["alert"]["severity"].decode())
+    assert severity.code_of("nonexistent") == -1
+
+def test_export_from_session_log(simulator, tmp_path):
+    """Test a recorded session can be exported without the original bus."""
+    path = tmp_path / "session.cpsess"
+    fresh = CarPortSimulator(clock=VirtualClock(), seed=3)
+    with SessionRecorder(str(path), fresh.event_bus):
+        fresh.run_for(2.0)
+
+    tables = export_columns(SessionReplayer(str(path)), event_types=["vehicle_state_update"])
+    assert list(tables) == ["vehicle_state_update"]
+    assert len(tables["vehicle_state_update"]["speed"]) == 20
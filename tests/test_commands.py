@@ -0,0 +1,83 @@
+"""
+Tests for the tick-boundary command queue.
+"""
+
+import pytest
+from carport_sdk import CarPortSimulator, RealTimeClock, VirtualClock
+
+@pytest.fixture
+def simulator():
+    return CarPortSimulator(clock=VirtualClock(), seed=5)
+
+def test_commands_apply_at_next_tick(simulator):
+    """Test deferred calls change nothing until the next tick starts."""
+    seq = simulator.deferred.set_vehicle_speed(60.0)
+    simulator.deferred.driver_monitoring.simulate_gaze_away(6.0)
+    assert simulator.vehicle_state.speed == 0.0
+    assert simulator.commands.pending == 2
+
+    simulator.step()
+
+    assert seq == 1
+    assert simulator.commands.pending == 0
+    assert simulator.vehicle_state.speed > 0.0
+    assert simulator.driver_monitoring.driver_state.gaze_direction == "away"
+    stats = simulator.commands.get_stats()
+    assert (stats["applied"], stats["applied_seq"]) == (2, 2)
+    assert (stats["batches"], stats["max_batch"]) == (1, 2)
+
+def test_commands_apply_in_sequence_order(simulator):
+    """Test a batch is applied in submission order."""
+    for speed in (10.0, 20.0, 30.0):
+        simulator.deferred.set_vehicle_speed(speed)
+    simulator.commands.apply_pending()
+    assert simulator.vehicle_state.speed == 30.0
+    assert simulator.commands.applied_seq == 3
+
+def test_unknown_commands_are_rejected(simulator):
+    """Test submitting a missing or private method fails immediately."""
+    with pytest.raises(AttributeError):
+        simulator.deferred.set_warp_speed(9)
+    with pytest.raises(AttributeError):
+        simulator.commands.submit("", "_update_simulation")
+    assert simulator.commands.pending == 0
+
+def test_failing_command_does_not_stop_batch(simulator, capsys):
+    """Test an error in one command is reported and the rest still apply."""
+    simulator.deferred.set_vehicle_position("not", "numbers", "extra")
+    simulator.deferred.set_vehicle_speed(40.0)
+    simulator.step()
+    assert simulator.vehicle_state.speed > 0.0
+    assert simulator.commands.errors == 1
+    assert "Error applying command 1" in capsys.readouterr().out
+
+def test_deferred_runs_are_reproducible():
+    """Test the same commands at the same ticks give the same result."""
+    def run():
+        simulator = CarPortSimulator(clock=VirtualClock(), seed=9)
+        simulator.deferred.set_vehicle_speed(90.0)
+        simulator.deferred.obstacle_detection.simulate_pedestrian(40.0, crossing=True)
+        simulator.run_for(5.0)
+        simulator.deferred.speed_limiting.set_weather_condition("rain")
+        simulator.run_for(5.0)
+        alerts = [alert.message for alert in simulator.get_alerts()]
+        history = simulator.event_bus.get_event_history("vehicle_state_update")
+        speeds = [event.data.speed for event in history]
+        return alerts, speeds
+
+    assert run() == run()
+
+def test_wait_for_command_from_other_thread():
+    """Test a caller can block until its command took effect."""
+    simulator = CarPortSimulator(clock=RealTimeClock(), timestep=0.01)
+    simulator.start()
+    try:
+        seq = simulator.deferred.set_vehicle_speed(50.0)
+        assert simulator.commands.wait(seq, timeout=2.0)
+        assert simulator.commands.applied_seq >= seq
+    finally:
+        simulator.stop()
+
+    pending = simulator.deferred.set_vehicle_speed(70.0)
+    assert not simulator.commands.wait(pending, timeout=0.05)
+    assert simulator.commands.clear() == 1
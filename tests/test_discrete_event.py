@@ -0,0 +1,78 @@
+"""
+Tests for the discrete-event execution mode.
+"""
+
+import time
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.core.discrete_event import DiscreteEventEngine
+
+@pytest.fixture
+def engine():
+    """Create a discrete-event engine around a virtual-clock simulator."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    return DiscreteEventEngine(simulator)
+
+def test_requires_virtual_clock():
+    """Test the engine refuses to drive a wall-clock simulator."""
+    with pytest.raises(ValueError):
+        DiscreteEventEngine(CarPortSimulator())
+
+def test_multi_hour_soak_skips_idle_time(engine):
+    """Test a four-hour idle soak with one distraction finishes quickly."""
+    simulator = engine.simulator
+    engine.schedule(3600.0, lambda: simulator.driver_monitoring.simulate_gaze_direction("away"))
+
+    started = time.time()
+    processed = engine.run_for(4 * 3600.0)
+
+    assert time.time() - started < 1.0
+    assert processed < 20
+    assert simulator.clock.now() == pytest.approx(4 * 3600.0)
+
+    attention_alerts = [a for a in simulator.get_alerts() if a.alert_type == "driver_attention"]
+    assert len(attention_alerts) == 3
+
+def test_speed_ramp_reaches_target(engine):
+    """Test the vehicle reaches the target speed in a single jump."""
+    simulator = engine.simulator
+    simulator.speed_limiting.set_speed_zone("highway")
+
+    engine.run_for(60.0)
+
+    assert simulator.vehicle_state.speed == pytest.approx(120.0)
+
+def test_ota_update_phases(engine):
+    """Test an OTA update completes through its phase completion events."""
+    ota = engine.simulator.ota_updates
+    ota.start_update("2.0.0", "sha256:abc123def456")
+
+    engine.run_for(200.0)
+
+    assert ota.current_version == "2.0.0"
+    assert ota.get_status()["status"] == "idle"
+
+def test_obstacle_range_exit(engine):
+    """Test obstacles are dropped once they leave detection range."""
+    detection = engine.simulator.obstacle_detection
+    detection.confidence_threshold = 0.0
+    detection.add_obstacle("vehicle", 60.0, 0.0, velocity=20.0)
+    assert detection.get_detected_obstacles()
+
+    engine.run_for(30.0)
+
+    assert not detection.get_detected_obstacles()
+
+def test_applies_commands_and_notifies_tick_listeners(engine):
+    """Test deferred commands and tick listeners work in discrete-event mode."""
+    simulator = engine.simulator
+    ticks = []
+    simulator.add_tick_listener(lambda sim: ticks.append(sim.clock.now()))
+    simulator.deferred.set_vehicle_speed(80.0)
+
+    engine.run_for(10.0)
+
+    assert simulator.commands.pending == 0
+    assert simulator.vehicle_state.speed > 0.0
+    assert simulator._tick_count == len(ticks) > 0
+    assert ticks[-1] == pytest.approx(10.0)
@@ -0,0 +1,246 @@
+"""
+Tests for EventBus history retention and dispatch.
+"""
+
+import pytest
+from carport_sdk import CarPortSimulator, Event, EventBus, VirtualClock
+
+def publish_many(bus, event_type, count):
+    for i in range(count):
+        bus.publish(Event(event_type, data=i))
+
+def test_ring_buffer_capacity():
+    """Test the total history capacity evicts the oldest events."""
+    bus = EventBus(max_events=100)
+    publish_many(bus, "a", 80)
+    publish_many(bus, "b", 80)
+
+    history = bus.get_event_history()
+    assert len(history) == 100
+    assert [e.data for e in history[:20]] == list(range(60, 80))
+    assert bus.get_history_stats()["evicted"] == 60
+
+def test_per_type_caps_and_exclusions():
+    """Test per-type caps and excluded types."""
+    bus = EventBus(max_events_per_type={"vehicle_state_update": 10}, excluded_types=["tick"])
+    publish_many(bus, "vehicle_state_update", 50)
+    publish_many(bus, "alert", 50)
+    publish_many(bus, "tick", 50)
+
+    assert len(bus.get_event_history("vehicle_state_update")) == 10
+    assert len(bus.get_event_history("alert")) == 50
+    assert bus.get_event_history("tick") == []
+
+def test_time_window_retention():
+    """Test events older than the time window are evicted."""
+    clock = VirtualClock()
+    bus = EventBus(clock, max_age=10.0)
+    for _ in range(30):
+        bus.publish(Event("alert"))
+        clock.advance(1.0)
+
+    assert len(bus.get_event_history("alert")) == 11
+
+def test_soak_memory_stays_flat():
+    """Test a long run with retention keeps the history size bounded."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    simulator.event_bus.configure_history(
+        max_events=500, excluded_types=["driver_state_update"]
+    )
+
+    simulator.run_for(3600.0)
+
+    stats = simulator.event_bus.get_history_stats()
+    assert stats["size"] == 500
+    assert "driver_state_update" not in stats["per_type"]
+
+def test_history_order_is_preserved_across_types():
+    """Test unfiltered history is returned in publication order."""
+    bus = EventBus()
+    for i in range(10):
+        bus.publish(Event("even" if i % 2 == 0 else "odd", data=i))
+
+    assert [e.data for e in bus.get_event_history()] == list(range(10))
+
+def test_history_time_range_query():
+    """Test history queries by type, time range and limit."""
+    clock = VirtualClock()
+    bus = EventBus(clock)
+    for i in range(100):
+        bus.publish(Event("alert" if i % 2 == 0 else "tick", data=i))
+        clock.advance(1.0)
+
+    alerts = bus.get_event_history("alert", since=10.0, until=20.0)
+    assert [e.data for e in alerts] == [10, 12, 14, 16, 18, 20]
+    assert [e.data for e in bus.get_event_history(since=95.0)] == [95, 96, 97, 98, 99]
+    assert [e.data for e in bus.get_event_history(since=10.0, limit=3)] == [10, 11, 12]
+    assert bus.get_event_history("alert", since=200.0) == []
+
+def test_history_time_range_query_after_restore():
+    """Test time queries still match every event after the clock was rewound."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    simulator.run_for(5.0)
+    snapshot = simulator.snapshot()
+    simulator.run_for(5.0)
+    simulator.restore(snapshot)
+    simulator.run_for(2.0)
+
+    history = simulator.event_bus
+    timed = history.get_timed_history("vehicle_state_update")
+    expected = [event for time, event in timed if 5.5 <= time <= 7.0]
+    matched = history.get_event_history("vehicle_state_update", since=5.5, until=7.0)
+    assert len(expected) == 30
+    assert matched == expected
+    assert len(history.get_event_history("vehicle_state_update", since=5.5, limit=4)) == 4
+
+def test_time_window_retention_after_clock_rewind():
+    """Test expiry drops old events even when they follow newer ones."""
+    clock = VirtualClock()
+    bus = EventBus(clock, max_age=10.0)
+    for start in (100.0, 0.0):
+        clock.reset(start)
+        for i in range(5):
+            bus.publish(Event("alert", data=start + i))
+            clock.advance(1.0)
+    clock.reset(50.0)
+    for _ in range(300):
+        bus.publish(Event("tick"))
+
+    assert [e.data for e in bus.get_event_history("alert")] == [100.0, 101.0, 102.0, 103.0, 104.0]
+
+def test_history_cursor_reads():
+    """Test incremental history reads only return new events."""
+    bus = EventBus()
+    publish_many(bus, "alert", 5)
+    events, cursor = bus.read_history(0, "alert", limit=3)
+    assert [e.data for e in events] == [0, 1, 2]
+
+    events, cursor = bus.read_history(cursor, "alert")
+    assert [e.data for e in events] == [3, 4]
+
+    bus.publish(Event("tick"))
+    assert bus.read_history(cursor, "alert") == ([], cursor)
+    bus.publish(Event("alert", data=5))
+    events, cursor = bus.read_history(cursor)
+    assert [e.event_type for e in events] == ["tick", "alert"]
+
+def test_queued_subscriber_does_not_block_publisher():
+    """Test a slow queued subscriber does not stall publish()."""
+    import threading
+    import time
+
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def slow(event):
+        release.wait()
+        received.append(event.data)
+
+    bus.subscribe("tick", slow, queued=True)
+    started = time.monotonic()
+    publish_many(bus, "tick", 10)
+    assert time.monotonic() - started < 0.5
+
+    release.set()
+    assert bus.flush(timeout=2.0)
+    assert received == list(range(10))
+    bus.close()
+
+@pytest.mark.parametrize("overflow,expected", [
+    ("drop_oldest", [0, 7, 8, 9]),
+    ("coalesce", [0, 1, 2, 9]),
+])
+def test_queued_subscriber_overflow_policies(overflow, expected):
+    """Test drop-oldest and coalesce overflow handling."""
+    import threading
+
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def slow(event):
+        release.wait()
+        received.append(event.data)
+
+    bus.subscribe("tick", slow, queued=True, maxsize=3, overflow=overflow)
+    bus.publish(Event("tick", data=0))
+    # Wait until the worker holds event 0 so the queue state is deterministic
+    while bus.get_dispatch_stats()["tick"][0]["depth"]:
+        pass
+    for i in range(1, 10):
+        bus.publish(Event("tick", data=i))
+    release.set()
+    assert bus.flush(timeout=2.0)
+
+    assert received == expected
+    stats = bus.get_dispatch_stats()["tick"][0]
+    assert stats["max_depth"] == 3
+    assert stats["dropped"] + stats["coalesced"] == 6
+    bus.unsubscribe("tick", slow)
+    assert bus.get_dispatch_stats() == {}
+
+def test_wildcard_subscriptions():
+    """Test prefix patterns match existing and newly seen event types."""
+    bus = EventBus()
+    bus.publish(Event("alert.critical"))
+    received = []
+    bus.subscribe("alert.*", lambda e: received.append(e.event_type))
+    everything = []
+    bus.subscribe("*", lambda e: everything.append(e.event_type))
+
+    bus.publish(Event("alert.critical"))
+    bus.publish(Event("alert.warning"))
+    bus.publish(Event("alert"))
+    bus.publish(Event("tick"))
+
+    assert received == ["alert.critical", "alert.warning"]
+    assert everything == ["alert.critical", "alert.warning", "alert", "tick"]
+
+def test_unsubscribe_during_dispatch():
+    """Test subscription changes inside a callback do not affect the current publish."""
+    bus = EventBus()
+    calls = []
+
+    def first(event):
+        calls.append("first")
+        bus.unsubscribe("tick", second)
+
+    def second(event):
+        calls.append("second")
+
+    bus.subscribe("tick", first)
+    bus.subscribe("tick", second)
+    bus.publish(Event("tick"))
+    bus.publish(Event("tick"))
+    assert calls == ["first", "second", "first"]
+
+def test_event_type_ids_are_stable():
+    """Test event types are interned to stable integer IDs."""
+    bus = EventBus()
+    bus.subscribe("alert", lambda e: None)
+    bus.publish(Event("tick"))
+    assert bus.event_type_id("alert") == 0
+    assert bus.event_type_id("tick") == 1
+    assert bus.event_type_id("new") == 2
+    assert bus.get_event_types() == ["alert", "tick", "new"]
+
+def test_vehicle_state_history_is_point_in_time():
+    """Test vehicle_state_update events keep the state at publication."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    for speed in (10.0, 20.0, 30.0):
+        simulator.set_vehicle_speed(speed)
+        simulator.set_vehicle_position(speed, -speed)
+        simulator.step()
+
+    history = simulator.event_bus.get_event_history("vehicle_state_update")
+    assert [e.data.speed for e in history] == [10.0, 20.0, 30.0]
+    assert history[0].data.position == {"lat": 10.0, "lon": -10.0}
+    assert history[0].data.sim_time == pytest.approx(0.1)
+    with pytest.raises(AttributeError):
+        history[0].data.speed = 0.0
+
+    status = simulator.get_status()
+    speed = status["vehicle_state"].speed
+    simulator.set_vehicle_speed(99.0)
+    assert status["vehicle_state"].speed == speed
@@ -0,0 +1,57 @@
+"""
+Tests for the vectorized fleet simulator.
+"""
+
+import numpy as np
+import pytest
+from carport_sdk import VirtualClock
+from carport_sdk.core.fleet import FleetSimulator
+
+@pytest.fixture
+def fleet():
+    """Create a small fleet driven by a virtual clock."""
+    return FleetSimulator(1000, clock=VirtualClock())
+
+def test_driver_monitoring_alerts_carry_vehicle_ids(fleet):
+    """Test TC-601.1 escalation is reported per vehicle."""
+    distracted = np.arange(0, 1000, 10)
+    fleet.simulate_gaze_away(distracted)
+
+    fleet.run_for(16.0)
+
+    counts = fleet.get_alert_counts()
+    assert np.all(counts[distracted] == 3)
+    assert counts.sum() == 3 * distracted.size
+
+    assert len(fleet.get_vehicle_alerts(10)) == 3
+    assert fleet.get_vehicle_state(10)["alert_level"] == 3
+    assert not fleet.get_vehicle_alerts(5)
+
+def test_speed_limiting_kernel(fleet):
+    """Test every vehicle ramps toward its adjusted limit."""
+    fleet.set_speed_limit(slice(0, 500), 120.0)
+    fleet.set_weather_condition(slice(500, 1000), "snow")
+
+    fleet.run_for(15.0)
+
+    assert fleet.speed[:500] == pytest.approx(np.full(500, 120.0), abs=0.2)
+    assert fleet.speed[500:] == pytest.approx(np.full(500, 25.0), abs=0.2)
+
+def test_pedestrian_emergency_stop(fleet):
+    """Test TC-604.1 is raised only for vehicles with a crossing pedestrian close by."""
+    fleet.add_obstacle([1, 2, 3], "pedestrian", distance=15.0, velocity=1.4)
+    fleet.add_obstacle([4], "pedestrian", distance=40.0)
+
+    alerts = {a.alert.alert_type: list(a.vehicle_ids) for a in fleet.get_alerts()}
+    assert alerts["emergency_stop"] == [1, 2, 3]
+    assert alerts["obstacle_warning"] == [4]
+
+def test_obstacles_leave_range(fleet):
+    """Test obstacles are dropped once out of detection range."""
+    fleet.add_obstacle(slice(None), "vehicle", distance=90.0, velocity=0.0)
+    fleet.set_speed(slice(None), 50.0)
+    fleet.speed_limiting_enabled[:] = False
+
+    fleet.run_for(2.0)
+
+    assert fleet.get_status()["obstacles_tracked"] == 0
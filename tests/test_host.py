@@ -0,0 +1,67 @@
+"""
+Tests for the shared simulation host.
+"""
+
+import threading
+import time
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.core.host import SimulationHost
+
+def test_host_ticks_many_simulators_with_few_threads():
+    """Test one host thread drives every registered simulator."""
+    host = SimulationHost(threads=2)
+    simulators = [CarPortSimulator() for _ in range(50)]
+    for simulator in simulators:
+        host.add(simulator)
+
+    threads_before = threading.active_count()
+    host.start()
+    assert threading.active_count() - threads_before == 2
+    time.sleep(0.35)
+    host.stop()
+
+    ticks = [s.get_status()["tick_count"] for s in simulators]
+    assert min(ticks) >= 3
+    assert max(ticks) - min(ticks) <= 1
+    assert not any(s._running for s in simulators)
+
+def test_host_respects_per_simulator_rates():
+    """Test simulators registered at different rates tick proportionally."""
+    host = SimulationHost()
+    fast, slow = CarPortSimulator(), CarPortSimulator()
+    host.add(fast, tick_rate=50.0)
+    host.add(slow, tick_rate=5.0)
+
+    host.start()
+    time.sleep(0.5)
+    host.stop()
+
+    assert fast.get_status()["tick_count"] > 4 * slow.get_status()["tick_count"]
+
+def test_host_rejects_running_simulator(running_simulator):
+    """Test a simulator with its own thread cannot be hosted."""
+    with pytest.raises(RuntimeError):
+        SimulationHost().add(running_simulator)
+
+def test_host_rejects_virtual_clock_simulator():
+    """Test a simulator whose clock the host would never advance is rejected."""
+    host = SimulationHost()
+    with pytest.raises(ValueError):
+        host.add(CarPortSimulator(clock=VirtualClock()))
+    assert host.get_stats()["simulator_count"] == 0
+
+def test_remove_stops_ticking():
+    """Test removed simulators are no longer ticked."""
+    host = SimulationHost()
+    simulator = CarPortSimulator()
+    host.add(simulator, tick_rate=100.0)
+    host.start()
+    time.sleep(0.1)
+    host.remove(simulator)
+    ticks = simulator.get_status()["tick_count"]
+    time.sleep(0.1)
+    host.stop()
+
+    assert simulator.get_status()["tick_count"] == ticks
+    assert host.get_stats()["simulator_count"] == 0
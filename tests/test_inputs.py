@@ -0,0 +1,123 @@
+"""
+Tests for input-only session recording and replay.
+"""
+
+import threading
+
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.telemetry import InputLog, InputRecorder, InputReplay
+
+def drive_session(simulator):
+    """Drive a scenario with random obstacles, distraction and speed changes."""
+    simulator.set_vehicle_speed(90.0)
+    simulator.speed_limiting.set_speed_zone("city")
+    simulator.run_for(20.0)
+    simulator.obstacle_detection.simulate_animal(60.0, is_night=True)
+    simulator.driver_monitoring.simulate_gaze_away(3.0)
+    simulator.run_for(20.0)
+    simulator.driver_monitoring.simulate_gaze_direction("forward")
+    simulator.obstacle_detection.simulate_pedestrian(15.0, crossing=True)
+    simulator.run_for(20.0)
+
+def event_signature(event_bus):
+    signature = []
+    for event in event_bus.get_event_history():
+        data = event.data
+        if event.event_type == "alert":
+            data = (data.alert_type, data.severity, data.message)
+        elif event.event_type == "obstacles_detected":
+            data = [(o.object_type, round(o.distance, 9)) for o in data]
+        elif hasattr(data, "timestamp_ns"):
+            data = None
+        signature.append((event.event_type, event.source, repr(data)))
+    return signature
+
+def test_replay_regenerates_event_stream(tmp_path):
+    """Test replaying inputs reproduces the recorded event stream exactly."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=5)
+    simulator.run_for(5.0)
+    already_published = len(simulator.event_bus.get_event_history())
+    with InputRecorder(simulator) as recorder:
+        drive_session(simulator)
+    path = tmp_path / "session.cpinput"
+    recorder.log.save(str(path))
+
+    replay = InputReplay(InputLog.load(str(path)))
+    replay.run()
+
+    expected = event_signature(simulator.event_bus)[already_published:]
+    assert event_signature(replay.simulator.event_bus) == expected
+    assert any(event_type == "alert" for event_type, _, _ in expected)
+    assert replay.simulator.get_status()["tick_count"] == simulator.get_status()["tick_count"]
+    assert replay.simulator.vehicle_state.speed == simulator.vehicle_state.speed
+    assert replay.simulator.clock.now() == simulator.clock.now()
+
+def test_input_log_is_compact(tmp_path):
+    """Test the input log is far smaller than the events it regenerates."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=5)
+    with InputRecorder(simulator) as recorder:
+        drive_session(simulator)
+        simulator.run_for(600.0)
+    path = tmp_path / "session.cpinput"
+    recorder.log.save(str(path))
+
+    assert len(recorder.log.inputs) == 6
+    events = len(simulator.event_bus.get_event_history())
+    assert path.stat().st_size < events * 2
+
+def test_tick_driven_input_calls_are_not_recorded():
+    """Test input methods called by components during a tick are not logged."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=2)
+    with InputRecorder(simulator) as recorder:
+        simulator.set_vehicle_position(48.1, 11.5)
+        simulator.run_for(10.0)
+        count = len(recorder.log.inputs)
+        simulator.run_for(60.0)
+
+    assert count == 1
+    assert len(recorder.log.inputs) == count
+
+    replay = InputReplay(recorder.log)
+    replay.run()
+    region = simulator.regulatory_mode.current_region
+    assert region is not None
+    assert replay.simulator.regulatory_mode.current_region.code == region.code
+
+def test_inputs_from_other_threads_during_tick_are_recorded():
+    """Test an input made on another thread while a tick runs is still logged."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+
+    def set_speed_from_thread(sim):
+        thread = threading.Thread(target=sim.set_vehicle_speed, args=(50.0,))
+        thread.start()
+        thread.join()
+
+    with InputRecorder(simulator) as recorder:
+        simulator.add_tick_listener(set_speed_from_thread)
+        simulator.run_for(0.3)
+        simulator.remove_tick_listener(set_speed_from_thread)
+
+    assert [record.method for record in recorder.log.inputs] == ["set_vehicle_speed"] * 3
+
+def test_recorder_restores_methods():
+    """Test stopping the recorder removes the instance-level wrappers."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    recorder = InputRecorder(simulator)
+    recorder.start()
+    assert "set_vehicle_speed" in vars(simulator)
+    recorder.stop()
+    assert "set_vehicle_speed" not in vars(simulator)
+    assert "simulate_pedestrian" not in vars(simulator.obstacle_detection)
+
+def test_partial_replay():
+    """Test replay can stop at a simulation time and resume."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=1)
+    with InputRecorder(simulator) as recorder:
+        drive_session(simulator)
+
+    replay = InputReplay(recorder.log)
+    replay.run(until=30.05)
+    assert replay.simulator.clock.now() == pytest.approx(30.0)
+    replay.run()
+    assert replay.simulator.vehicle_state.speed == simulator.vehicle_state.speed
@@ -0,0 +1,92 @@
+"""
+Tests for the socket event streaming server.
+"""
+
+import socket
+import time
+
+import pytest
+from carport_sdk import CarPortSimulator, Event, EventBus, VirtualClock
+from carport_sdk.ipc import EventStreamClient, EventStreamServer
+from carport_sdk.ipc.framing import encode_frame
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not met in time")
+        time.sleep(0.005)
+
+@pytest.fixture(params=["unix", "tcp"])
+def server(request, tmp_path):
+    """Start a streaming server for a virtual-clock simulator."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=2)
+    address = str(tmp_path / "events.sock") if request.param == "unix" else ("127.0.0.1", 0)
+    with EventStreamServer(simulator.event_bus, address) as server:
+        server.simulator = simulator
+        yield server
+
+def connect(server, topics):
+    client = EventStreamClient(server.address, topics, timeout=2.0)
+    wait_for(lambda: any(c["topics"] == list(topics) for c in server.get_stats()["clients"]))
+    return client
+
+def test_clients_receive_selected_topics(server):
+    """Test each client only receives the event types it subscribed to."""
+    alerts = connect(server, ["alert"])
+    everything = connect(server, ["*"])
+
+    simulator = server.simulator
+    simulator.driver_monitoring.simulate_gaze_away(6.0)
+    simulator.step(3)
+
+    message = alerts.recv()
+    assert message["type"] == "alert"
+    assert message["data"]["severity"] in ("warning", "critical")
+    assert message["source"] == "DriverMonitoringSimulator"
+
+    types = {everything.recv()["type"] for _ in range(6)}
+    assert {"vehicle_state_update", "driver_state_update"} <= types
+    state = next(m for m in iter(everything.recv, None) if m["type"] == "vehicle_state_update")
+    assert set(state["data"]) >= {"speed", "lat", "lon", "sim_time"}
+    alerts.close()
+    everything.close()
+
+def test_slow_client_does_not_block_publish():
+    """Test a client that never reads has events dropped, not publish blocked."""
+    bus = EventBus()
+    with EventStreamServer(bus, ("127.0.0.1", 0), max_client_queue=100) as server:
+        stalled = socket.create_connection(server.address)
+        stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        stalled.sendall(encode_frame({"subscribe": ["*"]}))
+        wait_for(
+            lambda: server.get_stats()["clients"] and server.get_stats()["clients"][0]["topics"]
+        )
+
+        payload = "x" * 1000
+        started = time.monotonic()
+        for _ in range(20000):
+            bus.publish(Event("tick", data=payload))
+        assert time.monotonic() - started < 5.0
+
+        wait_for(lambda: server.get_stats()["pending"] == 0)
+        assert server.get_stats()["clients"][0]["dropped"] > 0
+        stalled.close()
+
+def test_slow_client_disconnect_policy():
+    """Test the disconnect policy drops clients that fall behind."""
+    bus = EventBus()
+    with EventStreamServer(
+        bus, ("127.0.0.1", 0), max_client_queue=10, slow_client="disconnect"
+    ) as server:
+        stalled = socket.create_connection(server.address)
+        stalled.sendall(encode_frame({"subscribe": ["*"]}))
+        wait_for(
+            lambda: server.get_stats()["clients"] and server.get_stats()["clients"][0]["topics"]
+        )
+
+        for _ in range(20000):
+            bus.publish(Event("tick", data="x" * 1000))
+        wait_for(lambda: server.get_stats()["disconnected_slow"] == 1)
+        assert server.get_stats()["clients"] == []
+        stalled.close()
@@ -0,0 +1,44 @@
+"""
+Tests for the slotted core models.
+"""
+
+import copy
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+from carport_sdk import Event
+from carport_sdk.core.models import AlertData, VehicleState
+
+def test_models_have_no_instance_dict():
+    """Test models are slotted and reject unknown attributes."""
+    alert = AlertData("driver_attention", "warning", "Look ahead", "DriverMonitoringSimulator")
+    assert not hasattr(alert, "__dict__")
+    with pytest.raises(AttributeError):
+        alert.extra = True
+
+def test_timestamp_is_converted_lazily():
+    """Test the datetime timestamp is derived from the monotonic stamp."""
+    before = datetime.now()
+    event = Event("tick")
+    after = datetime.now()
+
+    assert isinstance(event.timestamp_ns, int)
+    slack = timedelta(milliseconds=5)
+    assert before - slack <= event.timestamp <= after + slack
+    assert event.timestamp is event.timestamp
+
+def test_explicit_timestamp_is_kept():
+    """Test a timestamp passed to the constructor is preserved."""
+    timestamp = datetime(2024, 1, 1, 12, 0)
+    state = VehicleState(speed=50.0, timestamp=timestamp)
+    assert state.timestamp == timestamp
+    assert Event("tick", timestamp=timestamp).timestamp_ns == state.timestamp_ns
+
+def test_models_copy_and_pickle():
+    """Test slotted models survive copying and pickling before and after conversion."""
+    event = Event("alert", data=AlertData("a", "info", "m", "s"), source="test")
+    assert pickle.loads(pickle.dumps(event)) == event
+    clone = copy.copy(event)
+    assert clone.timestamp_ns == event.timestamp_ns
+    assert clone.timestamp == event.timestamp
@@ -0,0 +1,47 @@
+"""
+Tests for hot-path profiling instrumentation.
+"""
+
+import json
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.core.profiling import LatencyHistogram
+
+def test_histogram_percentiles():
+    """Test percentiles stay within the histogram bucket resolution."""
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+
+    assert histogram.count == 1000
+    assert histogram.max_ns == 1_000_000
+    assert histogram.percentile(0.5) == pytest.approx(500_000, rel=0.25)
+    assert histogram.percentile(0.99) == pytest.approx(990_000, rel=0.25)
+
+def test_profiling_disabled_by_default():
+    """Test no profiling data is collected unless enabled."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    simulator.step(5)
+    assert simulator.get_status()["profiling"] is None
+
+def test_profiling_covers_ticks_updates_and_callbacks():
+    """Test enabled profiling records every instrumented hot path."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    profiler = simulator.enable_profiling()
+    simulator.event_bus.subscribe("driver_state_update", lambda event: None)
+
+    simulator.step(10)
+
+    stats = simulator.get_status()["profiling"]
+    latency = stats["latency"]
+    assert latency["tick"]["count"] == 10
+    assert latency["update:driver_monitoring"]["count"] == 10
+    assert latency["publish:vehicle_state_update"]["count"] == 10
+    assert any(key.startswith("callback:") for key in latency)
+    assert stats["counters"]["fanout:driver_state_update"] == 10
+
+    exported = json.loads(profiler.to_json())
+    assert exported["latency"]["tick"]["count"] == 10
+
+    simulator.disable_profiling()
+    assert simulator.get_status()["profiling"] is None
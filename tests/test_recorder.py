@@ -0,0 +1,53 @@
+"""
+Tests for binary session recording and replay.
+"""
+
+import pytest
+from carport_sdk import CarPortSimulator, EventBus, VirtualClock
+from carport_sdk.telemetry import SessionRecorder, SessionReplayer
+
+@pytest.fixture
+def session_log(tmp_path):
+    """Record a short driver-distraction session."""
+    path = tmp_path / "session.cpsess"
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=7)
+    with SessionRecorder(str(path), simulator.event_bus) as recorder:
+        simulator.set_vehicle_speed(80.0)
+        simulator.driver_monitoring.simulate_gaze_direction("away")
+        simulator.run_for(10.0)
+    history = simulator.event_bus.get_event_history()
+    assert recorder.recorded == len(history)
+    return path, history
+
+def test_replay_reproduces_event_stream(session_log):
+    """Test replaying a log re-publishes the recorded events in order."""
+    path, history = session_log
+    bus = EventBus()
+    alerts = []
+    bus.subscribe("alert", alerts.append)
+
+    count = SessionReplayer(str(path)).replay(bus, speed=None)
+
+    assert count == len(history)
+    replayed = bus.get_event_history()
+    assert [e.event_type for e in replayed] == [e.event_type for e in history]
+    assert [e.timestamp_ns for e in replayed] == [e.timestamp_ns for e in history]
+    assert [a.data.message for a in alerts] == [
+        e.data.message for e in history if e.event_type == "alert"
+    ]
+    states = [e.data for e in replayed if e.event_type == "vehicle_state_update"]
+    assert states == [e.data for e in history if e.event_type == "vehicle_state_update"]
+
+def test_replay_is_paced_by_speed(session_log):
+    """Test playback sleeps according to recorded simulation time."""
+    path, _ = session_log
+    clock = VirtualClock()
+    SessionReplayer(str(path)).replay(EventBus(), speed=10.0, clock=clock)
+    assert clock.now() == pytest.approx(1.0, abs=0.02)
+
+def test_truncated_log_is_readable(session_log):
+    """Test a log cut off mid-record is read up to the last complete record."""
+    path, history = session_log
+    data = path.read_bytes()
+    path.write_bytes(data[:-3])
+    assert len(list(SessionReplayer(str(path)))) == len(history) - 1
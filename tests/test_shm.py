@@ -0,0 +1,114 @@
+"""
+Tests for the shared-memory tick record ring.
+"""
+
+import multiprocessing
+
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.ipc import SharedMemoryBridge, SharedMemoryReader
+from carport_sdk.ipc.shm import MAX_ALERTS, decode_string
+
+@pytest.fixture
+def bridge():
+    """Attach a small ring to a virtual-clock simulator."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=4)
+    with SharedMemoryBridge(capacity=32) as bridge:
+        bridge.attach(simulator)
+        bridge.simulator = simulator
+        yield bridge
+
+def read_speeds(name, count, results):
+    """Read records in a separate process until `count` were seen."""
+    with SharedMemoryReader(name) as reader:
+        seq = 0
+        speeds = []
+        while seq < count:
+            records, seq = reader.read_since(seq)
+            speeds.extend(float(speed) for speed in records["speed"])
+        results.put((seq, len(speeds) + reader.lost))
+
+def test_one_record_per_tick(bridge):
+    """Test each tick writes a record with the simulator state."""
+    simulator = bridge.simulator
+    simulator.set_vehicle_speed(42.0)
+    simulator.obstacle_detection.set_confidence_threshold(0.0)
+    simulator.obstacle_detection.simulate_pedestrian(12.0)
+    simulator.driver_monitoring.simulate_gaze_away(6.0)
+    simulator.run_for(1.0)
+
+    with SharedMemoryReader(bridge.name) as reader:
+        records, seq = reader.read_since(0)
+        assert seq == simulator._tick_count == len(records)
+        assert list(records["seq"]) == list(range(1, seq + 1))
+
+        latest = reader.latest()
+        assert latest["speed"] == simulator.vehicle_state.speed
+        assert decode_string(latest["gaze_direction"]) == "away"
+        assert latest["obstacle_count"] == 1
+        assert decode_string(latest["obstacles"][0]["object_type"]) == "pedestrian"
+        alerts = [
+            alert for record in records for alert in record["alerts"][: record["alert_count"]]
+        ]
+        assert any(decode_string(alert["alert_type"]) == "driver_attention" for alert in alerts)
+
+def test_reader_reports_overwritten_records(bridge):
+    """Test records overwritten before being read are counted as lost."""
+    bridge.simulator.run_for(10.0)  # 100 ticks into a ring of 32
+
+    with SharedMemoryReader(bridge.name) as reader:
+        records, seq = reader.read_since(0)
+        assert seq == 100
+        assert len(records) == 32
+        assert reader.lost == 68
+        assert records["seq"][0] == 69
+        # Every slot was written three or four times, two version steps each
+        assert set(reader.records["version"]) == {6, 8}
+
+def test_alerts_beyond_capacity_are_dropped(bridge):
+    """Test alerts that do not fit one record are counted, not written."""
+    for _ in range(MAX_ALERTS + 3):
+        bridge.simulator.regulatory_mode.attempt_feature_activation("hands_free_driving")
+    bridge.simulator.step()
+
+    with SharedMemoryReader(bridge.name) as reader:
+        latest = reader.latest()
+    assert latest["alert_count"] == MAX_ALERTS
+    assert latest["alerts_dropped"] == bridge.get_stats()["alerts_dropped"] > 0
+
+def test_close_is_idempotent():
+    """Test a closed bridge can be closed again and still unlinked."""
+    bridge = SharedMemoryBridge(capacity=4)
+    bridge.close()
+    bridge.close()
+    bridge.unlink()
+    with pytest.raises(FileNotFoundError):
+        SharedMemoryReader(bridge.name)
+
+def test_reader_in_other_process(bridge):
+    """Test a separate process reads the records written by the simulator."""
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=read_speeds, args=(bridge.name, 20, results))
+    process.start()
+
+    bridge.simulator.set_vehicle_speed(25.0)
+    while process.is_alive() and results.empty():
+        bridge.simulator.step()
+    seq, accounted = results.get(timeout=10.0)
+    process.join(timeout=10.0)
+
+    assert seq >= 20
+    assert accounted == seq
+
+def test_rejects_foreign_blocks():
+    """Test the reader refuses shared memory that is not a tick ring."""
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(create=True, size=4096)
+    try:
+        with pytest.raises(ValueError):
+            SharedMemoryReader(block.name)
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,56 @@
+"""
+Tests for simulator snapshot and restore.
+"""
+
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+
+@pytest.fixture
+def cruising_simulator():
+    """Create a virtual-clock simulator after a shared highway prefix."""
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=42)
+    simulator.speed_limiting.set_speed_zone("highway")
+    simulator.set_vehicle_speed(100.0)
+    simulator.run_for(30.0)
+    return simulator
+
+def run_pedestrian_variant(simulator):
+    simulator.obstacle_detection.simulate_pedestrian(40.0)
+    simulator.run_for(5.0)
+    return simulator.get_status()
+
+def test_restore_branches_from_shared_prefix(cruising_simulator):
+    """Test several variants can branch from one snapshot."""
+    snapshot = cruising_simulator.snapshot()
+    alert_count = len(cruising_simulator.get_alerts())
+
+    first = run_pedestrian_variant(cruising_simulator)
+    first_obstacles = cruising_simulator.obstacle_detection.get_detected_obstacles()
+
+    cruising_simulator.restore(snapshot)
+    assert cruising_simulator.clock.now() == pytest.approx(30.0)
+    assert len(cruising_simulator.get_alerts()) == alert_count
+    assert not cruising_simulator.obstacle_detection.get_detected_obstacles()
+
+    second = run_pedestrian_variant(cruising_simulator)
+    second_obstacles = cruising_simulator.obstacle_detection.get_detected_obstacles()
+
+    assert second["vehicle_state"].speed == first["vehicle_state"].speed
+    assert [o.bearing for o in second_obstacles] == [o.bearing for o in first_obstacles]
+    assert [o.distance for o in second_obstacles] == [o.distance for o in first_obstacles]
+
+def test_snapshot_is_isolated_from_live_state(cruising_simulator):
+    """Test mutating the simulator after a snapshot leaves the snapshot intact."""
+    snapshot = cruising_simulator.snapshot()
+
+    cruising_simulator.set_vehicle_position(48.1, 11.6)
+    cruising_simulator.driver_monitoring.simulate_gaze_away(20.0)
+    cruising_simulator.regulatory_mode.simulate_border_crossing("US", "EU")
+    cruising_simulator.ota_updates.start_update("2.0.0", "sha256:abc123def456")
+
+    cruising_simulator.restore(snapshot)
+
+    assert cruising_simulator.vehicle_state.position == {"lat": 0.0, "lon": 0.0}
+    assert cruising_simulator.driver_monitoring.get_status()["alert_level"] == 0
+    assert cruising_simulator.regulatory_mode.get_current_region().code == "US"
+    assert cruising_simulator.ota_updates.get_status()["status"] == "idle"
@@ -0,0 +1,91 @@
+"""
+Tests for the memory-mapped telemetry store.
+"""
+
+import numpy as np
+import pytest
+from carport_sdk import CarPortSimulator, VirtualClock
+from carport_sdk.telemetry import TelemetryStore
+
+@pytest.fixture
+def store_dir(tmp_path):
+    """Record a 10-minute run into a store with a small index interval."""
+    directory = tmp_path / "store"
+    simulator = CarPortSimulator(clock=VirtualClock(), seed=11)
+    simulator.event_bus.configure_history(max_events=100)
+    store = TelemetryStore(str(directory), mode="w", index_interval=64, chunk_size=256)
+    store.attach(simulator.event_bus)
+
+    simulator.set_vehicle_speed(60.0)
+    simulator.run_for(300.0)
+    simulator.obstacle_detection.simulate_pedestrian(25.0)
+    simulator.driver_monitoring.simulate_gaze_direction("away")
+    simulator.run_for(300.0)
+
+    store.close()
+    return directory
+
+def test_window_matches_full_scan(store_dir):
+    """Test indexed window lookup returns exactly the records in range."""
+    store = TelemetryStore(str(store_dir))
+    vehicle = store.records("vehicle")
+    assert len(vehicle) == 6000
+
+    for t0, t1 in [(0.0, 0.05), (12.34, 56.78), (299.95, 300.25), (590.0, 700.0), (800.0, 900.0)]:
+        window = store.window(t0, t1)
+        times = vehicle["sim_time"]
+        expected = vehicle[(times >= t0) & (times <= t1)]
+        np.testing.assert_array_equal(window.vehicle, expected)
+
+def test_window_is_zero_copy(store_dir):
+    """Test windows are read-only views of the memory-mapped file."""
+    window = TelemetryStore(str(store_dir)).window(100.0, 200.0)
+    assert isinstance(window.vehicle.base, np.memmap) or isinstance(window.vehicle, np.memmap)
+    assert not window.vehicle.flags.writeable
+
+def test_strings_are_coded(store_dir):
+    """Test string fields are stored as codes with a string table."""
+    store = TelemetryStore(str(store_dir))
+    window = store.window(300.0, 600.0)
+    assert len(window.obstacles) > 0
+    assert set(store.decode("object_type", window.obstacles["object_type"])) == {"pedestrian"}
+    assert "critical" in store.decode("severity", window.alerts["severity"])
+    assert set(store.decode("gaze_direction", window.driver["gaze_direction"])) == {"away"}
+
+def test_alert_messages_are_not_interned(tmp_path):
+    """Test free-text alert messages are stored in the record, not the string table."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    with TelemetryStore(str(tmp_path / "alerts"), mode="w") as store:
+        store.attach(simulator.event_bus)
+        for distance in (15.0, 12.0, 8.0):
+            simulator.obstacle_detection.simulate_pedestrian(distance, crossing=True)
+            simulator.run_for(0.5)
+
+    store = TelemetryStore(str(tmp_path / "alerts"))
+    messages = store.decode("message", store.records("alerts")["message"])
+    assert len(set(messages)) > 1
+    assert set(messages) == {alert.message for alert in simulator.get_alerts()}
+    assert store.strings("message") == []
+
+def test_live_window_while_writing(tmp_path):
+    """Test windows can be read while the store is still recording."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    with TelemetryStore(str(tmp_path / "live"), mode="w") as store:
+        store.attach(simulator.event_bus)
+        simulator.run_for(1.0)
+        assert len(store.window(0.0, 1.05).vehicle) == 10
+        simulator.run_for(1.0)
+        assert len(store.window(0.0, 2.05).vehicle) == 20
+
+def test_attach_can_exclude_persisted_types_from_history(tmp_path):
+    """Test persisted event types can be kept out of the bus history."""
+    simulator = CarPortSimulator(clock=VirtualClock())
+    simulator.event_bus.configure_history(max_events=500)
+    with TelemetryStore(str(tmp_path / "soak"), mode="w") as store:
+        store.attach(simulator.event_bus, exclude_from_history=True)
+        simulator.run_for(1.0)
+        assert len(store.window(0.0, 1.05).vehicle) == 10
+
+    history = simulator.event_bus._history
+    assert history.max_events == 500
+    assert simulator.event_bus.get_event_history("vehicle_state_update") == []
@@ -0,0 +1,67 @@
+"""
+Tests for the parameter sweep runner.
+"""
+
+import random
+import pytest
+from carport_sdk.core.sweep import ScenarioSweep, expand_grid, summarize
+
+def driver_attention_scenario(simulator, alert_threshold, gaze_away):
+    """TC-601.1 scenario: looking away past the threshold must alert."""
+    simulator.driver_monitoring.set_alert_threshold(alert_threshold)
+    simulator.driver_monitoring.simulate_gaze_direction("away")
+    simulator.run_for(gaze_away)
+    alerted = any(a.alert_type == "driver_attention" for a in simulator.get_alerts())
+    return {"passed": alerted == (gaze_away >= alert_threshold), "ticks": simulator._tick_count}
+
+def failing_scenario(simulator, value):
+    """Scenario that raises for testing error capture."""
+    raise RuntimeError(f"bad value {value}")
+
+def test_expand_grid():
+    """Test grid expansion covers every combination."""
+    combinations = expand_grid({"a": [1, 2], "b": ["x", "y", "z"]})
+    assert len(combinations) == 6
+    assert combinations[0] == {"a": 1, "b": "x"}
+
+def test_inline_sweep_records_results():
+    """Test inline sweeps produce reaction times and pass/fail per scenario."""
+    sweep = ScenarioSweep(
+        driver_attention_scenario,
+        {"alert_threshold": [2.0, 5.0], "gaze_away": [3.0, 7.0]},
+        workers=0,
+    )
+    results = sweep.run_all()
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert all(r.passed for r in results)
+    assert results[0].reaction_times["driver_attention"] == pytest.approx(2.0, abs=0.11)
+    assert results[0].metrics["ticks"] == 30
+
+def test_inline_sweep_leaves_global_random_state():
+    """Test inline sweeps do not reseed the caller's global RNG."""
+    random.seed(123)
+    state = random.getstate()
+    ScenarioSweep(
+        driver_attention_scenario, {"alert_threshold": [2.0], "gaze_away": [3.0]}, workers=0
+    ).run_all()
+    assert random.getstate() == state
+
+def test_process_pool_sweep_matches_inline():
+    """Test process-pool results match inline results for the same seed."""
+    grid = {"alert_threshold": [1.0, 3.0], "gaze_away": [2.0]}
+    inline = ScenarioSweep(driver_attention_scenario, grid, workers=0, base_seed=7).run_all()
+    pooled = ScenarioSweep(driver_attention_scenario, grid, workers=2, base_seed=7).run_all()
+
+    assert [(r.seed, r.passed, r.alert_counts) for r in pooled] == [
+        (r.seed, r.passed, r.alert_counts) for r in inline
+    ]
+
+def test_errors_are_captured():
+    """Test scenario exceptions become failed result records."""
+    results = ScenarioSweep(failing_scenario, {"value": [1]}, workers=0).run_all()
+
+    summary = summarize(results)
+    assert summary["failed"] == 1
+    assert summary["errors"] == 1
+    assert "bad value 1" in results[0].error